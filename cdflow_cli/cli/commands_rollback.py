@@ -445,6 +445,10 @@ def run_rollback_cli(config=None, logging_provider=None) -> int:
         else:
             print(f"Unhandled exception: {str(e)}")
         return 1
+    finally:
+        # Clean up logging if needed
+        if logging_provider:
+            logging_provider.shutdown()
 
 
 def main():
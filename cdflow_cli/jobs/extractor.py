@@ -160,6 +160,10 @@ class ImportLogExtractor:
             if not api_log_file:
                 raise FileNotFoundError("No current API log file found")
 
+            # The API log is still being written; push buffered records to disk first
+            if self.logging_provider and hasattr(self.logging_provider, "flush"):
+                self.logging_provider.flush()
+
             # Calculate extraction time window with buffers
             start_dt, end_dt = self._calculate_extraction_window(start_time, end_time)
 
@@ -284,7 +288,7 @@ class ImportLogExtractor:
         """Get full path to API log file."""
         try:
             # Use paths system for direct path resolution
-            return str(self.paths.logs / api_log_file)
+            return os.path.join(self.paths.logs, api_log_file)
         except Exception as e:
             logger.error(f"Error getting API log path: {str(e)}")
             # Last resort fallback
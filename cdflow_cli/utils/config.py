@@ -13,6 +13,26 @@ from typing import Dict, Any, Optional, List, Union
 
 logger = logging.getLogger(__name__)
 
+# Prefer the libyaml-backed loader when PyYAML was built with it; same safe
+# schema as yaml.safe_load, parsed in C.
+try:
+    from yaml import CSafeLoader as _YamlSafeLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlSafeLoader
+
+
+# Environment variables whose presence enables OAuth overrides from the environment
+_OAUTH_ENV_VARS = (
+    "NB_SLUG",
+    "NB_CLIENT_ID",
+    "NB_CLIENT_SECRET",
+    "NB_REDIRECT_URI",
+    "NB_CALLBACK_PORT",
+)
+
+# Storage provider types accepted by normalize_provider_config
+_SUPPORTED_PROVIDER_TYPES = frozenset({"local"})  # Add 's3', etc. as they're implemented
+
 
 class ConfigProvider:
     """
@@ -22,6 +42,20 @@ class ConfigProvider:
     Environment variables take precedence over YAML settings.
     """
 
+    __slots__ = (
+        "app_settings",
+        "import_settings",
+        "runtime_settings",
+        "_runtime_overrides",
+        "storage_settings",
+        "logging_settings",
+        "yaml_config",
+        "config_file_path",
+        "_deployment_hostname",
+        "_deployment_api_port",
+        "_cli_override",  # Set by the import command for --type/--file overrides
+    )
+
     @classmethod
     def get_section_mappings(cls) -> Dict[str, List[str]]:
         """
@@ -60,14 +94,20 @@ class ConfigProvider:
         Args:
             config_source: Path to a YAML configuration file or a configuration dictionary
         """
-        # Initialize all configuration scopes
+        # Initialize all configuration scopes. Scopes hold references to the
+        # section objects in yaml_config (storage is merged one level up), so
+        # the parsed tree is not duplicated; only these small top-level dicts are.
         self.app_settings = {}
         self.import_settings = {}
         self.runtime_settings = {}
+        self._runtime_overrides = None  # Lazily created by update_runtime_setting
         self.storage_settings = {}
         self.logging_settings = {}
         self.yaml_config = {}  # Ensure yaml_config is always initialized
         self.config_file_path = None  # Store original config file path for relative path resolution
+        # Public endpoint from the deployment section, resolved once at load time
+        self._deployment_hostname = "localhost"
+        self._deployment_api_port = 8000
 
         # Load from config source (YAML file or dictionary)
         if config_source:
@@ -141,20 +181,21 @@ class ConfigProvider:
 
     def load_from_env(self):
         """Load configuration from environment variables into appropriate scopes."""
+        env = os.environ  # Local alias avoids repeated global/attribute lookups
         logger.debug("Loading configuration from environment variables")
 
         # APP SETTINGS
-        if os.environ.get("NB_CONFIG_ENV"):
-            self.app_settings["environment"] = os.environ.get("NB_CONFIG_ENV")
+        if env.get("NB_CONFIG_ENV"):
+            self.app_settings["environment"] = env.get("NB_CONFIG_ENV")
 
         # Load OAuth settings from environment if available
         self._load_oauth_from_env()
         self._setup_dynamic_oauth_config()
 
         # IMPORT SETTINGS
-        if "IMPORT_SOURCE" in os.environ:
-            source = os.environ.get("IMPORT_SOURCE", "").lower()
-            input_file = os.environ.get("IMPORT_FILE", "")
+        if "IMPORT_SOURCE" in env:
+            source = env.get("IMPORT_SOURCE", "").lower()
+            input_file = env.get("IMPORT_FILE", "")
 
             if source == "canadahelps" and input_file:
                 self.import_settings["source_type"] = "canadahelps"
@@ -164,36 +205,36 @@ class ConfigProvider:
                 self.import_settings["input_file"] = input_file
 
         # RUNTIME SETTINGS
-        if "LOG_LEVEL" in os.environ:
-            self.runtime_settings["log_level"] = os.environ.get("LOG_LEVEL")
+        if "LOG_LEVEL" in env:
+            self.runtime_settings["log_level"] = env.get("LOG_LEVEL")
 
         # STORAGE SETTINGS - Path configuration only
         # Local storage base path override
-        base_path = os.environ.get("STORAGE_LOCAL_BASE_PATH")
+        base_path = env.get("STORAGE_LOCAL_BASE_PATH")
         if base_path:
             if "default" not in self.storage_settings:
                 self.storage_settings["default"] = {}
             self.storage_settings["default"]["base_path"] = base_path
 
         # LOGGING SETTINGS
-        logging_provider = os.environ.get("LOGGING_PROVIDER")
+        logging_provider = env.get("LOGGING_PROVIDER")
         if logging_provider:
             if "provider" not in self.logging_settings:
                 self.logging_settings["provider"] = logging_provider
 
-        log_directory = os.environ.get("LOG_DIRECTORY")
+        log_directory = env.get("LOG_DIRECTORY")
         if log_directory:
             if "settings" not in self.logging_settings:
                 self.logging_settings["settings"] = {}
             self.logging_settings["settings"]["directory"] = log_directory
 
-        log_level = os.environ.get("LOG_LEVEL")
+        log_level = env.get("LOG_LEVEL")
         if log_level:
             if "settings" not in self.logging_settings:
                 self.logging_settings["settings"] = {}
             self.logging_settings["settings"]["level"] = log_level
 
-        console_log_level = os.environ.get("CONSOLE_LOG_LEVEL")
+        console_log_level = env.get("CONSOLE_LOG_LEVEL")
         if console_log_level:
             if "settings" not in self.logging_settings:
                 self.logging_settings["settings"] = {}
@@ -201,17 +242,9 @@ class ConfigProvider:
 
     def _load_oauth_from_env(self):
         """Load OAuth configuration from environment variables."""
+        env = os.environ
         # Check if OAuth configuration is provided via environment variables
-        oauth_vars_present = any(
-            env_var in os.environ
-            for env_var in [
-                "NB_SLUG",
-                "NB_CLIENT_ID",
-                "NB_CLIENT_SECRET",
-                "NB_REDIRECT_URI",
-                "NB_CALLBACK_PORT",
-            ]
-        )
+        oauth_vars_present = any(env_var in env for env_var in _OAUTH_ENV_VARS)
 
         if oauth_vars_present:
             # Ensure nationbuilder dict exists in app_settings
@@ -219,26 +252,27 @@ class ConfigProvider:
                 self.app_settings["nationbuilder"] = {}
 
             # Always override with environment variables if present
-            if os.environ.get("NB_SLUG"):
-                self.app_settings["nationbuilder"]["slug"] = os.environ.get("NB_SLUG")
-                logger.debug(f"Using NB_SLUG from environment: {os.environ.get('NB_SLUG')}")
+            if env.get("NB_SLUG"):
+                self.app_settings["nationbuilder"]["slug"] = env.get("NB_SLUG")
+                logger.debug(f"Using NB_SLUG from environment: {env.get('NB_SLUG')}")
 
-            if os.environ.get("NB_CLIENT_ID"):
-                self.app_settings["nationbuilder"]["client_id"] = os.environ.get("NB_CLIENT_ID")
+            if env.get("NB_CLIENT_ID"):
+                self.app_settings["nationbuilder"]["client_id"] = env.get("NB_CLIENT_ID")
 
-            if os.environ.get("NB_CLIENT_SECRET"):
-                self.app_settings["nationbuilder"]["client_secret"] = os.environ.get(
+            if env.get("NB_CLIENT_SECRET"):
+                self.app_settings["nationbuilder"]["client_secret"] = env.get(
                     "NB_CLIENT_SECRET"
                 )
 
             # Only set config_name if provided
-            if os.environ.get("NB_CONFIG_NAME"):
-                self.app_settings["nationbuilder"]["config_name"] = os.environ.get("NB_CONFIG_NAME")
+            if env.get("NB_CONFIG_NAME"):
+                self.app_settings["nationbuilder"]["config_name"] = env.get("NB_CONFIG_NAME")
 
             logger.debug("Loaded OAuth configuration from environment variables")
 
     def _setup_dynamic_oauth_config(self):
         """Setup dynamic OAuth configuration from frontend config."""
+        env = os.environ
         logger.debug("Setting up dynamic OAuth configuration")
 
         # Ensure nationbuilder dict exists in app_settings
@@ -250,7 +284,7 @@ class ConfigProvider:
                 self.app_settings["api"] = {}
 
             # CORS Configuration
-            cors_origins = os.environ.get("CORS_ORIGINS")
+            cors_origins = env.get("CORS_ORIGINS")
             if cors_origins:
                 if "cors" not in self.app_settings["api"]:
                     self.app_settings["api"]["cors"] = {}
@@ -262,26 +296,26 @@ class ConfigProvider:
                 )
 
             # API Host/Port
-            if os.environ.get("API_HOST"):
-                self.app_settings["api"]["host"] = os.environ.get("API_HOST")
-            if os.environ.get("API_PORT"):
+            if env.get("API_HOST"):
+                self.app_settings["api"]["host"] = env.get("API_HOST")
+            if env.get("API_PORT"):
                 try:
-                    self.app_settings["api"]["port"] = int(os.environ.get("API_PORT"))
+                    self.app_settings["api"]["port"] = int(env.get("API_PORT"))
                 except ValueError:
-                    logger.warning(f"Invalid API_PORT value: {os.environ.get('API_PORT')}")
+                    logger.warning(f"Invalid API_PORT value: {env.get('API_PORT')}")
 
             # LOGO CONFIGURATION
             if "logos" not in self.app_settings:
                 self.app_settings["logos"] = {}
 
-            if os.environ.get("LOGOS_USE_CUSTOM"):
+            if env.get("LOGOS_USE_CUSTOM"):
                 self.app_settings["logos"]["use_custom"] = (
-                    os.environ.get("LOGOS_USE_CUSTOM").lower() == "true"
+                    env.get("LOGOS_USE_CUSTOM").lower() == "true"
                 )
-            if os.environ.get("LOGOS_CUSTOM_PATH"):
-                self.app_settings["logos"]["custom_path"] = os.environ.get("LOGOS_CUSTOM_PATH")
-            if os.environ.get("LOGOS_FALLBACK_PATH"):
-                self.app_settings["logos"]["fallback_path"] = os.environ.get("LOGOS_FALLBACK_PATH")
+            if env.get("LOGOS_CUSTOM_PATH"):
+                self.app_settings["logos"]["custom_path"] = env.get("LOGOS_CUSTOM_PATH")
+            if env.get("LOGOS_FALLBACK_PATH"):
+                self.app_settings["logos"]["fallback_path"] = env.get("LOGOS_FALLBACK_PATH")
 
             # STORAGE PATH CONFIGURATION
 
@@ -289,20 +323,20 @@ class ConfigProvider:
             if "logging" not in self.logging_settings:
                 self.logging_settings["logging"] = {}
 
-            logging_provider = os.environ.get("LOGGING_PROVIDER")
+            logging_provider = env.get("LOGGING_PROVIDER")
             if logging_provider:
                 self.logging_settings["logging"]["provider"] = logging_provider
                 logger.debug(f"Set logging provider from environment: {logging_provider}")
 
-            log_directory = os.environ.get("LOG_DIRECTORY")
+            log_directory = env.get("LOG_DIRECTORY")
             if log_directory:
                 self.logging_settings["logging"]["directory"] = log_directory
 
-            log_level = os.environ.get("LOG_LEVEL")
+            log_level = env.get("LOG_LEVEL")
             if log_level:
                 self.logging_settings["logging"]["level"] = log_level
 
-            console_log_level = os.environ.get("CONSOLE_LOG_LEVEL")
+            console_log_level = env.get("CONSOLE_LOG_LEVEL")
             if console_log_level:
                 self.logging_settings["logging"]["console_level"] = console_log_level
 
@@ -310,11 +344,11 @@ class ConfigProvider:
             if "runtime" not in self.runtime_settings:
                 self.runtime_settings["runtime"] = {}
 
-            runtime_log_level = os.environ.get("RUNTIME_LOG_LEVEL")
+            runtime_log_level = env.get("RUNTIME_LOG_LEVEL")
             if runtime_log_level:
                 self.runtime_settings["runtime"]["log_level"] = runtime_log_level
 
-            job_worker_threads = os.environ.get("JOB_WORKER_THREADS")
+            job_worker_threads = env.get("JOB_WORKER_THREADS")
             if job_worker_threads:
                 try:
                     self.runtime_settings["runtime"]["job_worker_threads"] = int(job_worker_threads)
@@ -322,14 +356,14 @@ class ConfigProvider:
                     logger.warning(f"Invalid JOB_WORKER_THREADS value: {job_worker_threads}")
 
             # OAUTH EXTENSIONS
-            nb_scope = os.environ.get("NB_SCOPE")
+            nb_scope = env.get("NB_SCOPE")
             if nb_scope:
                 if "nationbuilder" not in self.app_settings:
                     self.app_settings["nationbuilder"] = {}
                 self.app_settings["nationbuilder"]["scope"] = nb_scope
 
             # JWT Configuration
-            jwt_expiration = os.environ.get("JWT_EXPIRATION")
+            jwt_expiration = env.get("JWT_EXPIRATION")
             if jwt_expiration:
                 try:
                     if "api" not in self.app_settings:
@@ -338,7 +372,7 @@ class ConfigProvider:
                 except ValueError:
                     logger.warning(f"Invalid JWT_EXPIRATION value: {jwt_expiration}")
 
-            refresh_expiration = os.environ.get("REFRESH_EXPIRATION")
+            refresh_expiration = env.get("REFRESH_EXPIRATION")
             if refresh_expiration:
                 try:
                     if "api" not in self.app_settings:
@@ -359,17 +393,13 @@ class ConfigProvider:
         Returns:
             str: Resolved absolute path
         """
-        from pathlib import Path
-
-        path_obj = Path(path)
-        if path_obj.is_absolute():
+        if os.path.isabs(path):
             return path
 
         # If we have a config file path and the path is relative, resolve against config directory
-        if self.config_file_path:
-            config_dir = Path(self.config_file_path).parent
-            resolved_path = config_dir / path_obj
-            return str(resolved_path)
+        config_dir = self.get_config_directory()
+        if config_dir is not None:
+            return str(config_dir / path)
 
         # Fallback to current working directory
         return path
@@ -389,73 +419,73 @@ class ConfigProvider:
         """
         logger.debug(f"Loading configuration from YAML file: {path}")
         try:
-            with open(path, "r") as file:
-                yaml_config = yaml.safe_load(file)
-                self.yaml_config = yaml_config  # This line was missing.
-
-                if not yaml_config:
-                    logger.error(f"Empty or invalid YAML configuration in {path}")
-                    return
-
-                # Parse and distribute settings to appropriate scopes using data-driven approach
-
-                # Get section mappings from centralized definition
-                section_mappings = self.get_section_mappings()
-
-                # Process each section dynamically
-                for target_scope, section_names in section_mappings.items():
-                    target_dict = getattr(self, target_scope)
-                    for section_name in section_names:
-                        if section_name in yaml_config:
-                            # Special handling for storage section - merge contents instead of nesting
-                            if section_name == "storage" and target_scope == "storage_settings":
-                                target_dict.update(yaml_config[section_name])
-                                logger.debug(
-                                    f"Merged section '{section_name}' contents into {target_scope}"
-                                )
-                            else:
-                                target_dict[section_name] = yaml_config[section_name]
-                                logger.debug(f"Loaded section '{section_name}' into {target_scope}")
+            with open(path, "rb") as file:
+                yaml_config = yaml.load(file, Loader=_YamlSafeLoader)
+            self.yaml_config = yaml_config  # This line was missing.
+
+            if not yaml_config:
+                logger.error(f"Empty or invalid YAML configuration in {path}")
+                return
+
+            # Parse and distribute settings to appropriate scopes using data-driven approach
+
+            # Get section mappings from centralized definition
+            section_mappings = self.get_section_mappings()
+
+            # Process each section dynamically
+            for target_scope, section_names in section_mappings.items():
+                target_dict = getattr(self, target_scope)
+                for section_name in section_names:
+                    if section_name in yaml_config:
+                        # Special handling for storage section - merge contents instead of nesting
+                        if section_name == "storage" and target_scope == "storage_settings":
+                            target_dict.update(yaml_config[section_name])
+                            logger.debug(
+                                f"Merged section '{section_name}' contents into {target_scope}"
+                            )
+                        else:
+                            target_dict[section_name] = yaml_config[section_name]
+                            logger.debug(f"Loaded section '{section_name}' into {target_scope}")
 
-                # IMPORT SETTINGS - special handling for source type detection
-                # First check for new cli_import structure
-                if "cli_import" in yaml_config:
-                    cli_import = yaml_config["cli_import"]
+            # IMPORT SETTINGS - special handling for source type detection
+            # First check for new cli_import structure
+            if "cli_import" in yaml_config:
+                cli_import = yaml_config["cli_import"]
 
-                    # Store the complete cli_import configuration
-                    self.import_settings.update(cli_import)
+                # Store the complete cli_import configuration
+                self.import_settings.update(cli_import)
 
-                    source_type = cli_import.get("type")
-                    input_file = cli_import.get("file")
+                source_type = cli_import.get("type")
+                input_file = cli_import.get("file")
 
-                    if source_type and input_file:
-                        logger.debug(
-                            f"Loaded import settings from cli_import: type={source_type}, file={input_file}"
-                        )
+                if source_type and input_file:
+                    logger.debug(
+                        f"Loaded import settings from cli_import: type={source_type}, file={input_file}"
+                    )
 
-                    # Log additional cli_import settings
-                    if "job_cleanup" in cli_import:
-                        logger.debug(f"CLI job cleanup: {cli_import['job_cleanup']}")
-                # Fallback to old structure for backward compatibility
-                elif "canadahelps" in yaml_config and yaml_config.get("canadahelps"):
-                    input_file = yaml_config["canadahelps"].get("input_file")
-                    if input_file:
-                        self.import_settings["source_type"] = "canadahelps"
-                        self.import_settings["input_file"] = input_file
-                elif "paypal" in yaml_config and yaml_config.get("paypal"):
-                    input_file = yaml_config["paypal"].get("input_file")
-                    if input_file:
-                        self.import_settings["source_type"] = "paypal"
-                        self.import_settings["input_file"] = input_file
-
-                # STORAGE SETTINGS - process storage configuration
-                if "storage" in yaml_config:
-                    pass  # Storage settings handled by parent class
-
-                # DEPLOYMENT-AWARE PROCESSING - resolve "auto" values based on deployment type
-                self._apply_deployment_aware_settings(yaml_config)
-
-                logger.debug("Successfully loaded YAML configuration")
+                # Log additional cli_import settings
+                if "job_cleanup" in cli_import:
+                    logger.debug(f"CLI job cleanup: {cli_import['job_cleanup']}")
+            # Fallback to old structure for backward compatibility
+            elif "canadahelps" in yaml_config and yaml_config.get("canadahelps"):
+                input_file = yaml_config["canadahelps"].get("input_file")
+                if input_file:
+                    self.import_settings["source_type"] = "canadahelps"
+                    self.import_settings["input_file"] = input_file
+            elif "paypal" in yaml_config and yaml_config.get("paypal"):
+                input_file = yaml_config["paypal"].get("input_file")
+                if input_file:
+                    self.import_settings["source_type"] = "paypal"
+                    self.import_settings["input_file"] = input_file
+
+            # STORAGE SETTINGS - process storage configuration
+            if "storage" in yaml_config:
+                pass  # Storage settings handled by parent class
+
+            # DEPLOYMENT-AWARE PROCESSING - resolve "auto" values based on deployment type
+            self._apply_deployment_aware_settings(yaml_config)
+
+            logger.debug("Successfully loaded YAML configuration")
         except FileNotFoundError:
             logger.error(f"Configuration file not found: {path}")
         except yaml.YAMLError as e:
@@ -477,6 +507,10 @@ class ConfigProvider:
         # Respect the user's api_port setting for all deployment modes
         user_api_port = deployment_config.get("api_port", 8000)
 
+        # Remember the public endpoint for OAuth callback and API base URL generation
+        self._deployment_hostname = user_hostname
+        self._deployment_api_port = user_api_port
+
         logger.debug(
             f"Processing deployment-agnostic settings - pattern: {deployment_pattern}, hostname: {user_hostname}"
         )
@@ -530,17 +564,18 @@ class ConfigProvider:
         """
         Auto-detect deployment type based on environment variables and context.
         """
+        env = os.environ
         # Check environment variable first
-        env_deployment = os.environ.get("DEPLOYMENT_MODE", "").lower()
+        env_deployment = env.get("DEPLOYMENT_MODE", "").lower()
         if env_deployment in ["docker", "network", "local"]:
             return env_deployment
 
         # Check for Docker environment
-        if os.path.exists("/.dockerenv") or os.environ.get("KUBERNETES_SERVICE_HOST"):
+        if env.get("KUBERNETES_SERVICE_HOST") or os.path.exists("/.dockerenv"):
             return "docker"
 
         # Check for network deployment indicators
-        hostname = os.environ.get("HOSTNAME", "")
+        hostname = env.get("HOSTNAME", "")
         if hostname.endswith(".lan") or hostname.startswith("rpi-"):
             return "network"
 
@@ -726,11 +761,8 @@ class ConfigProvider:
             
             # Auto-generate redirect_uri if not provided
             if "redirect_uri" not in oauth_config or not oauth_config["redirect_uri"]:
-                deployment_config = self.yaml_config.get("deployment", {})
-                user_hostname = deployment_config.get("hostname", "localhost")
-                user_api_port = deployment_config.get("api_port", 8000)
-                
-                callback_url = f"http://{user_hostname}:{user_api_port}/callback"
+                user_api_port = self._deployment_api_port
+                callback_url = f"http://{self._deployment_hostname}:{user_api_port}/callback"
                 oauth_config["redirect_uri"] = callback_url
                 oauth_config["callback_port"] = user_api_port
                 
@@ -773,10 +805,7 @@ class ConfigProvider:
             return f"http://{public_hostname}:{port}"
 
         # The public hostname must come from the deployment section.
-        deployment_config = self.yaml_config.get("deployment", {})
-        public_hostname = deployment_config.get("hostname", "localhost")
-
-        return f"http://{public_hostname}:{port}"
+        return f"http://{self._deployment_hostname}:{port}"
 
     def get_frontend_config(self):
         """
@@ -848,6 +877,11 @@ class ConfigProvider:
         Returns:
             bool: True if the configuration is valid, False if there are errors
         """
+        # No storage section at all: StoragePaths falls back to its defaults
+        if not self.storage_settings:
+            logger.debug("No storage configuration provided, default paths will be used")
+            return True
+
         valid = True
 
         # Check if we have paths configuration
@@ -932,19 +966,29 @@ class ConfigProvider:
         Returns:
             Setting value or default
         """
+        overrides = self._runtime_overrides
         if key is None:
+            if overrides:
+                return {**self.runtime_settings, **overrides}
             return self.runtime_settings
+        if overrides and key in overrides:
+            return overrides[key]
         return self.runtime_settings.get(key, default)
 
     def update_runtime_setting(self, key: str, value: Any) -> None:
         """
         Update a runtime behavior setting.
 
+        Updates are kept in a separate overrides layer so the loaded configuration
+        (which may share section objects with the source) is never written to.
+
         Args:
             key: Setting key
             value: New setting value
         """
-        self.runtime_settings[key] = value
+        if self._runtime_overrides is None:
+            self._runtime_overrides = {}
+        self._runtime_overrides[key] = value
         logger.debug(f"Updated runtime setting: {key} = {value}")
 
     def get_cleanup_config(self, default: Dict[str, Any] = None) -> Dict[str, Any]:
@@ -1034,8 +1078,7 @@ class ConfigProvider:
                 logger.warning("No provider type specified, defaulting to 'local'")
 
         # Validate the provider type (only local is fully supported for now)
-        valid_types = ["local"]  # Add 's3', etc. as they're implemented
-        if normalized["type"] not in valid_types:
+        if normalized["type"] not in _SUPPORTED_PROVIDER_TYPES:
             logger.warning(
                 f"Unsupported provider type '{normalized['type']}', defaulting to 'local'"
             )
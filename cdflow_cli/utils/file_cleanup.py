@@ -9,13 +9,116 @@ to remove hidden/problematic characters that can cause import issues.
 """
 
 import logging
+import os
+import re
+import shutil
+import tempfile
+from collections import Counter
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Tuple, Dict, Any
+from typing import Optional, Tuple, Dict, Any, NamedTuple, Pattern
 import uneff
-from .file_utils import safe_read_text_file as _safe_read_text_file
+from .file_utils import detect_text_encoding as _detect_text_encoding
 
 logger = logging.getLogger(__name__)
 
+# Characters read per chunk when cleaning files, bounding peak memory
+_CLEANUP_CHUNK_SIZE = 1 << 20
+
+
+class _UneffMappings(NamedTuple):
+    """uneff's default character mappings compiled for single-pass scanning."""
+
+    table: Dict[int, str]
+    names: Dict[str, str]
+    pattern: Pattern[str]
+
+
+@lru_cache(maxsize=1)
+def _uneff_mappings() -> _UneffMappings:
+    """
+    Compile uneff's default mappings into a str.translate table, a char -> name
+    lookup for reporting, and a character-class regex matching any mapped char.
+    """
+    mappings = uneff.parse_mapping_csv(uneff.get_default_mappings_csv())
+    table = {ord(char): replacement for char, _name, replacement in mappings}
+    names = {char: name for char, name, _replacement in mappings}
+    chars = "".join(re.escape(char) for char in names)
+    return _UneffMappings(table, names, re.compile(f"[{chars}]"))
+
+
+@lru_cache(maxsize=1)
+def _problematic_chars_pattern() -> Optional[Pattern[str]]:
+    """
+    Return a regex matching every character uneff's default mappings would
+    remove or replace, or None if the mappings cannot be loaded.
+    """
+    try:
+        return _uneff_mappings().pattern
+    except Exception as e:
+        logger.debug(f"Could not build uneff pre-scan pattern: {e}")
+        return None
+
+
+def _clean_with_uneff_mappings(content: str) -> Tuple[str, Dict[str, int]]:
+    """
+    Apply uneff's default mappings to content.
+
+    Produces the same (cleaned_content, char_counts) as uneff.clean_content, but
+    with one regex scan for the counts and one str.translate pass for the
+    replacements instead of a count and replace pass per mapped character.
+    """
+    mappings = _uneff_mappings()
+    found = Counter(mappings.pattern.findall(content))
+    if not found:
+        return content, {}
+
+    # Report counts in mapping order, keyed by name, as uneff does
+    char_counts = {name: found[char] for char, name in mappings.names.items() if char in found}
+    return content.translate(mappings.table), char_counts
+
+
+def _may_need_cleaning(content: str) -> bool:
+    """Return False only when the pre-scan proves uneff would leave content unchanged."""
+    pattern = _problematic_chars_pattern()
+    return pattern is None or pattern.search(content) is not None
+
+
+def _write_all(fd: int, data: bytes) -> None:
+    """
+    Hand an encoded buffer to the OS in as few write calls as possible,
+    bypassing a buffered text wrapper.
+    """
+    view = memoryview(data)
+    # os.write may return a short count; loop until the buffer is drained
+    while view:
+        written = os.write(fd, view)
+        view = view[written:]
+
+
+def _clean_file_stream(
+    input_path: Path, encoding: str, errors: str, out_fd: int
+) -> Dict[str, int]:
+    """
+    Clean input_path chunk by chunk, writing UTF-8 output to out_fd.
+
+    Every uneff mapping is a single character, so chunks can be cleaned
+    independently; the text layer handles multi-byte and CRLF boundaries.
+
+    Returns:
+        dict: Count of cleaned characters keyed by uneff character name
+    """
+    char_counts: Counter = Counter()
+    with open(input_path, "r", encoding=encoding, errors=errors) as src:
+        while True:
+            chunk = src.read(_CLEANUP_CHUNK_SIZE)
+            if not chunk:
+                break
+            cleaned_chunk, chunk_counts = _clean_with_uneff_mappings(chunk)
+            char_counts.update(chunk_counts)
+            _write_all(out_fd, cleaned_chunk.encode("utf-8"))
+    return dict(char_counts)
+
 
 class FileCleanupError(Exception):
     """Exception raised when file cleanup operations fail."""
@@ -37,6 +140,14 @@ def clean_csv_content_with_uneff(content: str, filename: str = "input.csv") -> T
             - was_modified: True if content was modified, False if unchanged
     """
     try:
+        # Fast path: a single C-level scan proves the content is already clean,
+        # so skip uneff's per-character count/replace passes entirely
+        if not _may_need_cleaning(content):
+            logger.debug(
+                f"🧹 File checked with uneff: {filename} (no problematic characters found)"
+            )
+            return content, False
+
         # Use uneff's direct API to clean the content
         cleaned_content, char_counts = uneff.clean_content(content)
 
@@ -49,7 +160,9 @@ def clean_csv_content_with_uneff(content: str, filename: str = "input.csv") -> T
             logger.info(
                 f"🧹 File cleaned with uneff: {filename} ({total_chars_cleaned} problematic characters removed/replaced)"
             )
-            logger.debug(f"🧹 Character cleanup details for {filename}: {char_counts}")
+            # Skip formatting the per-character dict unless debug output is on
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"🧹 Character cleanup details for {filename}: {char_counts}")
         else:
             logger.debug(
                 f"🧹 File checked with uneff: {filename} (no problematic characters found)"
@@ -83,19 +196,34 @@ def clean_csv_file_with_uneff(
     # If no output path specified, modify in place
     if output_path is None:
         output_path = input_path
+    in_place = output_path.exists() and os.path.samefile(input_path, output_path)
 
+    partial_output = None
     try:
-        # Read original content
-        original_content = _safe_read_text_file(input_path)
-
-        # Clean using uneff's direct API
-        cleaned_content, char_counts = uneff.clean_content(original_content)
-
-        # Write cleaned content to output
-        output_path.write_text(cleaned_content, encoding="utf-8")
+        encoding, errors = _detect_text_encoding(input_path, _CLEANUP_CHUNK_SIZE)
+        # Fail before touching the output if uneff's mappings cannot be loaded
+        _uneff_mappings()
+
+        if in_place:
+            # The input is still being read while cleaned text is produced, so
+            # stream into an anonymous temp file, then copy it back into the
+            # input; rewriting the same file keeps its hard links, owner and mode
+            with tempfile.TemporaryFile() as scratch:
+                char_counts = _clean_file_stream(input_path, encoding, errors, scratch.fileno())
+                scratch.seek(0)
+                with open(output_path, "wb") as dst:
+                    shutil.copyfileobj(scratch, dst, _CLEANUP_CHUNK_SIZE)
+        else:
+            out_fd = os.open(output_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+            partial_output = output_path
+            try:
+                char_counts = _clean_file_stream(input_path, encoding, errors, out_fd)
+            finally:
+                os.close(out_fd)
+            partial_output = None
 
-        # Check if content was modified
-        was_modified = original_content != cleaned_content
+        # Any mapped character found means the content changed
+        was_modified = bool(char_counts)
 
         if was_modified:
             total_chars_cleaned = sum(char_counts.values()) if char_counts else 0
@@ -111,6 +239,39 @@ def clean_csv_file_with_uneff(
         logger.error(f"Error cleaning {input_path.name} with uneff: {str(e)}")
         raise FileCleanupError(f"Cleanup failed for {input_path.name}: {str(e)}")
 
+    finally:
+        # Do not leave a half-written output file behind
+        if partial_output is not None:
+            try:
+                os.unlink(partial_output)
+            except OSError:
+                pass
+
+
+@lru_cache(maxsize=1)
+def _cleanup_stats() -> Tuple[Tuple[str, Any], ...]:
+    """
+    Compute the cleanup statistics once; the uneff module cannot change within
+    a process. Returned as a tuple of items so the cached value stays immutable.
+    """
+    try:
+        tool_version = uneff.__version__
+    except AttributeError:
+        tool_version = "unknown"
+
+    try:
+        uneff.get_default_mappings_csv
+        default_mappings_available = True
+    except AttributeError:
+        default_mappings_available = False
+
+    return (
+        ("uneff_available", True),
+        ("cleanup_enabled", True),  # Could be configurable later
+        ("tool_version", tool_version),
+        ("default_mappings_available", default_mappings_available),
+    )
+
 
 def get_cleanup_stats() -> Dict[str, Any]:
     """
@@ -119,14 +280,7 @@ def get_cleanup_stats() -> Dict[str, Any]:
     Returns:
         dict: Statistics about cleanup capabilities
     """
-    stats = {
-        "uneff_available": True,
-        "cleanup_enabled": True,  # Could be configurable later
-        "tool_version": getattr(uneff, "__version__", "unknown"),
-        "default_mappings_available": hasattr(uneff, "get_default_mappings_csv"),
-    }
-
-    return stats
+    return dict(_cleanup_stats())
 
 
 def analyze_csv_content(content: str, filename: str = "input.csv") -> Dict[str, Any]:
@@ -148,9 +302,18 @@ def analyze_csv_content(content: str, filename: str = "input.csv") -> Dict[str,
             "uneff_available": True,
             "analysis_performed": True,
             "filename": filename,
-            "problematic_chars_found": len(analysis.get("issues", [])) > 0,
+            "problematic_chars_found": _analysis_has_issues(analysis),
             "analysis_details": analysis,
         }
 
     except Exception as e:
         return {"uneff_available": True, "analysis_performed": False, "error": str(e)}
+
+
+def _analysis_has_issues(analysis: Dict[str, Any]) -> bool:
+    """Check an uneff analysis result for problematic characters."""
+    # uneff reports a total count; older result shapes list individual issues
+    if analysis.get("problematic_char_count", 0) > 0:
+        return True
+    return len(analysis.get("issues", [])) > 0
+
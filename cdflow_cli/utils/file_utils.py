@@ -8,14 +8,65 @@ This module provides helper functions for normalizing file content, including
 decoding to UTF-8, removing BOM, and re-encoding to UTF-8.
 """
 
+import codecs
 import logging
-import chardet
+import os
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple
+
+try:
+    # C-backed detector with the same detect() API, installed by the "fast" extra
+    import cchardet as chardet
+except ImportError:
+    import chardet
 
 # Initialize module-level logger
 logger = logging.getLogger(__name__)
 
+# Bytes handed to the encoding detector; detection cost is bounded by this,
+# not by the file size
+_ENCODING_SAMPLE_SIZE = 10000
+
+# Encodings tried, in order, when detection fails or is not confident
+_FALLBACK_ENCODINGS = ("utf-8", "windows-1252", "iso-8859-1")
+
+# Byte order marks and the codecs that decode (and strip) them; UTF-32 comes
+# first because its little-endian BOM starts with the UTF-16 one
+_BOM_ENCODINGS = (
+    (codecs.BOM_UTF32_LE, "utf-32"),
+    (codecs.BOM_UTF32_BE, "utf-32"),
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+)
+
+# Every byte except ASCII 0-9, for stripping phone numbers with bytes.translate
+_NON_DIGIT_BYTES = bytes(b for b in range(256) if not 0x30 <= b <= 0x39)
+
+
+def _decode_text(data: bytes, encoding: str, errors: str = "strict") -> str:
+    """
+    Decode file bytes the way Path.read_text would, including its universal
+    newline translation (CRLF and lone CR become LF).
+    """
+    text = data.decode(encoding, errors)
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+def _sniff_encoding(sample: bytes) -> Optional[str]:
+    """
+    Return the encoding implied by a BOM or by pure-ASCII content, or None when
+    the sample needs statistical detection.
+    """
+    for bom, encoding in _BOM_ENCODINGS:
+        if sample.startswith(bom):
+            return encoding
+    if sample.isascii():
+        return "utf-8"
+    return None
+
 
 def safe_read_text_file(file_path: Path) -> str:
     """
@@ -27,31 +78,101 @@ def safe_read_text_file(file_path: Path) -> str:
     Returns:
         str: File content
     """
+    # Read once; detection and every fallback decode work on the same bytes
+    data = file_path.read_bytes()
+
+    sample = data[:_ENCODING_SAMPLE_SIZE]
     try:
-        # Try automatic encoding detection first
-        with open(file_path, "rb") as f:
-            sample = f.read(10000)
-        result = chardet.detect(sample)
-        encoding = result.get("encoding")
-        confidence = result.get("confidence", 0.0)
-
-        if encoding and confidence > 0.7:
+        # BOM-prefixed and ASCII files need no statistical detection
+        encoding = _sniff_encoding(sample)
+        if encoding is None:
+            # Try automatic encoding detection first
+            result = chardet.detect(sample)
+            encoding = result.get("encoding")
+            # cchardet reports None rather than 0.0 when it cannot decide
+            if (result.get("confidence") or 0.0) <= 0.7:
+                encoding = None
+
+        if encoding:
             try:
-                return file_path.read_text(encoding=encoding)
+                return _decode_text(data, encoding)
             except UnicodeDecodeError:
                 pass
     except Exception:
         pass
 
     # Try common encodings as fallbacks
-    for fallback_encoding in ["utf-8", "windows-1252", "iso-8859-1"]:
+    for fallback_encoding in _FALLBACK_ENCODINGS:
         try:
-            return file_path.read_text(encoding=fallback_encoding)
+            return _decode_text(data, fallback_encoding)
         except UnicodeDecodeError:
             continue
 
     # Final fallback with error replacement
-    return file_path.read_text(encoding="utf-8", errors="replace")
+    return _decode_text(data, "utf-8", errors="replace")
+
+
+def detect_text_encoding(file_path: Path, chunk_size: int = 1 << 20) -> Tuple[str, str]:
+    """
+    Pick the encoding safe_read_text_file would use for a file, without holding
+    the whole file in memory.
+
+    Each candidate is validated by decoding the file in chunks with an
+    incremental decoder, so callers can then stream the file as text. Files
+    that fit in the detection sample are validated from the sample alone.
+
+    Args:
+        file_path: Path to the file to inspect
+        chunk_size: Number of bytes to decode per read while validating
+
+    Returns:
+        Tuple[str, str]: (encoding, errors) to pass to open()
+    """
+    candidates = []
+    whole_file = None
+    try:
+        # One open/read pair on a raw fd; no file object is needed for the sample
+        fd = os.open(file_path, os.O_RDONLY)
+        try:
+            sample = os.read(fd, _ENCODING_SAMPLE_SIZE)
+            if os.fstat(fd).st_size <= len(sample):
+                whole_file = sample
+        finally:
+            os.close(fd)
+        encoding = _sniff_encoding(sample)
+        if encoding is None:
+            result = chardet.detect(sample)
+            encoding = result.get("encoding")
+            if (result.get("confidence") or 0.0) <= 0.7:
+                encoding = None
+        if encoding:
+            candidates.append(encoding)
+    except Exception:
+        pass
+
+    # Same fallbacks, in the same order, as safe_read_text_file
+    candidates.extend(_FALLBACK_ENCODINGS)
+
+    for encoding in candidates:
+        try:
+            if whole_file is not None:
+                whole_file.decode(encoding)
+                return encoding, "strict"
+            decoder = codecs.getincrementaldecoder(encoding)()
+            # Reads are already chunk_size; a buffered layer would only add a copy
+            with open(file_path, "rb", buffering=0) as f:
+                while True:
+                    chunk = f.read(chunk_size)
+                    if not chunk:
+                        break
+                    decoder.decode(chunk)
+            decoder.decode(b"", final=True)
+            return encoding, "strict"
+        except (LookupError, UnicodeDecodeError):
+            continue
+
+    # Final fallback with error replacement
+    return "utf-8", "replace"
 
 
 def normalize_file_content(content: bytes, encoding: Optional[str] = None) -> bytes:
@@ -66,6 +187,17 @@ def normalize_file_content(content: bytes, encoding: Optional[str] = None) -> by
         bytes: Normalized file content re-encoded to UTF-8.
     """
     try:
+        if encoding is None:
+            # Pure-ASCII content (after dropping a UTF-8 BOM) is already valid
+            # UTF-8, so it can be normalized without a decode/encode round-trip
+            stripped = content[3:] if content.startswith(codecs.BOM_UTF8) else content
+            if stripped.isascii():
+                if b"\x00" in stripped:
+                    logger.debug("Removing null bytes from file content.")
+                    stripped = stripped.replace(b"\x00", b"")
+                logger.debug("File content normalized using encoding: utf-8-sig")
+                return stripped
+
         # Default to 'utf-8-sig' to handle BOM automatically
         encoding = encoding or "utf-8-sig"
 
@@ -98,8 +230,13 @@ def cleaned_phone(dirty_phone):
     Returns:
         str: Cleaned phone number
     """
-    # Remove all non-numeric characters from the phone number
-    cleaned_phone = "".join(filter(str.isdigit, dirty_phone))
+    # Remove all non-numeric characters from the phone number; ASCII input
+    # takes a bytes.translate fast path, anything else keeps every character
+    # str.isdigit accepts, including full-width and other script digits
+    if dirty_phone.isascii():
+        cleaned_phone = dirty_phone.encode("ascii").translate(None, _NON_DIGIT_BYTES).decode("ascii")
+    else:
+        cleaned_phone = "".join(filter(str.isdigit, dirty_phone))
 
     # Remove leading zeroes if present
     cleaned_phone = cleaned_phone.lstrip("0")
@@ -10,10 +10,16 @@ allowing the application to work with different logging backends
 circular dependencies with the storage subsystem.
 """
 
+import collections
 import os
 import logging
+import logging.handlers
+import queue
+import threading
+import time
+import weakref
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple, Union
 from datetime import datetime
 from pathlib import Path
 
@@ -32,6 +38,87 @@ def notice(self, message, *args, **kwargs):
 logging.Logger.notice = notice
 
 
+class SecondCachedFormatter(logging.Formatter):
+    """
+    Formatter that renders the date and time part of asctime once per second.
+
+    logging.Formatter.formatTime calls localtime() and strftime() for every
+    record. Records logged within the same second share that text, so this
+    formatter caches it and only appends the milliseconds per record.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # (second, datefmt, formatted text); replaced as a whole, so a reader on
+        # another thread never sees a mismatched pair
+        self._time_cache = (None, None, "")
+
+    def formatTime(self, record, datefmt=None):
+        """Return the creation time of a record, reusing the text for its second."""
+        second = int(record.created)
+        cached_second, cached_datefmt, text = self._time_cache
+        if second != cached_second or datefmt != cached_datefmt:
+            text = time.strftime(datefmt or self.default_time_format, self.converter(second))
+            self._time_cache = (second, datefmt, text)
+        if datefmt:
+            return text
+        return self.default_msec_format % (text, record.msecs)
+
+
+# Formatters shared by every provider and handler. Formatters keep no
+# per-handler state, so one parsed instance of each format is enough.
+_FILE_FORMATTER = SecondCachedFormatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+_CONSOLE_FORMATTER = logging.Formatter("%(levelname)s - %(message)s")
+
+
+# Import log directory resolved per logging provider by ImportLoggingContext
+_import_log_dirs = weakref.WeakKeyDictionary()
+
+
+def _resolve_import_log_dir(logging_provider) -> Tuple[Union[Path, str], bool]:
+    """
+    Resolve the directory for import logs, probing the paths system only once
+    per logging provider.
+
+    Returns:
+        Tuple of (directory, whether it comes from the paths system)
+    """
+    try:
+        return _import_log_dirs[logging_provider]
+    except (KeyError, TypeError):
+        pass
+
+    from .paths import get_paths, is_initialized
+
+    if is_initialized():
+        resolved = (get_paths().logs, True)
+    else:
+        # Fallback to direct file operations in logs directory
+        resolved = (os.path.join(".", "storage_server", "logs"), False)
+
+    try:
+        _import_log_dirs[logging_provider] = resolved
+    except TypeError:
+        pass  # Provider cannot be weakly referenced; probe again next time
+    return resolved
+
+
+def _forget_import_log_dir(logging_provider) -> None:
+    """Drop the import log directory cached for a logging provider."""
+    try:
+        _import_log_dirs.pop(logging_provider, None)
+    except TypeError:
+        pass
+
+
+def _handler_target(handler: logging.Handler) -> Optional[str]:
+    """Return the absolute path a file-writing handler writes to, if any."""
+    target = getattr(handler, "baseFilename", None)
+    if target is None and isinstance(handler, PathsFileHandler):
+        target = os.path.abspath(handler.log_path)
+    return target
+
+
 class ImportLoggingContext:
     """
     Context manager for isolated import operation logging.
@@ -63,35 +150,25 @@ class ImportLoggingContext:
         """
         # Create import-specific handler using paths system
         try:
-            # Try to get paths system for direct path operations
-            from .paths import get_paths, is_initialized
+            # The paths system is probed once per logging provider
+            import_log_dir, use_paths = _resolve_import_log_dir(self.logging_provider)
 
-            if is_initialized():
-                paths = get_paths()
-                import_log_path = paths.logs / self.import_log_filename
+            if use_paths:
+                import_log_path = import_log_dir / self.import_log_filename
 
                 # Create import-specific handler using PathsFileHandler
-                file_formatter = logging.Formatter(
-                    "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-                )
                 self.import_handler = PathsFileHandler(import_log_path)
                 self.import_handler.setLevel(logging.DEBUG)
-                self.import_handler.setFormatter(file_formatter)
+                self.import_handler.setFormatter(_FILE_FORMATTER)
             else:
                 # Fallback to direct file operations in logs directory
-                import os
-
-                logs_dir = os.path.join(".", "storage_server", "logs")
-                os.makedirs(logs_dir, exist_ok=True)
-                import_log_path = os.path.join(logs_dir, self.import_log_filename)
+                os.makedirs(import_log_dir, exist_ok=True)
+                import_log_path = os.path.join(import_log_dir, self.import_log_filename)
 
                 # Create import-specific handler using standard FileHandler
-                file_formatter = logging.Formatter(
-                    "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-                )
                 self.import_handler = logging.FileHandler(import_log_path, mode="a")
                 self.import_handler.setLevel(logging.DEBUG)
-                self.import_handler.setFormatter(file_formatter)
+                self.import_handler.setFormatter(_FILE_FORMATTER)
 
             # Create a separate root logger for import operations
             self.import_root_logger = logging.getLogger("IMPORT_OPERATION")
@@ -187,7 +264,10 @@ class ImportLoggingContext:
         if self.import_root_logger:
             # Create child logger under the import root
             import_logger = logging.getLogger(f"IMPORT_OPERATION.{name}")
-            import_logger.setLevel(logging.DEBUG)
+            # setLevel() clears every logger's isEnabledFor cache, so only call it
+            # when the level actually changes
+            if import_logger.level != logging.DEBUG:
+                import_logger.setLevel(logging.DEBUG)
             import_logger.propagate = True  # Propagate to import root logger
             return import_logger
         else:
@@ -287,6 +367,38 @@ class LoggingProvider(ABC):
         """
         pass
 
+    @staticmethod
+    def _flush_handler(handler: logging.Handler) -> None:
+        """Flush one handler, reporting failures the way logging does."""
+        try:
+            handler.flush()
+        except Exception as e:
+            print(f"Warning: Could not flush log handler: {str(e)}")
+
+    def _clear_root_handlers(self) -> None:
+        """
+        Flush, close and detach every root handler.
+
+        Buffering file handlers hold records in memory, so each one is written
+        out and its file closed before it is dropped.
+        """
+        handlers = self.root_logger.handlers[:]
+        # Write out every buffered log before any handler is closed
+        for handler in handlers:
+            self._flush_handler(handler)
+        for handler in handlers:
+            self.root_logger.removeHandler(handler)
+            handler.close()
+
+    def flush(self) -> None:
+        """
+        Write any buffered log records out to their files.
+
+        Call this before reading a log file that is still being written to.
+        """
+        for handler in logging.getLogger().handlers[:]:
+            handler.flush()
+
 
 class UnifiedLoggingProvider(LoggingProvider):
     """
@@ -297,7 +409,14 @@ class UnifiedLoggingProvider(LoggingProvider):
     """
 
     def __init__(
-        self, file_level: str = "DEBUG", console_level: str = "INFO", base_path: str = "./logs"
+        self,
+        file_level: str = "DEBUG",
+        console_level: str = "INFO",
+        base_path: str = "./logs",
+        buffer_size: int = 65536,
+        flush_interval: Optional[float] = None,
+        async_logging: bool = False,
+        ring_size: int = 0,
     ):
         """
         Initialize the unified logging provider.
@@ -306,10 +425,24 @@ class UnifiedLoggingProvider(LoggingProvider):
             file_level (str): File logging level or "NONE" to disable file logging
             console_level (str): Console logging level or "NONE" to disable console logging
             base_path (str): Base path for log files
+            buffer_size (int): Write buffer size in bytes for log files
+            flush_interval (float, optional): Seconds between background flushes of
+                buffered log files; None flushes only on shutdown or flush()
+            async_logging (bool): Hand file records to a background thread through a
+                queue instead of formatting and writing them on the logging thread;
+                records still queued are only written once shutdown() runs
+            ring_size (int): When above 0, only NOTICE and higher records are written
+                to the log file as they happen; the last ring_size lower records are
+                kept in memory and appended to the log file on shutdown
         """
         self.file_level = file_level.upper() if file_level else "NONE"
         self.console_level = console_level.upper() if console_level else "NONE"
         self.base_path = base_path
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+        self.async_logging = async_logging
+        self.ring_size = ring_size
+        self._listener = None
 
         self.log_file_path = None
         self.root_logger = logging.getLogger()
@@ -331,6 +464,9 @@ class UnifiedLoggingProvider(LoggingProvider):
             module_logger = logging.getLogger(__name__)
             module_logger.debug(f"Paths system not available, using base_path: {self.base_path}")
 
+        # Log file paths are joined onto this once-resolved base directory
+        self._base = Path(self.base_path)
+
         # Only create log directory if file logging is enabled
         if self.file_level != "NONE":
             self._ensure_log_directory()
@@ -349,10 +485,6 @@ class UnifiedLoggingProvider(LoggingProvider):
         Configure logging with optional console and file handlers based on levels.
         """
 
-        # Set up formatters
-        console_formatter = logging.Formatter("%(levelname)s - %(message)s")
-        file_formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
-
         # Configure root logger to most permissive level
         effective_level = logging.DEBUG
         if self.file_level != "NONE":
@@ -368,9 +500,10 @@ class UnifiedLoggingProvider(LoggingProvider):
 
         self.root_logger.setLevel(effective_level)
 
-        # Clear existing handlers
-        for handler in self.root_logger.handlers[:]:
-            self.root_logger.removeHandler(handler)
+        # Clear existing handlers; buffered records and in-memory rings are
+        # written out to their log files rather than dropped
+        self._stop_listener()
+        self._clear_root_handlers()
 
         # Add console handler if enabled
         if self.console_level != "NONE":
@@ -380,58 +513,140 @@ class UnifiedLoggingProvider(LoggingProvider):
                 console_handler.setLevel(NOTICE_LEVEL)
             else:
                 console_handler.setLevel(getattr(logging, self.console_level, logging.INFO))
-            console_handler.setFormatter(console_formatter)
+            console_handler.setFormatter(_CONSOLE_FORMATTER)
             self.root_logger.addHandler(console_handler)
 
         # Add file handler if enabled and filename provided
         if self.file_level != "NONE" and log_filename:
-            return self._add_file_handler(log_filename, file_formatter, early_init)
+            return self._add_file_handler(log_filename, early_init)
 
         return None
 
-    def _add_file_handler(
-        self, log_filename: str, file_formatter, early_init: bool
-    ) -> Optional[str]:
+    def _add_file_handler(self, log_filename: str, early_init: bool) -> Optional[str]:
         """Add file handler using paths system or storage provider."""
         # Try paths system first
         if self.paths:
             log_path = self.paths.logs / log_filename
-            file_handler = PathsFileHandler(log_path)
-            file_handler.setLevel(getattr(logging, self.file_level, logging.DEBUG))
-            file_handler.setFormatter(file_formatter)
-            self.root_logger.addHandler(file_handler)
+            file_handler = PathsFileHandler(
+                log_path, buffer_size=self.buffer_size, flush_interval=self.flush_interval
+            )
+            file_handler.setLevel(self._file_handler_level())
+            file_handler.setFormatter(_FILE_FORMATTER)
+            self._attach_file_handler(file_handler)
+            if self._uses_ring():
+                self._attach_ring_handler(log_path)
 
             self.log_file_path = str(log_path)
 
             return str(log_path) if early_init else None
 
         # Use direct file operations
-        log_path = os.path.join(self.base_path, os.path.basename(log_filename))
-        os.makedirs(
-            os.path.dirname(log_path) if os.path.dirname(log_path) else self.base_path,
-            exist_ok=True,
-        )
+        log_path = str(self._base / os.path.basename(log_filename))
+        self._ensure_log_directory()
 
-        file_handler = logging.FileHandler(log_path, mode="a")
-        file_handler.setLevel(getattr(logging, self.file_level, logging.DEBUG))
-        file_handler.setFormatter(file_formatter)
-        self.root_logger.addHandler(file_handler)
+        file_handler = BufferedFileHandler(
+            log_path, buffer_size=self.buffer_size, flush_interval=self.flush_interval
+        )
+        file_handler.setLevel(self._file_handler_level())
+        file_handler.setFormatter(_FILE_FORMATTER)
+        self._attach_file_handler(file_handler)
+        if self._uses_ring():
+            self._attach_ring_handler(log_path)
 
         self.log_file_path = log_path
 
         return log_path if early_init else None
 
+    def _file_handler_level(self) -> int:
+        """Level for the application file handler."""
+        if self._uses_ring():
+            return NOTICE_LEVEL
+        return getattr(logging, self.file_level, logging.DEBUG)
+
+    def _uses_ring(self) -> bool:
+        """Whether records below NOTICE go to a RingHandler instead of the file."""
+        return self.ring_size > 0 and (
+            getattr(logging, self.file_level, logging.DEBUG) < NOTICE_LEVEL
+        )
+
+    def _attach_ring_handler(self, log_path: Union[Path, str]) -> None:
+        """
+        Keep the most recent records below NOTICE in memory.
+
+        The RingHandler sits directly on the root logger, so these records
+        cost a deque append; it appends them to log_path when closed.
+        """
+        ring_handler = RingHandler(self.ring_size, dump_path=log_path)
+        ring_handler.setLevel(getattr(logging, self.file_level, logging.DEBUG))
+        ring_handler.addFilter(lambda record: record.levelno < NOTICE_LEVEL)
+        ring_handler.setFormatter(_FILE_FORMATTER)
+        self.root_logger.addHandler(ring_handler)
+
+    def _attach_file_handler(self, file_handler: logging.Handler) -> None:
+        """
+        Attach the application file handler to the root logger.
+
+        With async_logging the root logger only gets a QueueHandler; a
+        QueueListener thread formats records and passes them to file_handler.
+        """
+        if not self.async_logging:
+            self._add_root_handler(file_handler)
+            return
+
+        self._stop_listener()
+        log_queue = queue.Queue(-1)
+        self._listener = logging.handlers.QueueListener(
+            log_queue, file_handler, respect_handler_level=True
+        )
+        self._listener.start()
+        self.root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+
+    def _add_root_handler(self, handler: logging.Handler) -> None:
+        """
+        Add a handler to the root logger, replacing any handler that already
+        writes to the same file so records are not written to it twice.
+        """
+        target = _handler_target(handler)
+        if target is not None:
+            for existing in self.root_logger.handlers[:]:
+                if _handler_target(existing) == target:
+                    self.root_logger.removeHandler(existing)
+                    existing.close()
+        self.root_logger.addHandler(handler)
+
+    def _stop_listener(self) -> None:
+        """Drain and stop the background listener and close its file handler."""
+        if self._listener is None:
+            return
+        self._listener.stop()
+        for handler in self._listener.handlers:
+            handler.close()
+        self._listener = None
+
+    def flush(self) -> None:
+        """Write queued and buffered log records out to their files."""
+        if self._listener is not None:
+            # stop() returns once the queue is drained; restart for later records
+            self._listener.stop()
+            self._listener.start()
+            for handler in self._listener.handlers:
+                handler.flush()
+        super().flush()
+
     def get_logger(self, name: str) -> logging.Logger:
         """Get a logger with the specified name."""
-        if name not in self.loggers:
-            self.loggers[name] = logging.getLogger(name)
-        return self.loggers[name]
+        # Cached loggers cost one dict lookup; only misses reach the logging
+        # manager and its module-level lock
+        logger = self.loggers.get(name)
+        if logger is None:
+            logger = self.loggers[name] = logging.getLogger(name)
+        return logger
 
     def shutdown(self) -> None:
         """Perform cleanup operations."""
-        for handler in self.root_logger.handlers[:]:
-            handler.close()
-            self.root_logger.removeHandler(handler)
+        self._stop_listener()
+        self._clear_root_handlers()
+        _forget_import_log_dir(self)
 
     def initialize_bootstrap_logging(self) -> str:
         """Initialize bootstrap logging."""
@@ -442,7 +657,7 @@ class UnifiedLoggingProvider(LoggingProvider):
         bootstrap_log_filename = f"BOOTSTRAP_{timestamp}.log"
         self._ensure_log_directory()
 
-        bootstrap_log_path = os.path.join(self.base_path, bootstrap_log_filename)
+        bootstrap_log_path = str(self._base / bootstrap_log_filename)
 
         # Configure with both console and file (if enabled)
         self.configure_logging(log_filename=bootstrap_log_filename, early_init=True)
@@ -454,6 +669,9 @@ class UnifiedLoggingProvider(LoggingProvider):
         if self.file_level == "NONE":
             return app_log_path
 
+        # Make sure buffered bootstrap records are on disk before copying them
+        self.flush()
+
         # Read bootstrap content if it exists
         bootstrap_content = ""
         if os.path.exists(bootstrap_log_path):
@@ -497,29 +715,31 @@ class UnifiedLoggingProvider(LoggingProvider):
                 operation_log_path.write_text("--- OPERATION LOG START ---\n", encoding="utf-8")
 
                 # Add operation handler using PathsFileHandler
-                file_formatter = logging.Formatter(
-                    "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+                operation_handler = PathsFileHandler(
+                    operation_log_path,
+                    buffer_size=self.buffer_size,
+                    flush_interval=self.flush_interval,
                 )
-                operation_handler = PathsFileHandler(operation_log_path)
                 operation_handler.setLevel(getattr(logging, self.file_level, logging.DEBUG))
-                operation_handler.setFormatter(file_formatter)
-                self.root_logger.addHandler(operation_handler)
+                operation_handler.setFormatter(_FILE_FORMATTER)
+                self._add_root_handler(operation_handler)
 
                 return str(operation_log_path)
             else:
                 # Use direct file operations
-                operation_log_path = os.path.join(self.base_path, operation_log_filename)
+                operation_log_path = str(self._base / operation_log_filename)
                 with open(operation_log_path, "w", encoding="utf-8") as f:
                     f.write("--- OPERATION LOG START ---\n")
 
-                # Add operation handler using standard FileHandler
-                file_formatter = logging.Formatter(
-                    "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+                # Add operation handler using a buffered file handler
+                operation_handler = BufferedFileHandler(
+                    operation_log_path,
+                    buffer_size=self.buffer_size,
+                    flush_interval=self.flush_interval,
                 )
-                operation_handler = logging.FileHandler(operation_log_path, mode="a")
                 operation_handler.setLevel(getattr(logging, self.file_level, logging.DEBUG))
-                operation_handler.setFormatter(file_formatter)
-                self.root_logger.addHandler(operation_handler)
+                operation_handler.setFormatter(_FILE_FORMATTER)
+                self._add_root_handler(operation_handler)
 
                 return operation_log_path
         except Exception as e:
@@ -540,15 +760,33 @@ class FileLoggingProvider(LoggingProvider):
     Logging provider implementation using file-based logging.
     """
 
-    def __init__(self, base_path: str = "./logs", console_level: str = "INFO"):
+    def __init__(
+        self,
+        base_path: str = "./logs",
+        console_level: str = "INFO",
+        buffer_size: int = 65536,
+        flush_interval: Optional[float] = None,
+        max_bytes: int = 0,
+        backup_count: int = 5,
+    ):
         """
         Initialize the file logging provider.
 
         Args:
             base_path (str): Base path for log files
             console_level (str): Logging level for console output
+            buffer_size (int): Write buffer size in bytes for log files
+            flush_interval (float, optional): Seconds between background flushes of
+                buffered log files; None flushes only on shutdown or flush()
+            max_bytes (int): Roll the application log over once it reaches this
+                size; 0 disables rotation
+            backup_count (int): Number of rotated application logs to keep
         """
         self.base_path = base_path
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
 
         self.console_level = console_level
         self.current_log_file = None
@@ -598,17 +836,11 @@ class FileLoggingProvider(LoggingProvider):
         """
 
 
-        # Set up formatters
-        console_formatter = logging.Formatter("%(levelname)s - %(message)s")
-        file_formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
-
         # Configure root logger
         self.root_logger.setLevel(getattr(logging, log_level.upper(), logging.DEBUG))
 
         # Clear existing handlers to avoid duplicates
-        for handler in self.root_logger.handlers[:]:
-            pass  # Remove handler without debug output
-            self.root_logger.removeHandler(handler)
+        self._clear_root_handlers()
 
         # Console handler
         console_handler = logging.StreamHandler()
@@ -619,7 +851,7 @@ class FileLoggingProvider(LoggingProvider):
             else getattr(logging, self.console_level.upper(), logging.INFO)
         )
         console_handler.setLevel(console_level_value)
-        console_handler.setFormatter(console_formatter)
+        console_handler.setFormatter(_CONSOLE_FORMATTER)
         self.root_logger.addHandler(console_handler)
 
         # For early initialization, create a timestamp-based log file if none is provided
@@ -636,9 +868,11 @@ class FileLoggingProvider(LoggingProvider):
                     log_path = self.paths.logs / log_filename
 
                     # Create and add the paths file handler
-                    file_handler = PathsFileHandler(log_path)
+                    file_handler = PathsFileHandler(
+                        log_path, buffer_size=self.buffer_size, flush_interval=self.flush_interval
+                    )
                     file_handler.setLevel(getattr(logging, log_level.upper(), logging.DEBUG))
-                    file_handler.setFormatter(file_formatter)
+                    file_handler.setFormatter(_FILE_FORMATTER)
                     self.root_logger.addHandler(file_handler)
 
                     self.log_file_path = str(log_path)
@@ -650,12 +884,24 @@ class FileLoggingProvider(LoggingProvider):
 
                     # Create directory if needed
                     log_dir = os.path.dirname(log_path)
-                    if log_dir and not os.path.exists(log_dir):
+                    if log_dir:
                         os.makedirs(log_dir, exist_ok=True)
 
-                    file_handler = logging.FileHandler(log_path, mode="a")
+                    if self.max_bytes:
+                        file_handler = SizeCappedFileHandler(
+                            log_path,
+                            maxBytes=self.max_bytes,
+                            backupCount=self.backup_count,
+                            encoding="utf-8",
+                        )
+                    else:
+                        file_handler = BufferedFileHandler(
+                            log_path,
+                            buffer_size=self.buffer_size,
+                            flush_interval=self.flush_interval,
+                        )
                     file_handler.setLevel(getattr(logging, log_level.upper(), logging.DEBUG))
-                    file_handler.setFormatter(file_formatter)
+                    file_handler.setFormatter(_FILE_FORMATTER)
                     self.root_logger.addHandler(file_handler)
 
                     self.log_file_path = log_path
@@ -701,9 +947,8 @@ class FileLoggingProvider(LoggingProvider):
         """
         Perform cleanup operations (close handlers, etc.)
         """
-        for handler in self.root_logger.handlers[:]:
-            handler.close()
-            self.root_logger.removeHandler(handler)
+        self._clear_root_handlers()
+        _forget_import_log_dir(self)
 
     def initialize_bootstrap_logging(self) -> str:
         """
@@ -726,16 +971,11 @@ class FileLoggingProvider(LoggingProvider):
             else bootstrap_log_filename
         )
 
-        # Set up formatters
-        console_formatter = logging.Formatter("%(levelname)s - %(message)s")
-        file_formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
-
         # Configure root logger
         self.root_logger.setLevel(logging.DEBUG)
 
         # Clear existing handlers to avoid duplicates
-        for handler in self.root_logger.handlers[:]:
-            self.root_logger.removeHandler(handler)
+        self._clear_root_handlers()
 
         # Console handler
         console_handler = logging.StreamHandler()
@@ -746,15 +986,19 @@ class FileLoggingProvider(LoggingProvider):
             else getattr(logging, self.console_level.upper(), logging.INFO)
         )
         console_handler.setLevel(console_level_value)
-        console_handler.setFormatter(console_formatter)
+        console_handler.setFormatter(_CONSOLE_FORMATTER)
         self.root_logger.addHandler(console_handler)
 
         # File handler
         try:
             # Create bootstrap log file
-            file_handler = logging.FileHandler(bootstrap_log_path, mode="a")
+            file_handler = BufferedFileHandler(
+                bootstrap_log_path,
+                buffer_size=self.buffer_size,
+                flush_interval=self.flush_interval,
+            )
             file_handler.setLevel(logging.DEBUG)
-            file_handler.setFormatter(file_formatter)
+            file_handler.setFormatter(_FILE_FORMATTER)
             self.root_logger.addHandler(file_handler)
 
             self.log_file_path = bootstrap_log_path
@@ -806,7 +1050,9 @@ class FileLoggingProvider(LoggingProvider):
             f"Transitioning from bootstrap log ({bootstrap_log_path}) to application log ({app_log_path})"
         )
 
-        # 1. Read bootstrap content (using direct file ops is acceptable since it's still bootstrap)
+        # 1. Read bootstrap content (using direct file ops is acceptable since it's still bootstrap),
+        # after flushing any records still sitting in the file handler's buffer
+        self.flush()
         bootstrap_content = ""
         if os.path.exists(bootstrap_log_path):
             with open(bootstrap_log_path, "r", encoding="utf-8") as bootstrap_file:
@@ -888,12 +1134,13 @@ class FileLoggingProvider(LoggingProvider):
                 operation_log_path.write_text("--- OPERATION LOG START ---\n", encoding="utf-8")
 
                 # Add operation handler using PathsFileHandler
-                file_formatter = logging.Formatter(
-                    "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+                operation_handler = PathsFileHandler(
+                    operation_log_path,
+                    buffer_size=self.buffer_size,
+                    flush_interval=self.flush_interval,
                 )
-                operation_handler = PathsFileHandler(operation_log_path)
                 operation_handler.setLevel(logging.DEBUG)
-                operation_handler.setFormatter(file_formatter)
+                operation_handler.setFormatter(_FILE_FORMATTER)
                 self.root_logger.addHandler(operation_handler)
 
                 self.root_logger.info(f"Operation logging initialized: {operation_log_filename}")
@@ -904,13 +1151,14 @@ class FileLoggingProvider(LoggingProvider):
                 with open(operation_log_path, "w", encoding="utf-8") as f:
                     f.write("--- OPERATION LOG START ---\n")
 
-                # Add operation handler using standard FileHandler
-                file_formatter = logging.Formatter(
-                    "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+                # Add operation handler using a buffered file handler
+                operation_handler = BufferedFileHandler(
+                    operation_log_path,
+                    buffer_size=self.buffer_size,
+                    flush_interval=self.flush_interval,
                 )
-                operation_handler = logging.FileHandler(operation_log_path, mode="a")
                 operation_handler.setLevel(logging.DEBUG)
-                operation_handler.setFormatter(file_formatter)
+                operation_handler.setFormatter(_FILE_FORMATTER)
                 self.root_logger.addHandler(operation_handler)
 
                 self.root_logger.info(f"Operation logging initialized: {operation_log_filename}")
@@ -964,15 +1212,11 @@ class ConsoleLoggingProvider(LoggingProvider):
         Returns:
             None
         """
-        # Set up formatter
-        console_formatter = logging.Formatter("%(levelname)s - %(message)s")
-
         # Configure root logger
         self.root_logger.setLevel(getattr(logging, log_level.upper(), logging.DEBUG))
 
         # Clear existing handlers to avoid duplicates
-        for handler in self.root_logger.handlers[:]:
-            self.root_logger.removeHandler(handler)
+        self._clear_root_handlers()
 
         # Console handler
         console_handler = logging.StreamHandler()
@@ -983,7 +1227,7 @@ class ConsoleLoggingProvider(LoggingProvider):
             else getattr(logging, self.console_level.upper(), logging.INFO)
         )
         console_handler.setLevel(console_level_value)
-        console_handler.setFormatter(console_formatter)
+        console_handler.setFormatter(_CONSOLE_FORMATTER)
         self.root_logger.addHandler(console_handler)
 
         # Set up specific loggers for packages we want to monitor
@@ -1021,9 +1265,8 @@ class ConsoleLoggingProvider(LoggingProvider):
         """
         Perform cleanup operations (close handlers, etc.)
         """
-        for handler in self.root_logger.handlers[:]:
-            handler.close()
-            self.root_logger.removeHandler(handler)
+        self._clear_root_handlers()
+        _forget_import_log_dir(self)
 
     def initialize_bootstrap_logging(self) -> str:
         """
@@ -1050,30 +1293,132 @@ class ConsoleLoggingProvider(LoggingProvider):
         return None
 
 
+class RingHandler(logging.Handler):
+    """
+    Handler that keeps only the most recent records in memory.
+
+    Emitting a record just appends it to a bounded deque, so no formatting or
+    I/O happens on the logging path. When the handler is closed, by a
+    provider shutdown or by logging.shutdown() at interpreter exit, the
+    retained records are formatted and appended to dump_path in one write.
+    """
+
+    def __init__(self, capacity: int = 4096, dump_path: Optional[Union[Path, str]] = None):
+        """
+        Initialize the ring handler.
+
+        Args:
+            capacity: Number of most recent records to keep
+            dump_path: File the retained records are appended to on close,
+                or None to discard them
+        """
+        super().__init__()
+        self.buffer = collections.deque(maxlen=capacity)
+        self.dump_path = dump_path
+
+    def emit(self, record):
+        """Keep the record, dropping the oldest one if the ring is full."""
+        self.buffer.append(record)
+
+    def dump(self) -> None:
+        """Append the retained records to dump_path and empty the ring."""
+        if not self.buffer or self.dump_path is None:
+            return
+        lines = [f"--- {len(self.buffer)} most recent records kept in memory ---"]
+        lines.extend(self.format(record) for record in self.buffer)
+        self.buffer.clear()
+        try:
+            with open(self.dump_path, "a", encoding="utf-8") as f:
+                f.write("\n".join(lines) + "\n")
+        except OSError as e:
+            print(f"Warning: Could not write in-memory log records: {str(e)}")
+
+    def close(self):
+        """Dump the retained records and close the handler."""
+        with self.lock:
+            try:
+                self.dump()
+            finally:
+                super().close()
+
+
 class PathsFileHandler(logging.Handler):
     """
     A modern logging handler that writes log messages directly to filesystem paths.
 
     Provides optimal performance and reliability by using direct Path operations
     with built-in safety features and directory creation.
+
+    The log file is created when the handler is. Formatted records are
+    collected in an in-memory buffer and written to an append-mode file
+    descriptor with os.write() once buffer_size bytes have accumulated, as
+    soon as a NOTICE or higher record arrives, on flush() and close(), and
+    optionally every flush_interval seconds from a background timer.
     """
 
-    def __init__(self, log_path: Path, mode="a"):
+    def __init__(
+        self,
+        log_path: Path,
+        mode="a",
+        buffer_size: int = 65536,
+        flush_interval: Optional[float] = None,
+    ):
         """
         Initialize the paths file handler.
 
         Args:
             log_path: Path object for the log file location
-            mode: File open mode (default 'a' for append)
+            mode: File open mode (default 'a' for append; 'w' truncates the file)
+            buffer_size: Bytes of formatted records to collect before writing
+            flush_interval: Seconds between background flushes, or None to
+                flush only when the buffer fills, on NOTICE and higher records,
+                or on flush()/close()
         """
         super().__init__()
         self.log_path = log_path
         self.mode = mode
+        self.buffer_size = buffer_size
         # Flag to prevent recursive logging
         self.is_handling = False
+        self._buffer = bytearray()
+        self._fd = None
+        self._truncate = "w" in mode
 
         # Ensure parent directory exists
         self.log_path.parent.mkdir(parents=True, exist_ok=True)
+        self._open()
+
+        self.flush_interval = flush_interval
+        self._flush_timer = None
+        if flush_interval:
+            self._schedule_flush()
+
+    def _open(self) -> None:
+        """Open the log file descriptor, truncating only on the first open in mode 'w'."""
+        flags = os.O_WRONLY | os.O_CREAT | os.O_APPEND
+        if self._truncate:
+            flags |= os.O_TRUNC
+        try:
+            self._fd = os.open(self.log_path, flags, 0o644)
+        except FileNotFoundError:
+            # Directory was removed after it was ensured
+            self.log_path.parent.mkdir(parents=True, exist_ok=True)
+            self._fd = os.open(self.log_path, flags, 0o644)
+        self._truncate = False
+
+    def _schedule_flush(self) -> None:
+        """Arm the background timer for the next periodic flush."""
+        self._flush_timer = threading.Timer(self.flush_interval, self._periodic_flush)
+        self._flush_timer.daemon = True
+        self._flush_timer.start()
+
+    def _periodic_flush(self) -> None:
+        """Flush from the timer thread and re-arm until the handler is closed."""
+        with self.lock:
+            if self._flush_timer is None:
+                return
+            self._write_buffer()
+            self._schedule_flush()
 
     def emit(self, record):
         """Emit a log record by writing to the file path."""
@@ -1092,23 +1437,164 @@ class PathsFileHandler(logging.Handler):
         try:
             self.is_handling = True
             msg = self.format(record)
+            self._buffer += (msg + "\n").encode("utf-8")
+            if len(self._buffer) >= self.buffer_size or record.levelno >= NOTICE_LEVEL:
+                self._write_buffer()
 
-            # Use direct Path operations
-            # Ensure parent directory exists
-            self.log_path.parent.mkdir(parents=True, exist_ok=True)
+        except Exception:
+            self.handleError(record)
+        finally:
+            self.is_handling = False
 
-            if self.log_path.exists():
-                # Append to existing file
-                with self.log_path.open("a", encoding="utf-8") as f:
-                    f.write(msg + "\n")
-            else:
-                # Create new file
-                self.log_path.write_text(msg + "\n", encoding="utf-8")
+    def _write_buffer(self) -> None:
+        """Write all buffered bytes to the log file, opening it if needed."""
+        if not self._buffer:
+            return
+        if self._fd is None:
+            self._open()
+        written = 0
+        with memoryview(self._buffer) as view:
+            while written < len(view):
+                written += os.write(self._fd, view[written:])
+        self._buffer.clear()
+
+    def flush(self):
+        """Write buffered records to the log file."""
+        with self.lock:
+            self._write_buffer()
+
+    def close(self):
+        """Stop the flush timer, flush buffered records and close the file descriptor."""
+        with self.lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            try:
+                self._write_buffer()
+            finally:
+                if self._fd is not None:
+                    os.close(self._fd)
+                    self._fd = None
+                super().close()
+
+
+class BufferedFileHandler(logging.StreamHandler):
+    """
+    A file handler that leaves flushing to the file object's write buffer.
+
+    logging.FileHandler flushes after every record, costing one write() per
+    line. This handler lets records accumulate in a buffer of buffer_size bytes
+    and writes them out when the buffer fills, as soon as a NOTICE or higher
+    record arrives, on flush()/close(), and optionally every flush_interval
+    seconds from a background timer.
+    """
+
+    def __init__(
+        self,
+        filename,
+        mode: str = "a",
+        buffer_size: int = 65536,
+        flush_interval: Optional[float] = None,
+    ):
+        """
+        Initialize the buffered file handler.
 
+        Args:
+            filename: Path of the log file
+            mode: File open mode (default 'a' for append)
+            buffer_size: Write buffer size in bytes
+            flush_interval: Seconds between background flushes, or None to
+                flush only when the buffer fills, on NOTICE and higher records,
+                or on flush()/close()
+        """
+        self.baseFilename = os.path.abspath(os.fspath(filename))
+        self.mode = mode
+        self._fp = open(self.baseFilename, mode, buffering=buffer_size, encoding="utf-8")
+        super().__init__(self._fp)
+        self.flush_interval = flush_interval
+        self._flush_timer = None
+        if flush_interval:
+            self._schedule_flush()
+
+    def _schedule_flush(self) -> None:
+        """Arm the background timer for the next periodic flush."""
+        self._flush_timer = threading.Timer(self.flush_interval, self._periodic_flush)
+        self._flush_timer.daemon = True
+        self._flush_timer.start()
+
+    def _periodic_flush(self) -> None:
+        """Flush from the timer thread and re-arm until the handler is closed."""
+        if self.stream is None:
+            return
+        self.flush()
+        self._schedule_flush()
+
+    def emit(self, record):
+        """Write a record to the buffer, flushing only for NOTICE and higher."""
+        try:
+            msg = self.format(record)
+            self.stream.write(msg + self.terminator)
+            if record.levelno >= NOTICE_LEVEL:
+                self.flush()
+        except RecursionError:
+            raise
         except Exception:
             self.handleError(record)
+
+    def close(self):
+        """Stop the flush timer, flush buffered records and close the file."""
+        self.acquire()
+        try:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            try:
+                if self.stream:
+                    try:
+                        self.flush()
+                    finally:
+                        self.stream.close()
+            finally:
+                self.stream = None
+                super().close()
         finally:
-            self.is_handling = False
+            self.release()
+
+
+class SizeCappedFileHandler(logging.handlers.RotatingFileHandler):
+    """
+    A size-rotating file handler that formats each record only once.
+
+    RotatingFileHandler.shouldRollover formats the record to measure it, and
+    emit() then formats it again. This handler checks the size of the open file
+    with os.fstat instead. It stats once every stat_interval records, so a log
+    can run past maxBytes by at most that many records before it rolls over.
+    """
+
+    def __init__(self, filename, *args, stat_interval: int = 1, **kwargs):
+        """
+        Initialize the size-capped file handler.
+
+        Args:
+            filename: Path of the log file
+            stat_interval: Number of records between file size checks
+            *args, **kwargs: Passed on to RotatingFileHandler
+        """
+        super().__init__(filename, *args, **kwargs)
+        self.stat_interval = max(1, stat_interval)
+        self._records_since_stat = 0
+
+    def shouldRollover(self, record):
+        """Return True once the open log file has reached maxBytes."""
+        if self.maxBytes <= 0:
+            return False
+        self._records_since_stat += 1
+        if self._records_since_stat < self.stat_interval:
+            return False
+        self._records_since_stat = 0
+        if self.stream is None:
+            self.stream = self._open()
+        return os.fstat(self.stream.fileno()).st_size >= self.maxBytes
 
 
 def get_logging_provider(config: Dict[str, Any]) -> LoggingProvider:
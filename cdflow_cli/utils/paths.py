@@ -7,12 +7,34 @@ Replaces the complex storage provider system with direct Path operations.
 Works alongside existing storage provider during transition.
 """
 
+import os
+import sys
 from pathlib import Path
-from typing import Dict, Optional, Any
+from typing import Dict, Optional, Any, Set, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Map each file type to its key in the simple paths configuration
+_FILE_TYPE_MAPPINGS = {
+    "jobs": "jobs",
+    "logs": "logs",
+    "output": "output",
+    "cli_source": "cli_source",
+    "app_upload": "app_upload",
+    "app_processing": "app_processing",
+}
+
+# File types given a directory under the default base path
+_DEFAULT_FILE_TYPES = tuple(_FILE_TYPE_MAPPINGS) + ("tokens", "assets")
+
+# safe_read_text / safe_write_text work on raw descriptors; O_BINARY only exists on Windows
+_O_BINARY = getattr(os, "O_BINARY", 0)
+_READ_CHUNK_SIZE = 64 * 1024
+
+# Error raised by StoragePaths.get_path; only formatted once a lookup has failed
+_UNKNOWN_FILE_TYPE_MSG = "Unknown file type: {}. Available: {}"
+
 
 class StoragePaths:
     """
@@ -22,6 +44,13 @@ class StoragePaths:
     replacing the complex storage provider abstraction.
     """
 
+    __slots__ = (
+        "config_provider",
+        "_paths",
+        "_path_cache",
+        "_str_cache",
+    )
+
     def __init__(self, config_provider):
         """
         Initialize paths from configuration.
@@ -30,14 +59,20 @@ class StoragePaths:
             config_provider: ConfigProvider instance with storage settings
         """
         self.config_provider = config_provider
-        self._paths = {}
+        # Paths are held as strings; Path objects are built on first access
+        self._paths: Dict[str, str] = {}
+        self._path_cache: Dict[str, Path] = {}
+        self._str_cache: Optional[str] = None
         self._initialize_paths()
 
     def _initialize_paths(self):
         """Initialize all paths from configuration."""
         try:
             storage_config = self.config_provider.get_storage_config()
-            logger.debug(f"Initializing storage paths from config: {list(storage_config.keys())}")
+            # Debug messages here run on every CLI start; skip formatting them unless enabled
+            debug = logger.isEnabledFor(logging.DEBUG)
+            if debug:
+                logger.debug(f"Initializing storage paths from config: {list(storage_config.keys())}")
 
             # Use simple paths format only
             if "paths" in storage_config:
@@ -48,7 +83,8 @@ class StoragePaths:
             # Ensure all required directories exist
             self._create_directories()
 
-            logger.debug(f"Storage paths initialized: {list(self._paths.keys())}")
+            if debug:
+                logger.debug(f"Storage paths initialized: {list(self._paths.keys())}")
 
         except Exception as e:
             logger.error(f"Failed to initialize storage paths: {e}")
@@ -63,48 +99,17 @@ class StoragePaths:
         base_path_str = storage_config.get("base_path")
         base_path = None
         if base_path_str:
-            base_path = Path(base_path_str).expanduser()
+            base_path = os.path.expanduser(base_path_str)
             logger.debug(f"Using base path: {base_path}")
 
         # Get the paths section
         paths_config = storage_config.get("paths", {})
+        configured = tuple(paths_config.get(key) for key in _FILE_TYPE_MAPPINGS.values())
 
-        # Map each file type to its path
-        file_type_mappings = {
-            "jobs": "jobs",
-            "logs": "logs",
-            "output": "output",
-            "cli_source": "cli_source",
-            "app_upload": "app_upload",
-            "app_processing": "app_processing",
-        }
-
-        for file_type, config_key in file_type_mappings.items():
-            path_str = paths_config.get(config_key)
-
-            if path_str:
-                # Use provided path - resolve against base_path if relative
-                path_obj = Path(path_str)
-                if base_path and not path_obj.is_absolute():
-                    # Relative path: resolve against base_path
-                    self._paths[file_type] = base_path / path_obj
-                    logger.debug(
-                        f"Resolved relative path {path_str} against base_path: {self._paths[file_type]}"
-                    )
-                else:
-                    # Absolute path or no base_path: use as-is
-                    self._paths[file_type] = path_obj
-                    logger.debug(f"Using path as-is: {self._paths[file_type]}")
-            elif base_path:
-                # No specific path provided: use base_path + file_type
-                self._paths[file_type] = base_path / file_type
-                logger.debug(f"Using base_path + file_type: {self._paths[file_type]}")
-            else:
-                # No path provided and no base_path: use default
-                self._paths[file_type] = Path("/tmp/nbimport") / file_type
-                logger.debug(f"Using default path: {self._paths[file_type]}")
-
-            logger.debug(f"Final mapping {file_type} -> {self._paths[file_type]}")
+        self._paths.update(_resolve_simple_paths(base_path, configured))
+        if logger.isEnabledFor(logging.DEBUG):
+            for file_type, path in self._paths.items():
+                logger.debug(f"Final mapping {file_type} -> {path}")
 
     def _initialize_default_paths(self, storage_config: Dict[str, Any]):
         """Initialize with safe default paths."""
@@ -112,62 +117,67 @@ class StoragePaths:
 
         # Try to get base path from provider defaults
         provider_defaults = storage_config.get("provider_defaults", {})
-        base_path = Path(provider_defaults.get("base_path", "/tmp/nbimport"))
+        base_path = str(provider_defaults.get("base_path", "/tmp/nbimport"))
 
         # Set default paths for all file types
-        file_types = [
-            "jobs",
-            "logs",
-            "output",
-            "cli_source",
-            "app_upload",
-            "app_processing",
-            "tokens",
-            "assets",
-        ]
-        for file_type in file_types:
-            self._paths[file_type] = base_path / file_type
-            logger.debug(f"Default mapping {file_type} -> {self._paths[file_type]}")
+        debug = logger.isEnabledFor(logging.DEBUG)
+        for file_type in _DEFAULT_FILE_TYPES:
+            self._paths[file_type] = sys.intern(os.path.join(base_path, file_type))
+            if debug:
+                logger.debug(f"Default mapping {file_type} -> {self._paths[file_type]}")
 
     def _create_directories(self):
         """Ensure all configured directories exist."""
-        for file_type, path in self._paths.items():
+        # Directories already ensured; shared ancestors are only created once.
+        # Shallow paths go first so deeper ones usually find their parents made.
+        seen_dirs: Set[str] = set()
+        by_depth = sorted(self._paths.items(), key=lambda item: item[1].count(os.sep))
+        debug = logger.isEnabledFor(logging.DEBUG)
+        for file_type, path in by_depth:
             try:
-                path.mkdir(parents=True, exist_ok=True)
-                logger.debug(f"Ensured directory exists: {path}")
+                _make_dirs(path, seen_dirs)
+                if debug:
+                    logger.debug(f"Ensured directory exists: {path}")
             except Exception as e:
                 logger.error(f"Failed to create directory {path} for {file_type}: {e}")
 
+    def _as_path(self, file_type: str) -> Path:
+        """Return the Path for a file type, building it once on first use."""
+        path = self._path_cache.get(file_type)
+        if path is None:
+            path = self._path_cache[file_type] = Path(self._paths[file_type])
+        return path
+
     # Property access for each file type
     @property
     def jobs(self) -> Path:
         """Job files directory."""
-        return self._paths["jobs"]
+        return self._as_path("jobs")
 
     @property
     def logs(self) -> Path:
         """Log files directory."""
-        return self._paths["logs"]
+        return self._as_path("logs")
 
     @property
     def output(self) -> Path:
         """Output files directory (success/fail CSVs)."""
-        return self._paths["output"]
+        return self._as_path("output")
 
     @property
     def cli_source(self) -> Path:
         """CLI source files directory."""
-        return self._paths["cli_source"]
+        return self._as_path("cli_source")
 
     @property
     def app_upload(self) -> Path:
         """API upload files directory."""
-        return self._paths["app_upload"]
+        return self._as_path("app_upload")
 
     @property
     def app_processing(self) -> Path:
         """API processing files directory."""
-        return self._paths["app_processing"]
+        return self._as_path("app_processing")
 
 
     def get_path(self, file_type: str) -> Path:
@@ -183,26 +193,92 @@ class StoragePaths:
         Raises:
             ValueError: If the file type is not configured
         """
-        if file_type not in self._paths:
-            raise ValueError(
-                f"Unknown file type: {file_type}. Available: {list(self._paths.keys())}"
-            )
-        return self._paths[file_type]
+        try:
+            return self._as_path(file_type)
+        except KeyError:
+            raise ValueError(_UNKNOWN_FILE_TYPE_MSG.format(file_type, list(self._paths))) from None
 
     def get_all_paths(self) -> Dict[str, Path]:
         """Get all configured paths."""
-        return self._paths.copy()
+        return {file_type: self._as_path(file_type) for file_type in self._paths}
 
     def __str__(self) -> str:
-        """String representation for debugging."""
-        paths_str = ", ".join(f"{ft}={path}" for ft, path in self._paths.items())
-        return f"StoragePaths({paths_str})"
+        """String representation for debugging; paths are fixed after init, so built once."""
+        if self._str_cache is None:
+            paths_str = ", ".join(f"{ft}={path}" for ft, path in self._paths.items())
+            self._str_cache = f"StoragePaths({paths_str})"
+        return self._str_cache
 
 
 # Global instance - initialized by bootstrap
 _PATHS: Optional[StoragePaths] = None
 
 
+def _resolve_simple_paths(
+    base_path: Optional[str], configured: Tuple[Any, ...]
+) -> Tuple[Tuple[str, str], ...]:
+    """
+    Resolve the simple paths format to (file_type, path) pairs.
+
+    Args:
+        base_path: Expanded base path, or None
+        configured: Configured path for each entry of _FILE_TYPE_MAPPINGS, in order
+
+    Returns:
+        Tuple of (file_type, path) pairs; path strings are interned
+    """
+    resolved = []
+    for file_type, path_str in zip(_FILE_TYPE_MAPPINGS, configured):
+        if path_str:
+            # Use provided path - resolve against base_path if relative
+            if base_path and not os.path.isabs(path_str):
+                # Relative path: resolve against base_path
+                path = os.path.join(base_path, path_str)
+                logger.debug(f"Resolved relative path {path_str} against base_path: {path}")
+            else:
+                # Absolute path or no base_path: use as-is
+                path = os.fspath(path_str)
+                logger.debug(f"Using path as-is: {path}")
+        elif base_path:
+            # No specific path provided: use base_path + file_type
+            path = os.path.join(base_path, file_type)
+            logger.debug(f"Using base_path + file_type: {path}")
+        else:
+            # No path provided and no base_path: use default
+            path = os.path.join("/tmp/nbimport", file_type)
+            logger.debug(f"Using default path: {path}")
+
+        resolved.append((file_type, sys.intern(path)))
+    return tuple(resolved)
+
+
+def _make_dirs(path: str, seen_dirs: Set[str]) -> None:
+    """
+    Create a directory and any missing parents, like ``Path.mkdir(parents=True, exist_ok=True)``.
+
+    Directories recorded in ``seen_dirs`` are skipped without touching the
+    filesystem, and every directory ensured here is added to it.
+    """
+    if path in seen_dirs:
+        return
+    try:
+        os.mkdir(path)
+    except FileNotFoundError:
+        parent = os.path.dirname(path)
+        if not parent or parent == path:
+            raise
+        _make_dirs(parent, seen_dirs)
+        try:
+            os.mkdir(path)
+        except OSError:
+            if not os.path.isdir(path):
+                raise
+    except OSError:
+        if not os.path.isdir(path):
+            raise
+    seen_dirs.add(path)
+
+
 def initialize_paths(config_provider) -> StoragePaths:
     """
     Initialize global paths instance.
@@ -215,9 +291,11 @@ def initialize_paths(config_provider) -> StoragePaths:
     """
     global _PATHS
     try:
-        _PATHS = StoragePaths(config_provider)
+        # Build fully before publishing, so readers never see a partial instance
+        paths = StoragePaths(config_provider)
+        _PATHS = paths
         logger.debug("Storage paths system initialized successfully")
-        return _PATHS
+        return paths
     except Exception as e:
         logger.error(f"Failed to initialize storage paths: {e}")
         raise
@@ -233,11 +311,13 @@ def get_paths() -> StoragePaths:
     Raises:
         RuntimeError: If paths not initialized
     """
-    if _PATHS is None:
+    # Read the global once so the check and the return see the same instance
+    paths = _PATHS
+    if paths is None:
         raise RuntimeError(
             "Storage paths not initialized. Call initialize_paths(config_provider) first."
         )
-    return _PATHS
+    return paths
 
 
 def is_initialized() -> bool:
@@ -264,7 +344,18 @@ def safe_read_text(file_path: Path, encoding: str = "utf-8", default: str = "")
         str: File content or default value
     """
     try:
-        return file_path.read_text(encoding=encoding)
+        fd = os.open(os.fspath(file_path), os.O_RDONLY | _O_BINARY)
+        try:
+            chunks = [os.read(fd, os.fstat(fd).st_size or _READ_CHUNK_SIZE)]
+            while chunks[-1]:
+                chunks.append(os.read(fd, _READ_CHUNK_SIZE))
+        finally:
+            os.close(fd)
+        text = b"".join(chunks).decode(encoding)
+        # Match read_text's universal newlines
+        if "\r" in text:
+            text = text.replace("\r\n", "\n").replace("\r", "\n")
+        return text
     except FileNotFoundError:
         logger.debug(f"File not found: {file_path}")
         return default
@@ -286,8 +377,23 @@ def safe_write_text(file_path: Path, content: str, encoding: str = "utf-8") -> b
         bool: True if successful, False otherwise
     """
     try:
-        ensure_file_parent_exists(file_path)
-        file_path.write_text(content, encoding=encoding)
+        if os.linesep != "\n":
+            content = content.replace("\n", os.linesep)
+        data = content.encode(encoding)
+        path = os.fspath(file_path)
+        flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | _O_BINARY
+        try:
+            fd = os.open(path, flags, 0o666)
+        except FileNotFoundError:
+            # Parent directories are only created when the first open misses them
+            _make_dirs(os.path.dirname(os.path.abspath(path)), set())
+            fd = os.open(path, flags, 0o666)
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
         logger.debug(f"Successfully wrote file: {file_path}")
         return True
     except Exception as e:
@@ -6,6 +6,7 @@ Secure configuration utilities for handling sensitive OAuth credentials.
 """
 
 import os
+import re
 import sys
 import logging
 from typing import Dict, Any
@@ -19,6 +20,8 @@ class SecureConfigValidator:
 
     REQUIRED_VARS = ["NB_SLUG", "NB_CLIENT_ID", "NB_CLIENT_SECRET"]
     PLACEHOLDER_PATTERNS = ["your-", "example-", "placeholder-", "change-this"]
+    # All placeholder patterns as one case-insensitive search
+    _PLACEHOLDER_RE = re.compile("|".join(map(re.escape, PLACEHOLDER_PATTERNS)), re.IGNORECASE)
 
     @classmethod
     def validate_environment(cls) -> bool:
@@ -36,7 +39,7 @@ class SecureConfigValidator:
                 continue
 
             # Check for placeholder values
-            if any(pattern in value.lower() for pattern in cls.PLACEHOLDER_PATTERNS):
+            if cls._PLACEHOLDER_RE.search(value):
                 placeholder_vars.append(var)
 
         if missing_vars:
@@ -17,7 +17,12 @@ def temp_dir():
 
 @pytest.fixture
 def sample_config():
-    """Sample configuration for testing."""
+    """Sample configuration for testing.
+
+    Built fresh for every test rather than copied from a shared template:
+    tests delete both top-level and nested keys, and ConfigProvider keeps
+    sections by reference, so a shallow copy would leak mutations.
+    """
     return {
         "nationbuilder": {
             "slug": "test-nation",
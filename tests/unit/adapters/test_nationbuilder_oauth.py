@@ -4,7 +4,7 @@ Comprehensive tests for NationBuilder OAuth authentication.
 Tests all methods in NationBuilderOAuth class with comprehensive edge case coverage.
 """
 import pytest
-from unittest.mock import Mock, patch, MagicMock, mock_open
+from unittest.mock import Mock, patch
 import requests
 import time
 import secrets
@@ -66,6 +66,9 @@ def test_rollback_with_minimal_mocking():
         
         # Verify the error was logged
         mock_logger.error.assert_called_with("Failed to initialize paths system")
+        
+        # Logging is shut down on the early-return path too
+        mock_logging_provider.shutdown.assert_called_once()
 
 
 def test_core_processing_with_exception_handling():
@@ -351,6 +351,8 @@ class TestImportLogExtractor:
         # Verify file was created
         log_file = mock_paths.logs / log_path
         assert log_file.exists()
+        # Buffered API log records are flushed before the log is read
+        extractor.logging_provider.flush.assert_called_once()
 
     def test_extract_import_log_no_log_file(self, extractor):
         """Test extraction when no current log file found."""
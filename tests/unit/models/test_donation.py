@@ -1,6 +1,5 @@
 import pytest
 from datetime import datetime
-from unittest.mock import Mock, patch
 from cdflow_cli.models.donation import DonationMapper
 
 
@@ -8,11 +8,16 @@ Tests cover CSV content cleaning, file operations, uneff integration,
 and error handling scenarios.
 """
 
-import tempfile
+import json
+import os
+import tracemalloc
 from pathlib import Path
-from unittest.mock import Mock, patch, MagicMock
+from types import SimpleNamespace
+from unittest.mock import patch
 import pytest
+import uneff
 
+from cdflow_cli.utils import file_cleanup
 from cdflow_cli.utils.file_cleanup import (
     clean_csv_content_with_uneff,
     clean_csv_file_with_uneff,
@@ -21,10 +26,47 @@ from cdflow_cli.utils.file_cleanup import (
     FileCleanupError
 )
 
+# Deletion table used to build expected "cleaned" content in one pass
+_STRIP_NUL_CR = str.maketrans('', '', '\x00\r')
+
+# 10k-row CSV body for the large-content edge case, built once per session
+_LARGE_CONTENT = "x,y,z\n" * 10_000
+
+
+def _returning(result):
+    """Build a plain stub for monkeypatch that always returns result."""
+    return lambda *args, **kwargs: result
+
+
+def _raising(error):
+    """Build a plain stub for monkeypatch that always raises error."""
+    def _boom(*args, **kwargs):
+        raise error
+    return _boom
+
+
+def _read_utf8(path: Path) -> str:
+    """Read a file as UTF-8 in a single read, without a text-mode wrapper."""
+    return path.read_bytes().decode('utf-8')
+
 
 class TestFileCleanup:
     """Test file cleanup functionality."""
 
+    @pytest.fixture(autouse=True)
+    def reset_uneff_caches(self):
+        """Clear memoized uneff state so each test sees its own patched uneff."""
+        caches = (
+            file_cleanup._cleanup_stats,
+            file_cleanup._uneff_mappings,
+            file_cleanup._problematic_chars_pattern,
+        )
+        for cached in caches:
+            cached.cache_clear()
+        yield
+        for cached in caches:
+            cached.cache_clear()
+
     @pytest.fixture
     def sample_csv_content(self):
         """Sample CSV content with problematic characters."""
@@ -36,112 +78,170 @@ class TestFileCleanup:
         return "Name,Email,Amount\nJohn Doe,john@example.com,100\nJane Smith,jane@example.com,200\n"
 
     @pytest.fixture
-    def temp_file(self):
-        """Create temporary file for testing."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
-            temp_path = Path(f.name)
-        
-        yield temp_path
-        
-        # Cleanup
-        if temp_path.exists():
-            temp_path.unlink()
+    def temp_file(self, tmp_path):
+        """Create temporary file for testing (removed with pytest's tmp_path)."""
+        temp_path = tmp_path / 'input.csv'
+        temp_path.touch()
+        return temp_path
 
-    def test_clean_csv_content_with_modification(self, sample_csv_content):
+    def test_clean_csv_content_with_modification(self, sample_csv_content, monkeypatch):
         """Test cleaning CSV content that requires modification."""
         # Mock uneff.clean_content to return cleaned content
-        cleaned_content = sample_csv_content.replace('\x00', '')
+        cleaned_content = sample_csv_content.translate(_STRIP_NUL_CR)
         char_counts = {'\x00': 1}
         
-        with patch('cdflow_cli.utils.file_cleanup.uneff.clean_content', 
-                  return_value=(cleaned_content, char_counts)):
-            result_content, was_modified = clean_csv_content_with_uneff(
-                sample_csv_content, "test.csv"
-            )
-            
-            assert result_content == cleaned_content
-            assert was_modified is True
+        monkeypatch.setattr(uneff, 'clean_content', _returning((cleaned_content, char_counts)))
+        result_content, was_modified = clean_csv_content_with_uneff(
+            sample_csv_content, "test.csv"
+        )
 
-    def test_clean_csv_content_no_modification(self, clean_csv_content):
+        assert result_content == cleaned_content
+        assert was_modified is True
+
+    def test_clean_csv_content_no_modification(self, clean_csv_content, monkeypatch):
         """Test cleaning CSV content that needs no modification."""
         char_counts = {}
         
-        with patch('cdflow_cli.utils.file_cleanup.uneff.clean_content',
-                  return_value=(clean_csv_content, char_counts)):
+        monkeypatch.setattr(uneff, 'clean_content', _returning((clean_csv_content, char_counts)))
+        result_content, was_modified = clean_csv_content_with_uneff(
+            clean_csv_content, "test.csv"
+        )
+
+        assert result_content == clean_csv_content
+        assert was_modified is False
+
+    def test_clean_csv_content_clean_input_skips_uneff(self, clean_csv_content):
+        """Test content with no problematic characters never reaches uneff.clean_content."""
+        with patch('cdflow_cli.utils.file_cleanup.uneff.clean_content') as mock_clean:
             result_content, was_modified = clean_csv_content_with_uneff(
                 clean_csv_content, "test.csv"
             )
-            
+
+            mock_clean.assert_not_called()
             assert result_content == clean_csv_content
             assert was_modified is False
 
-    def test_clean_csv_content_error_handling(self, sample_csv_content):
+    def test_clean_csv_content_real_uneff_removes_invisible_chars(self):
+        """Test the pre-scan lets non-ASCII problem characters through to uneff."""
+        content = "Name,Amount\nJane\u200bSmith,100\n"
+
+        result_content, was_modified = clean_csv_content_with_uneff(content, "test.csv")
+
+        assert result_content == "Name,Amount\nJaneSmith,100\n"
+        assert was_modified is True
+
+    def test_clean_csv_content_error_handling(self, sample_csv_content, monkeypatch):
         """Test error handling during content cleaning."""
-        with patch('cdflow_cli.utils.file_cleanup.uneff.clean_content',
-                  side_effect=Exception("Uneff error")):
-            result_content, was_modified = clean_csv_content_with_uneff(
-                sample_csv_content, "test.csv"
-            )
-            
-            # Should return original content on error
-            assert result_content == sample_csv_content
-            assert was_modified is False
+        monkeypatch.setattr(uneff, 'clean_content', _raising(Exception("Uneff error")))
+        result_content, was_modified = clean_csv_content_with_uneff(
+            sample_csv_content, "test.csv"
+        )
+
+        # Should return original content on error
+        assert result_content == sample_csv_content
+        assert was_modified is False
 
     def test_clean_csv_file_success(self, temp_file, sample_csv_content):
         """Test successful file cleaning."""
         # Write sample content to file
         temp_file.write_text(sample_csv_content, encoding='utf-8')
         
-        cleaned_content = sample_csv_content.replace('\x00', '')
-        char_counts = {'\x00': 1}
+        cleaned_content = sample_csv_content.translate(_STRIP_NUL_CR)
         
-        with patch('cdflow_cli.utils.file_cleanup.uneff.clean_content',
-                  return_value=(cleaned_content, char_counts)):
-            result_path, was_modified = clean_csv_file_with_uneff(temp_file)
-            
-            assert result_path == temp_file
-            assert was_modified is True
-            assert temp_file.read_text(encoding='utf-8') == cleaned_content
+        result_path, was_modified = clean_csv_file_with_uneff(temp_file)
+
+        assert result_path == temp_file
+        assert was_modified is True
+        assert _read_utf8(temp_file) == cleaned_content
 
     def test_clean_csv_file_no_modification(self, temp_file, clean_csv_content):
         """Test file cleaning when no modification needed."""
         temp_file.write_text(clean_csv_content, encoding='utf-8')
         
-        char_counts = {}
-        
-        with patch('cdflow_cli.utils.file_cleanup.uneff.clean_content',
-                  return_value=(clean_csv_content, char_counts)):
+        result_path, was_modified = clean_csv_file_with_uneff(temp_file)
+
+        assert result_path == temp_file
+        assert was_modified is False
+
+    def test_clean_csv_file_clean_input_skips_uneff(self, temp_file, clean_csv_content):
+        """Test a file with nothing to clean is rewritten without calling uneff.clean_content."""
+        temp_file.write_text(clean_csv_content, encoding='utf-8')
+
+        with patch('cdflow_cli.utils.file_cleanup.uneff.clean_content') as mock_clean:
             result_path, was_modified = clean_csv_file_with_uneff(temp_file)
-            
-            assert result_path == temp_file
-            assert was_modified is False
+
+        mock_clean.assert_not_called()
+        assert result_path == temp_file
+        assert was_modified is False
+        assert _read_utf8(temp_file) == clean_csv_content
 
     def test_clean_csv_file_with_output_path(self, temp_file, sample_csv_content):
         """Test file cleaning with separate output file."""
         # Write sample content to input file
         temp_file.write_text(sample_csv_content, encoding='utf-8')
         
-        # Create separate output file
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
-            output_path = Path(f.name)
+        # Create separate output file alongside the input
+        output_path = temp_file.with_name('output.csv')
+        output_path.touch()
+        
+        cleaned_content = sample_csv_content.translate(_STRIP_NUL_CR)
         
+        result_path, was_modified = clean_csv_file_with_uneff(temp_file, output_path)
+
+        assert result_path == output_path
+        assert was_modified is True
+        assert _read_utf8(output_path) == cleaned_content
+
+        # Input file should be unchanged
+        assert _read_utf8(temp_file) == sample_csv_content
+
+    def test_clean_csv_file_streams_in_chunks(self, temp_file, monkeypatch):
+        """Test chunked cleaning handles CRLF and multi-byte characters split across reads."""
+        monkeypatch.setattr(file_cleanup, '_CLEANUP_CHUNK_SIZE', 5)
+        content = "Name,City\r\nJane\x00,Montréal\r\nJohn\u200b,Zürich\r\n"
+        temp_file.write_bytes(content.encode('utf-8'))
+
+        result_path, was_modified = clean_csv_file_with_uneff(temp_file)
+
+        assert result_path == temp_file
+        assert was_modified is True
+        assert _read_utf8(temp_file) == "Name,City\nJane,Montréal\nJohn,Zürich\n"
+        assert list(temp_file.parent.iterdir()) == [temp_file]
+
+    def test_clean_csv_file_preserves_windows_1252(self, temp_file):
+        """Test non-UTF-8 input is decoded with the detected encoding and written as UTF-8."""
+        content = "Name,City\nRené\x00,Montréal\n" * 50
+        temp_file.write_bytes(content.encode('windows-1252'))
+
+        _, was_modified = clean_csv_file_with_uneff(temp_file)
+
+        assert was_modified is True
+        assert _read_utf8(temp_file) == content.replace('\x00', '')
+
+    @pytest.mark.slow
+    def test_clean_csv_file_bounded_memory(self, temp_file):
+        """Test peak memory stays near the chunk size rather than the file size."""
+        row = "John Doe,john@example.com,100\n"
+        rows_per_block = (1 << 20) // len(row)
+        with temp_file.open('w', encoding='utf-8') as f:
+            for _ in range(12):
+                f.write(row * rows_per_block + "Jane\x00Smith,jane@example.com,200\n")
+        output_path = temp_file.with_name('output.csv')
+
+        # Warm up first so chardet's lazily loaded models are not counted
+        warmup_path = temp_file.with_name('warmup.csv')
+        warmup_path.write_text("Name,Amount\nJane,1\n", encoding='utf-8')
+        clean_csv_file_with_uneff(warmup_path)
+
+        tracemalloc.start()
         try:
-            cleaned_content = sample_csv_content.replace('\x00', '')
-            char_counts = {'\x00': 1}
-            
-            with patch('cdflow_cli.utils.file_cleanup.uneff.clean_content',
-                      return_value=(cleaned_content, char_counts)):
-                result_path, was_modified = clean_csv_file_with_uneff(temp_file, output_path)
-                
-                assert result_path == output_path
-                assert was_modified is True
-                assert output_path.read_text(encoding='utf-8') == cleaned_content
-                
-                # Input file should be unchanged
-                assert temp_file.read_text(encoding='utf-8') == sample_csv_content
+            _, was_modified = clean_csv_file_with_uneff(temp_file, output_path)
+            _, peak = tracemalloc.get_traced_memory()
         finally:
-            if output_path.exists():
-                output_path.unlink()
+            tracemalloc.stop()
+
+        assert was_modified is True
+        assert peak < 8 * (1 << 20)
 
     def test_clean_csv_file_nonexistent_input(self):
         """Test cleaning non-existent input file."""
@@ -152,112 +252,151 @@ class TestFileCleanup:
 
     def test_clean_csv_file_read_error(self, temp_file):
         """Test handling of file read errors."""
-        temp_file.write_text("content", encoding='utf-8')
-        
-        with patch('cdflow_cli.utils.file_cleanup._safe_read_text_file',
+        # temp_file already exists; its content is never read because the reader fails
+        with patch('cdflow_cli.utils.file_cleanup._detect_text_encoding',
                   side_effect=Exception("Read error")):
             with pytest.raises(FileCleanupError):
                 clean_csv_file_with_uneff(temp_file)
 
-    def test_clean_csv_file_write_error(self, temp_file, sample_csv_content):
+    def test_clean_csv_file_write_error(self, temp_file, sample_csv_content, monkeypatch):
         """Test handling of file write errors."""
         temp_file.write_text(sample_csv_content, encoding='utf-8')
         
-        cleaned_content = sample_csv_content.replace('\x00', '')
-        char_counts = {'\x00': 1}
-        
-        with patch('cdflow_cli.utils.file_cleanup.uneff.clean_content',
-                  return_value=(cleaned_content, char_counts)), \
-             patch.object(Path, 'write_text', side_effect=Exception("Write error")):
-            with pytest.raises(FileCleanupError):
-                clean_csv_file_with_uneff(temp_file)
+        monkeypatch.setattr(file_cleanup, '_write_all', _raising(Exception("Write error")))
+        with pytest.raises(FileCleanupError):
+            clean_csv_file_with_uneff(temp_file)
+
+    def test_clean_csv_file_write_error_removes_partial_output(
+        self, temp_file, sample_csv_content, monkeypatch
+    ):
+        """Test a failed clean into a separate output file leaves no partial file."""
+        temp_file.write_text(sample_csv_content, encoding='utf-8')
+        output_path = temp_file.with_name('output.csv')
+
+        monkeypatch.setattr(file_cleanup, '_write_all', _raising(OSError("Disk full")))
+        with pytest.raises(FileCleanupError):
+            clean_csv_file_with_uneff(temp_file, output_path)
+
+        assert not output_path.exists()
+        assert _read_utf8(temp_file) == sample_csv_content
 
-    def test_clean_csv_file_uneff_error(self, temp_file, sample_csv_content):
+    def test_clean_csv_file_in_place_keeps_hard_links(self, temp_file, sample_csv_content):
+        """Test in-place cleaning rewrites the same file rather than replacing it."""
+        temp_file.write_text(sample_csv_content, encoding='utf-8')
+        link_path = temp_file.with_name('linked.csv')
+        os.link(temp_file, link_path)
+        inode = temp_file.stat().st_ino
+
+        clean_csv_file_with_uneff(temp_file)
+
+        assert temp_file.stat().st_ino == inode
+        assert _read_utf8(link_path) == sample_csv_content.translate(_STRIP_NUL_CR)
+
+    def test_clean_csv_file_uneff_error(self, temp_file, sample_csv_content, monkeypatch):
         """Test handling of uneff processing errors."""
         temp_file.write_text(sample_csv_content, encoding='utf-8')
         
-        with patch('cdflow_cli.utils.file_cleanup.uneff.clean_content',
-                  side_effect=Exception("Uneff processing error")):
-            with pytest.raises(FileCleanupError):
-                clean_csv_file_with_uneff(temp_file)
+        monkeypatch.setattr(
+            uneff, 'get_default_mappings_csv', _raising(Exception("Uneff processing error"))
+        )
+        with pytest.raises(FileCleanupError):
+            clean_csv_file_with_uneff(temp_file)
 
-    def test_get_cleanup_stats_success(self):
+    def test_uneff_mappings_translation_matches_uneff(self):
+        """Test the compiled translate table reproduces uneff.clean_content exactly."""
+        mapped_chars = "".join(file_cleanup._uneff_mappings().names)
+        content = f"Name,Note\nJane,a{mapped_chars}b\r\nJohn,\x00\x00\u2028\n"
+
+        assert file_cleanup._clean_with_uneff_mappings(content) == uneff.clean_content(content)
+
+    def test_uneff_mappings_translation_clean_content(self, clean_csv_content):
+        """Test clean content is returned unchanged with no counts."""
+        result = file_cleanup._clean_with_uneff_mappings(clean_csv_content)
+
+        assert result == (clean_csv_content, {})
+
+    def test_get_cleanup_stats_success(self, monkeypatch):
         """Test getting cleanup statistics successfully."""
-        with patch('cdflow_cli.utils.file_cleanup.uneff') as mock_uneff:
-            mock_uneff.__version__ = "1.2.3"
-            mock_uneff.get_default_mappings_csv = Mock()
-            
-            stats = get_cleanup_stats()
-            
-            assert stats["uneff_available"] is True
-            assert stats["cleanup_enabled"] is True
-            assert stats["tool_version"] == "1.2.3"
-            assert stats["default_mappings_available"] is True
+        fake_uneff = SimpleNamespace(__version__="1.2.3", get_default_mappings_csv=lambda: "")
+        monkeypatch.setattr(file_cleanup, 'uneff', fake_uneff)
+
+        stats = get_cleanup_stats()
 
-    def test_get_cleanup_stats_no_version(self):
+        assert stats["uneff_available"] is True
+        assert stats["cleanup_enabled"] is True
+        assert stats["tool_version"] == "1.2.3"
+        assert stats["default_mappings_available"] is True
+
+    def test_get_cleanup_stats_no_version(self, monkeypatch):
         """Test getting cleanup statistics when version unavailable."""
-        with patch('cdflow_cli.utils.file_cleanup.uneff') as mock_uneff:
-            # Remove __version__ attribute
-            if hasattr(mock_uneff, '__version__'):
-                delattr(mock_uneff, '__version__')
-            
-            stats = get_cleanup_stats()
-            
-            assert stats["tool_version"] == "unknown"
+        fake_uneff = SimpleNamespace(get_default_mappings_csv=lambda: "")
+        monkeypatch.setattr(file_cleanup, 'uneff', fake_uneff)
+
+        stats = get_cleanup_stats()
 
-    def test_get_cleanup_stats_no_mappings(self):
+        assert stats["tool_version"] == "unknown"
+
+    def test_get_cleanup_stats_no_mappings(self, monkeypatch):
         """Test getting cleanup statistics when mappings unavailable."""
-        with patch('cdflow_cli.utils.file_cleanup.uneff') as mock_uneff:
-            mock_uneff.__version__ = "1.0.0"
-            # Remove get_default_mappings_csv attribute
-            if hasattr(mock_uneff, 'get_default_mappings_csv'):
-                delattr(mock_uneff, 'get_default_mappings_csv')
-            
-            stats = get_cleanup_stats()
-            
-            assert stats["default_mappings_available"] is False
+        monkeypatch.setattr(file_cleanup, 'uneff', SimpleNamespace(__version__="1.0.0"))
 
-    def test_analyze_csv_content_success(self, sample_csv_content):
+        stats = get_cleanup_stats()
+
+        assert stats["default_mappings_available"] is False
+
+    def test_get_cleanup_stats_returns_independent_dicts(self):
+        """Test callers get a fresh dict they can mutate and serialize."""
+        stats = get_cleanup_stats()
+        stats["cleanup_enabled"] = False
+
+        assert get_cleanup_stats()["cleanup_enabled"] is True
+        assert json.loads(json.dumps(stats)) == stats
+
+    def test_analyze_csv_content_success(self, sample_csv_content, monkeypatch):
         """Test successful CSV content analysis."""
         analysis_result = {
             "issues": [{"char": "\x00", "count": 1, "positions": [30]}],
             "total_issues": 1
         }
         
-        with patch('cdflow_cli.utils.file_cleanup.uneff.analyze_content',
-                  return_value=analysis_result):
-            result = analyze_csv_content(sample_csv_content, "test.csv")
-            
-            assert result["uneff_available"] is True
-            assert result["analysis_performed"] is True
-            assert result["filename"] == "test.csv"
-            assert result["problematic_chars_found"] is True
-            assert result["analysis_details"] == analysis_result
+        monkeypatch.setattr(uneff, 'analyze_content', _returning(analysis_result))
+        result = analyze_csv_content(sample_csv_content, "test.csv")
+
+        assert result["uneff_available"] is True
+        assert result["analysis_performed"] is True
+        assert result["filename"] == "test.csv"
+        assert result["problematic_chars_found"] is True
+        assert result["analysis_details"] == analysis_result
 
-    def test_analyze_csv_content_no_issues(self, clean_csv_content):
+    def test_analyze_csv_content_no_issues(self, clean_csv_content, monkeypatch):
         """Test CSV content analysis with no issues found."""
         analysis_result = {
             "issues": [],
             "total_issues": 0
         }
         
-        with patch('cdflow_cli.utils.file_cleanup.uneff.analyze_content',
-                  return_value=analysis_result):
-            result = analyze_csv_content(clean_csv_content, "clean.csv")
-            
-            assert result["problematic_chars_found"] is False
-            assert result["analysis_details"]["total_issues"] == 0
+        monkeypatch.setattr(uneff, 'analyze_content', _returning(analysis_result))
+        result = analyze_csv_content(clean_csv_content, "clean.csv")
+
+        assert result["problematic_chars_found"] is False
+        assert result["analysis_details"]["total_issues"] == 0
 
-    def test_analyze_csv_content_error(self, sample_csv_content):
+    def test_analyze_csv_content_error(self, sample_csv_content, monkeypatch):
         """Test CSV content analysis error handling."""
-        with patch('cdflow_cli.utils.file_cleanup.uneff.analyze_content',
-                  side_effect=Exception("Analysis error")):
-            result = analyze_csv_content(sample_csv_content, "test.csv")
-            
-            assert result["uneff_available"] is True
-            assert result["analysis_performed"] is False
-            assert "error" in result
-            assert result["error"] == "Analysis error"
+        monkeypatch.setattr(uneff, 'analyze_content', _raising(Exception("Analysis error")))
+        result = analyze_csv_content(sample_csv_content, "test.csv")
+
+        assert result["uneff_available"] is True
+        assert result["analysis_performed"] is False
+        assert "error" in result
+        assert result["error"] == "Analysis error"
+
+    def test_analyze_csv_content_real_uneff_detects_issues(self, sample_csv_content):
+        """Test problem detection against uneff's real analysis result shape."""
+        result = analyze_csv_content(sample_csv_content, "test.csv")
+
+        assert result["analysis_performed"] is True
+        assert result["problematic_chars_found"] is True
 
     def test_file_cleanup_error_exception(self):
         """Test FileCleanupError exception."""
@@ -265,30 +404,29 @@ class TestFileCleanup:
         assert str(error) == "Test error message"
         assert isinstance(error, Exception)
 
-    def test_integration_clean_content_and_file(self, temp_file):
+    def test_integration_clean_content_and_file(self, temp_file, monkeypatch):
         """Test integration between content and file cleaning."""
         problematic_content = "Name,Value\nTest\x00User,123\nNormal User,456\n"
         temp_file.write_text(problematic_content, encoding='utf-8')
         
         # Mock uneff to simulate cleaning
-        clean_content = problematic_content.replace('\x00', '')
+        clean_content = problematic_content.translate(_STRIP_NUL_CR)
         char_counts = {'\x00': 1}
         
-        with patch('cdflow_cli.utils.file_cleanup.uneff.clean_content',
-                  return_value=(clean_content, char_counts)):
-            
-            # Test content cleaning
-            content_result, content_modified = clean_csv_content_with_uneff(
-                problematic_content, "test.csv"
-            )
-            
-            # Test file cleaning
-            file_result, file_modified = clean_csv_file_with_uneff(temp_file)
-            
-            assert content_modified is True
-            assert file_modified is True
-            assert content_result == clean_content
-            assert temp_file.read_text(encoding='utf-8') == clean_content
+        monkeypatch.setattr(uneff, 'clean_content', _returning((clean_content, char_counts)))
+
+        # Test content cleaning
+        content_result, content_modified = clean_csv_content_with_uneff(
+            problematic_content, "test.csv"
+        )
+
+        # Test file cleaning
+        file_result, file_modified = clean_csv_file_with_uneff(temp_file)
+
+        assert content_modified is True
+        assert file_modified is True
+        assert content_result == clean_content
+        assert _read_utf8(temp_file) == clean_content
 
     def test_uneff_dependency_behavior(self):
         """Test behavior when uneff module is available."""
@@ -296,14 +434,13 @@ class TestFileCleanup:
         import cdflow_cli.utils.file_cleanup
         assert hasattr(cdflow_cli.utils.file_cleanup, 'uneff')
 
-    def test_logging_behavior(self, sample_csv_content):
+    def test_logging_behavior(self, sample_csv_content, monkeypatch):
         """Test that appropriate logging occurs during cleaning."""
-        cleaned_content = sample_csv_content.replace('\x00', '')
+        cleaned_content = sample_csv_content.translate(_STRIP_NUL_CR)
         char_counts = {'\x00': 1}
         
-        with patch('cdflow_cli.utils.file_cleanup.uneff.clean_content',
-                  return_value=(cleaned_content, char_counts)), \
-             patch('cdflow_cli.utils.file_cleanup.logger') as mock_logger:
+        monkeypatch.setattr(uneff, 'clean_content', _returning((cleaned_content, char_counts)))
+        with patch('cdflow_cli.utils.file_cleanup.logger') as mock_logger:
             
             clean_csv_content_with_uneff(sample_csv_content, "test.csv")
             
@@ -311,13 +448,12 @@ class TestFileCleanup:
             mock_logger.info.assert_called()
             assert "problematic characters removed/replaced" in str(mock_logger.info.call_args)
 
-    def test_no_modification_logging(self, clean_csv_content):
+    def test_no_modification_logging(self, clean_csv_content, monkeypatch):
         """Test logging when no modification is needed."""
         char_counts = {}
         
-        with patch('cdflow_cli.utils.file_cleanup.uneff.clean_content',
-                  return_value=(clean_csv_content, char_counts)), \
-             patch('cdflow_cli.utils.file_cleanup.logger') as mock_logger:
+        monkeypatch.setattr(uneff, 'clean_content', _returning((clean_csv_content, char_counts)))
+        with patch('cdflow_cli.utils.file_cleanup.logger') as mock_logger:
             
             clean_csv_content_with_uneff(clean_csv_content, "test.csv")
             
@@ -325,44 +461,41 @@ class TestFileCleanup:
             mock_logger.debug.assert_called()
             assert "no problematic characters found" in str(mock_logger.debug.call_args)
 
-    def test_char_counts_handling(self, sample_csv_content):
+    def test_char_counts_handling(self, sample_csv_content, monkeypatch):
         """Test handling of character count details."""
-        cleaned_content = sample_csv_content.replace('\x00', '').replace('\r', '')
+        cleaned_content = sample_csv_content.translate(_STRIP_NUL_CR)
         char_counts = {'\x00': 1, '\r': 2}
         
-        with patch('cdflow_cli.utils.file_cleanup.uneff.clean_content',
-                  return_value=(cleaned_content, char_counts)):
-            result_content, was_modified = clean_csv_content_with_uneff(
-                sample_csv_content, "test.csv"
-            )
-            
-            assert was_modified is True
-            # Total characters cleaned should be 3 (1 + 2)
+        monkeypatch.setattr(uneff, 'clean_content', _returning((cleaned_content, char_counts)))
+        result_content, was_modified = clean_csv_content_with_uneff(
+            sample_csv_content, "test.csv"
+        )
+
+        assert was_modified is True
+        # Total characters cleaned should be 3 (1 + 2)
 
-    def test_edge_case_empty_content(self):
+    def test_edge_case_empty_content(self, monkeypatch):
         """Test cleaning empty content."""
         empty_content = ""
         char_counts = {}
         
-        with patch('cdflow_cli.utils.file_cleanup.uneff.clean_content',
-                  return_value=(empty_content, char_counts)):
-            result_content, was_modified = clean_csv_content_with_uneff(
-                empty_content, "empty.csv"
-            )
-            
-            assert result_content == ""
-            assert was_modified is False
+        monkeypatch.setattr(uneff, 'clean_content', _returning((empty_content, char_counts)))
+        result_content, was_modified = clean_csv_content_with_uneff(
+            empty_content, "empty.csv"
+        )
+
+        assert result_content == ""
+        assert was_modified is False
 
-    def test_edge_case_very_large_content(self):
+    def test_edge_case_very_large_content(self, monkeypatch):
         """Test cleaning very large content."""
-        large_content = "x,y,z\n" * 10000  # 10k rows
+        large_content = _LARGE_CONTENT
         char_counts = {}
         
-        with patch('cdflow_cli.utils.file_cleanup.uneff.clean_content',
-                  return_value=(large_content, char_counts)):
-            result_content, was_modified = clean_csv_content_with_uneff(
-                large_content, "large.csv"
-            )
-            
-            assert len(result_content) == len(large_content)
-            assert was_modified is False
\ No newline at end of file
+        monkeypatch.setattr(uneff, 'clean_content', _returning((large_content, char_counts)))
+        result_content, was_modified = clean_csv_content_with_uneff(
+            large_content, "large.csv"
+        )
+
+        assert len(result_content) == len(large_content)
+        assert was_modified is False
\ No newline at end of file
@@ -1,129 +1,157 @@
 import pytest
-import tempfile
 from pathlib import Path
-from unittest.mock import patch, mock_open, Mock
+from unittest.mock import patch
+from cdflow_cli.utils import file_utils
 from cdflow_cli.utils.file_utils import (
     safe_read_text_file,
+    detect_text_encoding,
     normalize_file_content,
     cleaned_phone
 )
 
 
+@pytest.fixture(scope='session')
+def text_files_dir(tmp_path_factory):
+    """Directory for read-only payload files shared by the whole session."""
+    return tmp_path_factory.mktemp('files')
+
+
+@pytest.fixture(scope='session')
+def utf8_file(text_files_dir):
+    """UTF-8 file with CJK text, written once per session."""
+    path = text_files_dir / 'utf8.txt'
+    path.write_text("Test content with UTF-8 encoding: 测试中文", encoding='utf-8')
+    return path
+
+
+@pytest.fixture(scope='session')
+def win1252_file(text_files_dir):
+    """windows-1252 file with accented text, written once per session."""
+    path = text_files_dir / 'win1252.txt'
+    path.write_text("Content with windows-1252 encoding: café résumé", encoding='windows-1252')
+    return path
+
+
+@pytest.fixture(scope='session')
+def binary_junk_file(text_files_dir):
+    """File containing bytes that are invalid UTF-8, written once per session."""
+    path = text_files_dir / 'junk.txt'
+    path.write_bytes(b"\x80\x81\x82\x83 Invalid binary content \xff\xfe\xfd")
+    return path
+
+
+@pytest.fixture(scope='session')
+def bom_file(text_files_dir):
+    """UTF-8 file with a BOM, a null byte and CJK text, written once per session."""
+    path = text_files_dir / 'bom.txt'
+    path.write_text("Hello world with BOM and unicode: 测试中文\x00null", encoding='utf-8-sig')
+    return path
+
+
 class TestSafeReadTextFile:
     """Test safe text file reading with encoding detection."""
     
-    @pytest.fixture
-    def temp_text_file(self):
-        """Create a temporary text file for testing."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False, encoding='utf-8') as f:
-            temp_path = Path(f.name)
-            f.write("Test content with UTF-8 encoding: 测试中文")
-        yield temp_path
-        # Cleanup
-        if temp_path.exists():
-            temp_path.unlink()
-    
-    def test_safe_read_utf8_file(self, temp_text_file):
+    def test_safe_read_utf8_file(self, utf8_file):
         """Test reading a standard UTF-8 file."""
-        content = safe_read_text_file(temp_text_file)
+        content = safe_read_text_file(utf8_file)
         
         assert "Test content with UTF-8 encoding" in content
         assert "测试中文" in content
     
-    def test_safe_read_with_encoding_detection(self):
+    def test_safe_read_with_encoding_detection(self, win1252_file):
         """Test automatic encoding detection."""
-        # Create file with specific encoding
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False, encoding='windows-1252') as f:
-            temp_path = Path(f.name)
-            f.write("Content with windows-1252 encoding: café résumé")
-        
-        try:
-            # Mock chardet to return high confidence detection
-            with patch('cdflow_cli.utils.file_utils.chardet.detect') as mock_detect:
-                mock_detect.return_value = {'encoding': 'windows-1252', 'confidence': 0.85}
-                
-                content = safe_read_text_file(temp_path)
-                assert "café résumé" in content
-                
-        finally:
-            if temp_path.exists():
-                temp_path.unlink()
+        # Mock chardet to return high confidence detection
+        with patch('cdflow_cli.utils.file_utils.chardet.detect') as mock_detect:
+            mock_detect.return_value = {'encoding': 'windows-1252', 'confidence': 0.85}
+            
+            content = safe_read_text_file(win1252_file)
+            assert "café résumé" in content
     
-    def test_safe_read_low_confidence_detection(self):
+    def test_safe_read_low_confidence_detection(self, utf8_file):
         """Test fallback when encoding detection confidence is low."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False, encoding='utf-8') as f:
-            temp_path = Path(f.name)
-            f.write("Low confidence test content")
-        
-        try:
-            # Mock low confidence detection
-            with patch('cdflow_cli.utils.file_utils.chardet.detect') as mock_detect:
-                mock_detect.return_value = {'encoding': 'ascii', 'confidence': 0.3}
-                
-                content = safe_read_text_file(temp_path)
-                assert "Low confidence test content" in content
-                
-        finally:
-            if temp_path.exists():
-                temp_path.unlink()
+        # Mock low confidence detection
+        with patch('cdflow_cli.utils.file_utils.chardet.detect') as mock_detect:
+            mock_detect.return_value = {'encoding': 'ascii', 'confidence': 0.3}
+            
+            content = safe_read_text_file(utf8_file)
+            assert "Test content with UTF-8 encoding: 测试中文" in content
     
-    def test_safe_read_encoding_detection_failure(self):
+    def test_safe_read_encoding_detection_failure(self, utf8_file):
         """Test fallback when encoding detection fails."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False, encoding='utf-8') as f:
-            temp_path = Path(f.name)
-            f.write("Fallback encoding test")
-        
-        try:
-            # Mock chardet to raise exception
-            with patch('cdflow_cli.utils.file_utils.chardet.detect') as mock_detect:
-                mock_detect.side_effect = Exception("Detection failed")
-                
-                content = safe_read_text_file(temp_path)
-                assert "Fallback encoding test" in content
-                
-        finally:
-            if temp_path.exists():
-                temp_path.unlink()
+        # Mock chardet to raise exception
+        with patch('cdflow_cli.utils.file_utils.chardet.detect') as mock_detect:
+            mock_detect.side_effect = Exception("Detection failed")
+            
+            content = safe_read_text_file(utf8_file)
+            assert "Test content with UTF-8 encoding" in content
     
-    def test_safe_read_fallback_encodings(self):
+    def test_safe_read_fallback_encodings(self, tmp_path):
         """Test fallback encoding sequence."""
-        # Create file with content that requires fallback
-        with tempfile.NamedTemporaryFile(mode='wb', suffix='.txt', delete=False) as f:
-            temp_path = Path(f.name)
-            # Write content that might cause UTF-8 decode errors
-            f.write(b"Test content with problematic bytes: \xff\xfe")
+        # Write content that might cause UTF-8 decode errors
+        temp_path = tmp_path / 'fallback.txt'
+        temp_path.write_bytes(b"Test content with problematic bytes: \xff\xfe")
         
-        try:
-            # Mock chardet to return None/low confidence
-            with patch('cdflow_cli.utils.file_utils.chardet.detect') as mock_detect:
-                mock_detect.return_value = {'encoding': None, 'confidence': 0.1}
-                
-                content = safe_read_text_file(temp_path)
-                # Should read successfully with fallback encoding
-                assert "Test content" in content
-                
-        finally:
-            if temp_path.exists():
-                temp_path.unlink()
-    
-    def test_safe_read_final_fallback_with_errors_replace(self):
-        """Test final fallback with error replacement."""
-        # Create file with content that will cause decode errors
-        with tempfile.NamedTemporaryFile(mode='wb', suffix='.txt', delete=False) as f:
-            temp_path = Path(f.name)
-            # Binary content that's not valid in common encodings
-            f.write(b"\x80\x81\x82\x83 Invalid binary content \xff\xfe\xfd")
-        
-        try:
+        # Mock chardet to return None/low confidence
+        with patch('cdflow_cli.utils.file_utils.chardet.detect') as mock_detect:
+            mock_detect.return_value = {'encoding': None, 'confidence': 0.1}
+            
             content = safe_read_text_file(temp_path)
-            # Should read successfully with replacement characters
-            assert "Invalid binary content" in content
-            # May contain replacement characters (�) for invalid bytes
-                
-        finally:
-            if temp_path.exists():
-                temp_path.unlink()
+            # Should read successfully with fallback encoding
+            assert "Test content" in content
     
+    def test_safe_read_final_fallback_with_errors_replace(self, binary_junk_file):
+        """Test final fallback with error replacement."""
+        content = safe_read_text_file(binary_junk_file)
+        # Should read successfully with replacement characters
+        assert "Invalid binary content" in content
+        # May contain replacement characters (�) for invalid bytes
+    
+    def test_safe_read_detects_from_bounded_sample(self, tmp_path):
+        """Test only the leading sample, not the whole file, is passed to the detector."""
+        path = tmp_path / 'large.csv'
+        path.write_text("x,y,é\n" * 10000, encoding='utf-8')
+
+        with patch('cdflow_cli.utils.file_utils.chardet.detect') as mock_detect:
+            mock_detect.return_value = {'encoding': 'utf-8', 'confidence': 0.99}
+            content = safe_read_text_file(path)
+
+        assert len(mock_detect.call_args[0][0]) == 10000
+        assert content == "x,y,é\n" * 10000
+
+    @pytest.mark.parametrize("text,encoding", [
+        ("Name,Amount\nJane,100\n", 'ascii'),
+        ("Name,City\nRené,Montréal\n", 'utf-8-sig'),
+        ("Name,City\nRené,Montréal\n", 'utf-16'),
+        ("Name,City\nRené,Montréal\n", 'utf-32'),
+    ])
+    def test_safe_read_skips_detector_for_bom_or_ascii(self, tmp_path, text, encoding):
+        """Test BOM-prefixed and pure-ASCII files are decoded without calling chardet."""
+        path = tmp_path / 'sniffed.csv'
+        path.write_bytes(text.encode(encoding))
+
+        with patch('cdflow_cli.utils.file_utils.chardet.detect') as mock_detect:
+            content = safe_read_text_file(path)
+
+        mock_detect.assert_not_called()
+        assert content == text
+
+    def test_safe_read_matches_read_text_newlines(self, tmp_path):
+        """Test CRLF and lone CR line endings are translated exactly like Path.read_text."""
+        temp_path = tmp_path / 'newlines.csv'
+        temp_path.write_bytes(b"Name,Amount\r\nJane,100\rJohn,200\n")
+
+        assert safe_read_text_file(temp_path) == temp_path.read_text(encoding='utf-8')
+
+    def test_safe_read_returns_rewritten_content(self, tmp_path):
+        """Test rewriting a file with the same size returns the new content."""
+        temp_path = tmp_path / 'changing.csv'
+        temp_path.write_text("Name,Amount\nJane,100\n", encoding='utf-8')
+        assert safe_read_text_file(temp_path) == "Name,Amount\nJane,100\n"
+
+        temp_path.write_text("Name,Amount\nJohn,200\n", encoding='utf-8')
+
+        assert safe_read_text_file(temp_path) == "Name,Amount\nJohn,200\n"
+
     def test_safe_read_nonexistent_file(self):
         """Test behavior with non-existent file."""
         nonexistent_path = Path("/nonexistent/path/file.txt")
@@ -131,8 +159,12 @@ class TestSafeReadTextFile:
         with pytest.raises(FileNotFoundError):
             safe_read_text_file(nonexistent_path)
     
-    def test_safe_read_permission_denied(self, temp_text_file):
+    def test_safe_read_permission_denied(self, tmp_path):
         """Test behavior with permission denied."""
+        # Uses its own file since it changes permissions
+        temp_text_file = tmp_path / 'unreadable.txt'
+        temp_text_file.write_text("Test content with UTF-8 encoding: 测试中文", encoding='utf-8')
+
         # Make file unreadable (if possible on this system)
         import stat
         temp_text_file.chmod(stat.S_IWUSR)  # Write-only, no read permission
@@ -150,6 +182,69 @@ class TestSafeReadTextFile:
             temp_text_file.chmod(stat.S_IRUSR | stat.S_IWUSR)
 
 
+class TestDetectTextEncoding:
+    """Test streaming-friendly encoding detection."""
+
+    def test_detect_utf8(self, tmp_path):
+        """Test a UTF-8 file is detected as decodable with strict errors."""
+        path = tmp_path / 'utf8.csv'
+        path.write_text("Name,City\nRené,Montréal\n", encoding='utf-8')
+
+        encoding, errors = detect_text_encoding(path)
+
+        assert errors == 'strict'
+        assert path.read_bytes().decode(encoding) == "Name,City\nRené,Montréal\n"
+
+    def test_detect_matches_safe_read(self, tmp_path):
+        """Test the chosen encoding decodes to what safe_read_text_file returns."""
+        path = tmp_path / 'legacy.csv'
+        # Larger than the detection sample, so validation streams the file
+        path.write_bytes("Name,City\nRené,Montréal\n".encode('windows-1252') * 500)
+
+        encoding, errors = detect_text_encoding(path, chunk_size=7)
+
+        with open(path, 'r', encoding=encoding, errors=errors) as f:
+            assert f.read() == safe_read_text_file(path)
+
+    def test_detect_small_file_not_reopened(self, tmp_path):
+        """Test a file that fits in the detection sample is validated without a second read."""
+        path = tmp_path / 'small.csv'
+        path.write_bytes("Name,City\nRené,Montréal\n".encode('windows-1252'))
+
+        with patch.object(file_utils, 'open', create=True, side_effect=AssertionError):
+            encoding, errors = detect_text_encoding(path)
+
+        assert errors == 'strict'
+        assert path.read_bytes().decode(encoding) == "Name,City\nRené,Montréal\n"
+
+    def test_detect_low_confidence_uses_fallbacks(self, tmp_path):
+        """Test low-confidence detection falls through to the fallback encodings."""
+        path = tmp_path / 'bytes.csv'
+        path.write_bytes(b"Test content with problematic bytes: \xff\xfe")
+
+        with patch('cdflow_cli.utils.file_utils.chardet.detect') as mock_detect:
+            mock_detect.return_value = {'encoding': 'ascii', 'confidence': 0.3}
+            encoding, errors = detect_text_encoding(path)
+
+        assert (encoding, errors) == ('windows-1252', 'strict')
+
+    def test_detect_unknown_codec_skipped(self, tmp_path):
+        """Test an encoding name Python does not know is skipped."""
+        path = tmp_path / 'plain.csv'
+        path.write_text("plain,café\n", encoding='utf-8')
+
+        with patch('cdflow_cli.utils.file_utils.chardet.detect') as mock_detect:
+            mock_detect.return_value = {'encoding': 'not-a-codec', 'confidence': 0.99}
+            encoding, errors = detect_text_encoding(path)
+
+        assert (encoding, errors) == ('utf-8', 'strict')
+
+    def test_detect_nonexistent_file(self):
+        """Test behavior with non-existent file."""
+        with pytest.raises(FileNotFoundError):
+            detect_text_encoding(Path("/nonexistent/path/file.txt"))
+
+
 class TestNormalizeFileContent:
     """Test file content normalization functionality."""
     
@@ -176,7 +271,7 @@ class TestNormalizeFileContent:
         assert decoded == "Hello BOM world!"
         assert decoded[0] != '\ufeff'  # No BOM character at start
     
-    def test_normalize_with_null_bytes(self, caplog):
+    def test_normalize_with_null_bytes(self):
         """Test removal of null bytes from content."""
         content_with_nulls = "Hello\x00world\x00with\x00nulls".encode('utf-8')
         
@@ -186,8 +281,18 @@ class TestNormalizeFileContent:
         assert decoded == "Helloworldwithnulls"
         # Check that null bytes were actually removed
         assert "\x00" not in decoded
-        # Log message is debug level, might not appear in caplog
     
+    @pytest.mark.parametrize("content", [
+        b"\xef\xbb\xbfName,Amount\r\nJane\x00,100\n",
+        b"Name,City\nRen\xc3\xa9\x00,Montr\xc3\xa9al\n",
+        b"\xef\xbb\xbf\x00\xef\xbb\xbfmid-BOM \xff\xfe",
+    ])
+    def test_normalize_matches_decode_roundtrip(self, content):
+        """Test the default path matches decoding with utf-8-sig and re-encoding."""
+        expected = content.decode('utf-8-sig', errors='replace').replace('\x00', '').encode('utf-8')
+
+        assert normalize_file_content(content) == expected
+
     def test_normalize_different_encoding(self):
         """Test normalization with different source encoding."""
         # Create content in windows-1252 encoding
@@ -230,7 +335,7 @@ class TestNormalizeFileContent:
         assert "测试中文" in decoded
         assert len(decoded) > 10000  # Should preserve size
     
-    def test_normalize_exception_handling(self, caplog):
+    def test_normalize_exception_handling(self):
         """Test exception handling in content normalization."""
         # Test with invalid encoding parameter
         content = b"Test content"
@@ -273,20 +378,17 @@ class TestCleanedPhone:
         result = cleaned_phone(phone)
         assert result == "5551234567"
     
-    def test_clean_phone_various_formats(self):
+    @pytest.mark.parametrize("phone", [
+        "555.123.4567",
+        "555 123 4567",
+        "555-123-4567",
+        "(555)123-4567",
+        "555/123/4567",
+        "555_123_4567",
+    ])
+    def test_clean_phone_various_formats(self, phone):
         """Test cleaning various phone number formats."""
-        phone_formats = [
-            "555.123.4567",
-            "555 123 4567",
-            "555-123-4567",
-            "(555)123-4567",
-            "555/123/4567",
-            "555_123_4567"
-        ]
-        
-        for phone in phone_formats:
-            result = cleaned_phone(phone)
-            assert result == "5551234567", f"Failed for format: {phone}"
+        assert cleaned_phone(phone) == "5551234567"
     
     def test_clean_phone_with_extensions(self):
         """Test cleaning phone numbers with extensions."""
@@ -294,22 +396,16 @@ class TestCleanedPhone:
         result = cleaned_phone(phone)
         assert result == "5551234567123"  # Extension digits included
     
-    def test_clean_phone_international_format(self):
+    # These should not have country code removed (not 11 digits starting with 1)
+    @pytest.mark.parametrize("phone,expected", [
+        ("+44 20 7946 0958", "442079460958"),  # UK
+        ("+33 1 42 68 53 00", "33142685300"),  # France
+        ("+81 3 5224 5000", "81352245000"),  # Japan
+    ])
+    def test_clean_phone_international_format(self, phone, expected):
         """Test cleaning international format numbers."""
-        # These should not have country code removed (not 11 digits starting with 1)
-        international_phones = [
-            "+44 20 7946 0958",  # UK
-            "+33 1 42 68 53 00",  # France
-            "+81 3 5224 5000"    # Japan
-        ]
-        
-        for phone in international_phones:
-            result = cleaned_phone(phone)
-            # Should remove all non-digits but not strip leading digits
-            expected = ''.join(filter(str.isdigit, phone)).lstrip('0')
-            if expected.startswith('1') and len(expected) == 11:
-                expected = expected[1:]
-            assert result == expected
+        # Should remove all non-digits but not strip leading digits
+        assert cleaned_phone(phone) == expected
     
     def test_clean_empty_phone(self):
         """Test cleaning empty or whitespace-only phone."""
@@ -359,68 +455,48 @@ class TestCleanedPhone:
         # Unicode digits from different scripts
         phone = "５５５１２３４５６７"  # Full-width digits
         result = cleaned_phone(phone)
-        # Python's str.isdigit() actually does catch Unicode digits
-        assert result == "５５５１２３４５６７" or result == ""  # Depends on Python version
+        # str.isdigit() digits from any script are kept
+        assert result == "５５５１２３４５６７"
+        assert cleaned_phone("٥٥٥-١٢٣-٤٥٦٧") == "٥٥٥١٢٣٤٥٦٧"  # Arabic-Indic digits
 
 
 class TestFileUtilsIntegration:
     """Integration tests for file utilities working together."""
     
-    def test_read_and_normalize_workflow(self):
+    def test_read_and_normalize_workflow(self, bom_file):
         """Test complete workflow of reading and normalizing file content."""
-        # Create file with BOM and mixed content
-        content_with_bom = "\ufeffHello world with BOM and unicode: 测试中文\x00null"
-        
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False, 
-                                       encoding='utf-8-sig') as f:
-            temp_path = Path(f.name)
-            f.write(content_with_bom)
-        
-        try:
-            # Read file
-            read_content = safe_read_text_file(temp_path)
-            
-            # Normalize the bytes
-            content_bytes = read_content.encode('utf-8-sig')
-            normalized = normalize_file_content(content_bytes)
-            final_content = normalized.decode('utf-8')
-            
-            # Should have BOM removed and null bytes cleaned
-            assert "Hello world with BOM" in final_content
-            assert "测试中文" in final_content
-            assert "\x00" not in final_content
-            
-        finally:
-            if temp_path.exists():
-                temp_path.unlink()
-    
-    def test_error_resilience_integration(self):
+        # Read file with BOM and mixed content
+        read_content = safe_read_text_file(bom_file)
+        
+        # Normalize the bytes
+        content_bytes = read_content.encode('utf-8-sig')
+        normalized = normalize_file_content(content_bytes)
+        final_content = normalized.decode('utf-8')
+        
+        # Should have BOM removed and null bytes cleaned
+        assert "Hello world with BOM" in final_content
+        assert "测试中文" in final_content
+        assert "\x00" not in final_content
+    
+    @pytest.mark.parametrize("name,content", [
+        ('empty.txt', b""),
+        ('invalid-utf8.txt', b"\xff\xfe\xfd"),
+        ('nulls.txt', b"Valid\x00with\x00nulls"),
+        ('bom.txt', "\ufeffBOM content".encode('utf-8-sig')),
+    ])
+    def test_error_resilience_integration(self, text_files_dir, name, content):
         """Test that file utilities handle errors gracefully in integration."""
-        # Test with various problematic content
-        problematic_contents = [
-            b"",  # Empty
-            b"\xff\xfe\xfd",  # Invalid UTF-8
-            b"Valid\x00with\x00nulls",  # Null bytes
-            "\ufeffBOM content".encode('utf-8-sig'),  # BOM
-        ]
+        # All cases share the session directory instead of a tmpdir each
+        temp_path = text_files_dir / f'problematic-{name}'
+        temp_path.write_bytes(content)
         
-        for content in problematic_contents:
-            with tempfile.NamedTemporaryFile(mode='wb', suffix='.txt', delete=False) as f:
-                temp_path = Path(f.name)
-                f.write(content)
-            
-            try:
-                # Should handle all cases without crashing
-                read_content = safe_read_text_file(temp_path)
-                assert isinstance(read_content, str)
-                
-                # Normalize should also work
-                normalized = normalize_file_content(content)
-                assert isinstance(normalized, bytes)
-                
-            finally:
-                if temp_path.exists():
-                    temp_path.unlink()
+        # Should handle all cases without crashing
+        read_content = safe_read_text_file(temp_path)
+        assert isinstance(read_content, str)
+        
+        # Normalize should also work
+        normalized = normalize_file_content(content)
+        assert isinstance(normalized, bytes)
     
     def test_phone_cleaning_with_file_data(self):
         """Test phone cleaning with data that might come from files."""
@@ -433,40 +509,28 @@ class TestFileUtilsIntegration:
             "\t555-123-4567\t"   # With tabs
         ]
         
-        for phone_data in file_phone_data:
-            # Strip quotes and whitespace as file reading might require
-            cleaned_data = phone_data.strip(' "\n\r\t')
-            result = cleaned_phone(cleaned_data)
-            assert result == "5551234567", f"Failed for: {repr(phone_data)}"
+        # Strip quotes and whitespace as file reading might require
+        results = [cleaned_phone(phone_data.strip(' "\n\r\t')) for phone_data in file_phone_data]
+
+        assert results == ["5551234567"] * len(file_phone_data)
 
 
 class TestFileUtilsEdgeCases:
     """Test edge cases and missing coverage lines."""
     
-    def test_safe_read_final_fallback_line_coverage(self):
+    def test_safe_read_final_fallback_line_coverage(self, binary_junk_file):
         """Test the final fallback line that was missing coverage."""
-        # Create a file that will trigger all fallback paths
-        with tempfile.NamedTemporaryFile(mode='wb', suffix='.txt', delete=False) as f:
-            temp_path = Path(f.name)
-            # Write bytes that will cause encoding issues for all fallbacks
-            f.write(b'\x80\x81 problematic content')
-        
-        try:
-            # Mock chardet to fail
-            with patch('cdflow_cli.utils.file_utils.chardet.detect') as mock_detect:
-                mock_detect.side_effect = Exception("Detection failed")
-                
-                # Mock Path.read_text method to fail for fallback encodings
-                def mock_read_text(encoding=None, errors=None):
-                    if errors == 'replace':
-                        return "final fallback content"
-                    raise UnicodeDecodeError("test", b'\x80', 0, 1, "test error")
-                
-                with patch.object(Path, 'read_text', side_effect=mock_read_text):
-                    # This should trigger the final fallback line 54
-                    content = safe_read_text_file(temp_path)
-                    assert "final fallback content" in content
-                
-        finally:
-            if temp_path.exists():
-                temp_path.unlink()
\ No newline at end of file
+        # Mock chardet to fail
+        with patch('cdflow_cli.utils.file_utils.chardet.detect') as mock_detect:
+            mock_detect.side_effect = Exception("Detection failed")
+            
+            # Mock decoding to fail for fallback encodings
+            def mock_decode_text(data, encoding, errors="strict"):
+                if errors == 'replace':
+                    return "final fallback content"
+                raise UnicodeDecodeError("test", b'\x80', 0, 1, "test error")
+            
+            with patch('cdflow_cli.utils.file_utils._decode_text', side_effect=mock_decode_text):
+                # This should trigger the final fallback line
+                content = safe_read_text_file(binary_junk_file)
+                assert "final fallback content" in content
@@ -1,13 +1,16 @@
 import pytest
-import tempfile
 import logging
+import logging.handlers
 import os
 import sys
+import time
+from datetime import datetime
 from pathlib import Path
-from unittest.mock import patch, mock_open, MagicMock, Mock
+from unittest.mock import patch, Mock
 from io import StringIO
 
 # Import the logging utilities
+from cdflow_cli.utils import logging as logging_module
 from cdflow_cli.utils.logging import (
     ImportLoggingContext,
     LoggingProvider,
@@ -15,12 +18,32 @@ from cdflow_cli.utils.logging import (
     FileLoggingProvider,
     ConsoleLoggingProvider,
     PathsFileHandler,
+    RingHandler,
+    BufferedFileHandler,
+    SizeCappedFileHandler,
+    SecondCachedFormatter,
     get_logging_provider,
     NOTICE_LEVEL,
-    notice
 )
 
 
+def _make_record(name, level, msg):
+    """Build a log record for handle()/emit() from just the fields handlers use."""
+    return logging.makeLogRecord({
+        "name": name,
+        "levelno": level,
+        "levelname": logging.getLevelName(level),
+        "msg": msg,
+        "args": (),
+    })
+
+
+@pytest.fixture(scope='session')
+def shared_log_root(tmp_path_factory):
+    """Log directory shared by tests that construct providers but write no files."""
+    return str(tmp_path_factory.mktemp('logging_shared'))
+
+
 class TestCustomLogLevel:
     """Test custom NOTICE log level functionality."""
     
@@ -47,20 +70,89 @@ class TestCustomLogLevel:
         assert any(record.levelno == NOTICE_LEVEL for record in caplog.records)
         assert any("Test notice message" in record.message for record in caplog.records)
 
+    def test_notice_disabled_level_skips_log(self):
+        """Test that notice below the effective level returns without logging."""
+        logger = logging.getLogger("test_notice_disabled")
+        logger.setLevel(logging.ERROR)
+
+        with patch.object(logger, '_log') as mock_log:
+            logger.notice("Suppressed notice")
+            logger.notice("Suppressed again")
+
+        mock_log.assert_not_called()
+
+    def test_notice_respects_level_change(self, caplog):
+        """Test that a level change after a cached check is honoured."""
+        logger = logging.getLogger("test_notice_level_change")
+        logger.setLevel(logging.ERROR)
+        logger.notice("Suppressed notice")
+
+        logger.setLevel(logging.DEBUG)
+        with caplog.at_level(logging.DEBUG):
+            logger.notice("Visible notice")
+
+        assert [r.message for r in caplog.records] == ["Visible notice"]
+
+
+class TestSecondCachedFormatter:
+    """Test SecondCachedFormatter time formatting."""
+
+    def _record(self, created):
+        record = logging.LogRecord(
+            name="test", level=logging.INFO, pathname="", lineno=0,
+            msg="Timed", args=(), exc_info=None
+        )
+        record.created = created
+        record.msecs = (created - int(created)) * 1000
+        return record
+
+    @pytest.mark.parametrize("datefmt", [None, "%Y-%m-%d %H:%M"])
+    def test_matches_standard_formatter(self, datefmt):
+        """Test that output matches logging.Formatter for the same records."""
+        fmt = "%(asctime)s - %(message)s"
+        cached = SecondCachedFormatter(fmt, datefmt=datefmt)
+        standard = logging.Formatter(fmt, datefmt=datefmt)
+
+        for created in (1700000000.125, 1700000000.987, 1700000001.5, 1700000000.25):
+            record = self._record(created)
+            assert cached.format(record) == standard.format(record)
+
+    def test_formats_date_once_per_second(self):
+        """Test that strftime runs once for records in the same second."""
+        formatter = SecondCachedFormatter("%(asctime)s")
+
+        with patch('cdflow_cli.utils.logging.time.strftime', wraps=time.strftime) as mock_strftime:
+            formatter.format(self._record(1700000000.1))
+            formatter.format(self._record(1700000000.9))
+
+        mock_strftime.assert_called_once()
+
+
+class _StubProvider:
+    """Minimal logging provider used where no call recording is needed."""
+
+    def get_logger(self, name):
+        return logging.getLogger(name)
+
+    def configure_logging(self, *args, **kwargs):
+        return None
+
+    def shutdown(self):
+        pass
+
 
 class TestImportLoggingContext:
     """Test ImportLoggingContext for isolated logging operations."""
     
     @pytest.fixture
-    def temp_logging_dir(self):
+    def temp_logging_dir(self, tmp_path_factory):
         """Create a temporary directory for logging tests."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            yield Path(temp_dir)
+        return tmp_path_factory.mktemp("logs")
     
     @pytest.fixture
     def mock_logging_provider(self):
-        """Mock logging provider."""
-        return Mock()
+        """Stub logging provider."""
+        return _StubProvider()
     
     def test_init_import_logging_context(self, mock_logging_provider):
         """Test ImportLoggingContext initialization."""
@@ -72,8 +164,11 @@ class TestImportLoggingContext:
         assert context.import_root_logger is None
         assert context.redirected_loggers == {}
     
-    def test_enter_context_with_paths_system(self, mock_logging_provider, temp_logging_dir):
+    def test_enter_context_with_paths_system(self, mock_logging_provider, temp_logging_dir,
+                                             monkeypatch):
         """Test entering context when paths system is available."""
+        # Keep the ./storage_server/logs fallback directory out of the working tree
+        monkeypatch.chdir(temp_logging_dir)
         context = ImportLoggingContext(mock_logging_provider, "import.log")
         
         # Mock the paths import to avoid ImportError
@@ -105,6 +200,33 @@ class TestImportLoggingContext:
             assert context.import_root_logger is not None
             assert context.import_root_logger.name == "IMPORT_OPERATION"
     
+    @patch('os.makedirs')
+    def test_enter_context_probes_paths_once_per_provider(self, mock_makedirs,
+                                                          mock_logging_provider):
+        """Test that the paths system is probed once per provider, not per context entry."""
+        with patch('cdflow_cli.utils.paths.is_initialized', return_value=False) as mock_probe, \
+                patch('logging.FileHandler') as mock_handler:
+            mock_handler.return_value.level = 0
+            for _ in range(2):
+                context = ImportLoggingContext(mock_logging_provider, "import.log")
+                context.__enter__()
+                context.__exit__(None, None, None)
+
+            assert mock_probe.call_count == 1
+            assert mock_makedirs.call_count == 2
+
+    def test_provider_shutdown_forgets_import_log_dir(self, tmp_path):
+        """Test that shutting a provider down drops its cached import log directory."""
+        provider = ConsoleLoggingProvider()
+        with patch('cdflow_cli.utils.paths.is_initialized', return_value=True), \
+                patch('cdflow_cli.utils.paths.get_paths', return_value=Mock(logs=tmp_path)):
+            with ImportLoggingContext(provider, "import.log"):
+                pass
+
+        assert provider in logging_module._import_log_dirs
+        provider.shutdown()
+        assert provider not in logging_module._import_log_dirs
+
     def test_exit_context_cleanup(self, mock_logging_provider):
         """Test that context exit cleans up properly."""
         context = ImportLoggingContext(mock_logging_provider, "import.log")
@@ -131,6 +253,16 @@ class TestImportLoggingContext:
         # Should return a child logger of the import root logger
         assert logger.name.startswith("IMPORT_OPERATION")
 
+    def test_get_logger_keeps_level_caches(self, mock_logging_provider):
+        """Test that fetching an import logger again does not clear level caches."""
+        context = ImportLoggingContext(mock_logging_provider, "import.log")
+        context.import_root_logger = logging.getLogger("IMPORT_OPERATION")
+        logger = context.get_logger("cached_logger")
+        logger.isEnabledFor(logging.INFO)
+
+        assert context.get_logger("cached_logger") is logger
+        assert logging.INFO in logger._cache
+
 
 class TestLoggingProviderInterface:
     """Test the abstract LoggingProvider interface."""
@@ -161,15 +293,14 @@ class TestUnifiedLoggingProvider:
     """Test UnifiedLoggingProvider implementation."""
     
     @pytest.fixture
-    def temp_log_dir(self):
+    def temp_log_dir(self, tmp_path_factory):
         """Create temporary directory for logging tests."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            yield temp_dir
+        return str(tmp_path_factory.mktemp("logs"))
     
-    def test_init_unified_logging_provider(self, temp_log_dir):
+    def test_init_unified_logging_provider(self, shared_log_root):
         """Test UnifiedLoggingProvider initialization."""
         provider = UnifiedLoggingProvider(
-            base_path=temp_log_dir,
+            base_path=shared_log_root,
             console_level="INFO",
             file_level="DEBUG"
         )
@@ -187,6 +318,30 @@ class TestUnifiedLoggingProvider:
         # Directory should be created during initialization
         provider._ensure_log_directory()
         assert os.path.exists(log_dir)
+
+    def test_log_directory_recreated_after_removal(self, temp_log_dir):
+        """Test that a log directory removed while the provider is alive is created again."""
+        log_dir = os.path.join(temp_log_dir, "removed_logs")
+        provider = UnifiedLoggingProvider(base_path=log_dir, console_level="NONE")
+        os.rmdir(log_dir)
+
+        provider.configure_logging(log_filename="after_removal.log")
+        provider.shutdown()
+
+        assert os.path.exists(os.path.join(log_dir, "after_removal.log"))
+
+    def test_log_paths_join_resolved_base(self, temp_log_dir):
+        """Log files are placed under the base path resolved at init."""
+        provider = UnifiedLoggingProvider(base_path=temp_log_dir)
+
+        log_file = provider.configure_logging(
+            log_filename="nested/test.log",
+            log_level="INFO",
+            early_init=True,
+        )
+
+        assert log_file == os.path.join(temp_log_dir, "test.log")
+        provider.shutdown()
     
     def test_configure_logging_basic(self, temp_log_dir):
         """Test basic logging configuration."""
@@ -202,9 +357,9 @@ class TestUnifiedLoggingProvider:
         assert log_file.endswith("test.log")
         assert provider.log_file_path == log_file
     
-    def test_get_logger_caching(self, temp_log_dir):
+    def test_get_logger_caching(self, shared_log_root):
         """Test that loggers are cached properly."""
-        provider = UnifiedLoggingProvider(base_path=temp_log_dir)
+        provider = UnifiedLoggingProvider(base_path=shared_log_root)
         
         # Get same logger twice
         logger1 = provider.get_logger("test_logger")
@@ -213,7 +368,18 @@ class TestUnifiedLoggingProvider:
         # Should return the same instance
         assert logger1 is logger2
         assert "test_logger" in provider.loggers
-    
+
+    def test_get_logger_cache_hit_skips_logging_manager(self, shared_log_root):
+        """Test that a cached logger is returned without calling logging.getLogger."""
+        provider = UnifiedLoggingProvider(base_path=shared_log_root)
+        logger1 = provider.get_logger("test_logger")
+
+        with patch('cdflow_cli.utils.logging.logging.getLogger') as mock_get_logger:
+            logger2 = provider.get_logger("test_logger")
+
+        assert logger2 is logger1
+        mock_get_logger.assert_not_called()
+
     def test_initialize_bootstrap_logging(self, temp_log_dir):
         """Test bootstrap logging initialization."""
         provider = UnifiedLoggingProvider(base_path=temp_log_dir)
@@ -233,6 +399,25 @@ class TestUnifiedLoggingProvider:
         assert op_log is not None
         assert "IMP" in op_log
         assert "import_donations" in op_log
+
+    def test_create_operation_log_twice_replaces_handler(self, temp_log_dir):
+        """Test that re-creating the same operation log does not duplicate its handler."""
+        provider = UnifiedLoggingProvider(base_path=temp_log_dir, async_logging=False)
+        provider.configure_logging(log_filename="test.log", log_level="INFO")
+
+        fixed_now = datetime(2024, 1, 2, 3, 4, 5)
+        with patch("cdflow_cli.utils.logging.datetime") as mock_datetime:
+            mock_datetime.now.return_value = fixed_now
+            first_log = provider.create_operation_log("import_donations", prefix="IMP")
+            first_handler = provider.root_logger.handlers[-1]
+            second_log = provider.create_operation_log("import_donations", prefix="IMP")
+
+        assert first_log == second_log
+        targets = [getattr(h, "baseFilename", None) for h in provider.root_logger.handlers]
+        assert targets.count(os.path.abspath(first_log)) == 1
+        assert first_handler not in provider.root_logger.handlers
+        assert first_handler.stream is None or first_handler.stream.closed
+        provider.shutdown()
     
     def test_shutdown_closes_handlers(self, temp_log_dir):
         """Test that shutdown properly closes all handlers."""
@@ -251,24 +436,134 @@ class TestUnifiedLoggingProvider:
         # Verify handlers were removed
         assert len(provider.root_logger.handlers) == 0
 
+    def test_ring_size_keeps_low_records_in_memory_until_shutdown(self, temp_log_dir):
+        """Test that with ring_size only NOTICE+ is written live and the INFO tail on shutdown."""
+        provider = UnifiedLoggingProvider(
+            base_path=temp_log_dir, console_level="NONE", ring_size=2
+        )
+        log_file = provider.configure_logging(log_filename="ring.log", early_init=True)
+        logger = provider.get_logger("ring_test")
+        for i in range(3):
+            logger.info(f"info {i}")
+        logger.notice("notice record")
+
+        provider.flush()
+        content = Path(log_file).read_text(encoding="utf-8")
+        assert "notice record" in content
+        assert "info" not in content
+
+        provider.shutdown()
+        content = Path(log_file).read_text(encoding="utf-8")
+        assert "info 0" not in content
+        assert content.index("notice record") < content.index("info 1") < content.index("info 2")
+        assert content.count("notice record") == 1
+
+    def test_handlers_share_provider_formatters(self, temp_log_dir):
+        """Test that file handlers reuse one formatter instead of building one each."""
+        provider = UnifiedLoggingProvider(base_path=temp_log_dir, async_logging=False)
+        provider.configure_logging(log_filename="app.log")
+        provider.create_operation_log("shared", prefix="OP")
+
+        console_handler, app_handler, op_handler = provider.root_logger.handlers
+        assert app_handler.formatter is op_handler.formatter
+        assert isinstance(app_handler.formatter, SecondCachedFormatter)
+        assert console_handler.formatter is not app_handler.formatter
+        provider.shutdown()
+
+        other = UnifiedLoggingProvider(base_path=temp_log_dir, async_logging=False)
+        other.configure_logging()
+        assert other.root_logger.handlers[0].formatter is console_handler.formatter
+        other.shutdown()
+
+    def test_shutdown_flushes_every_handler_before_closing(self, temp_log_dir):
+        """Test that shutdown writes out all buffered log files before closing them."""
+        provider = UnifiedLoggingProvider(
+            base_path=temp_log_dir, console_level="NONE", async_logging=False
+        )
+        app_log = provider.configure_logging(log_filename="app.log", early_init=True)
+        op_log = provider.create_operation_log("sync", prefix="OP")
+        provider.get_logger("shutdown_test").info("Buffered until shutdown")
+
+        handlers = provider.root_logger.handlers[:]
+        assert len(handlers) == 2
+        with patch.object(UnifiedLoggingProvider, "_flush_handler",
+                          wraps=UnifiedLoggingProvider._flush_handler) as mock_flush:
+            provider.shutdown()
+
+        assert sorted(map(id, (c.args[0] for c in mock_flush.call_args_list))) == \
+            sorted(map(id, handlers))
+        assert provider.root_logger.handlers == []
+        assert "Buffered until shutdown" in Path(app_log).read_text(encoding="utf-8")
+        assert "Buffered until shutdown" in Path(op_log).read_text(encoding="utf-8")
+
+    def test_reconfigure_writes_out_buffered_records(self, temp_log_dir, monkeypatch):
+        """Test reconfiguring with the same log file keeps records buffered before it."""
+        monkeypatch.setattr('cdflow_cli.utils.paths.is_initialized', lambda: True)
+        monkeypatch.setattr('cdflow_cli.utils.paths.get_paths',
+                            lambda: Mock(logs=Path(temp_log_dir)))
+        provider = UnifiedLoggingProvider(console_level="NONE")
+        log_file = provider.configure_logging(log_filename="import.log", early_init=True)
+        first_handler = provider.root_logger.handlers[0]
+        assert isinstance(first_handler, PathsFileHandler)
+
+        logger = provider.get_logger("reconfigure_test")
+        logger.info("Info before reconfigure")
+        logger.debug("Debug before reconfigure")
+        provider.configure_logging(log_filename="import.log")
+        logger.info("Info after reconfigure")
+        provider.shutdown()
+
+        content = Path(log_file).read_text(encoding="utf-8")
+        assert "Info before reconfigure" in content
+        assert "Debug before reconfigure" in content
+        assert "Info after reconfigure" in content
+        assert first_handler._fd is None
+
+    def test_async_logging_writes_through_queue(self, temp_log_dir):
+        """Test that file records go through a queue listener and reach the file on flush."""
+        provider = UnifiedLoggingProvider(
+            base_path=temp_log_dir, console_level="NONE", async_logging=True
+        )
+        provider.configure_logging(log_filename="async.log")
+
+        assert any(isinstance(h, logging.handlers.QueueHandler)
+                   for h in provider.root_logger.handlers)
+
+        provider.get_logger("async_test").info("Queued message")
+        provider.flush()
+
+        with open(os.path.join(temp_log_dir, "async.log")) as f:
+            assert "Queued message" in f.read()
+
+        provider.shutdown()
+        assert provider._listener is None
+
+    def test_sync_logging_attaches_file_handler(self, temp_log_dir):
+        """Test that file handlers are attached directly unless async_logging is requested."""
+        provider = UnifiedLoggingProvider(base_path=temp_log_dir, console_level="NONE")
+        provider.configure_logging(log_filename="sync.log")
+
+        assert provider._listener is None
+        assert any(isinstance(h, BufferedFileHandler) for h in provider.root_logger.handlers)
+        provider.shutdown()
+
 
 class TestFileLoggingProvider:
     """Test FileLoggingProvider implementation."""
     
     @pytest.fixture
-    def temp_log_dir(self):
+    def temp_log_dir(self, tmp_path_factory):
         """Create temporary directory for logging tests."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            yield temp_dir
+        return str(tmp_path_factory.mktemp("logs"))
     
-    def test_file_logging_provider_init(self, temp_log_dir):
+    def test_file_logging_provider_init(self, shared_log_root):
         """Test FileLoggingProvider initialization."""
         provider = FileLoggingProvider(
-            base_path=temp_log_dir,
+            base_path=shared_log_root,
             console_level="WARNING"
         )
         
-        assert provider.base_path == temp_log_dir
+        assert provider.base_path == shared_log_root
         assert provider.console_level == "WARNING"
         assert provider.current_log_file is None
     
@@ -296,9 +591,8 @@ class TestFileLoggingProvider:
         test_message = "Test log message for file writing"
         logger.info(test_message)
         
-        # Force handler to flush
-        for handler in logger.handlers:
-            handler.flush()
+        # Flush and close the buffered file handler
+        provider.shutdown()
         
         # Verify the message was written to file
         assert os.path.exists(log_file)
@@ -307,6 +601,141 @@ class TestFileLoggingProvider:
             assert test_message in content
 
 
+class TestBufferedFileHandler:
+    """Test BufferedFileHandler implementation."""
+
+    def _record(self, msg):
+        return logging.LogRecord(
+            name="test", level=logging.INFO, pathname="", lineno=0,
+            msg=msg, args=(), exc_info=None
+        )
+
+    def test_records_buffered_until_flush(self, tmp_path):
+        """Test that emitted records reach the file on flush, not on every emit."""
+        log_path = tmp_path / 'buffered.log'
+        handler = BufferedFileHandler(log_path)
+        handler.setFormatter(logging.Formatter("%(message)s"))
+
+        handler.emit(self._record("Buffered message"))
+        assert log_path.read_text() == ""
+
+        handler.flush()
+        assert log_path.read_text() == "Buffered message\n"
+        handler.close()
+
+    def test_error_records_written_without_flush(self, tmp_path):
+        """Test that an ERROR record is on disk before any explicit flush."""
+        log_path = tmp_path / 'errors.log'
+        handler = BufferedFileHandler(log_path)
+        handler.setFormatter(logging.Formatter("%(message)s"))
+
+        handler.emit(self._record("Buffered info"))
+        handler.emit(_make_record("test", logging.ERROR, "Immediate error"))
+
+        assert log_path.read_text() == "Buffered info\nImmediate error\n"
+        handler.close()
+
+    def test_close_flushes_records(self, tmp_path):
+        """Test that closing the handler writes out buffered records."""
+        log_path = tmp_path / 'closed.log'
+        handler = BufferedFileHandler(log_path)
+        handler.setFormatter(logging.Formatter("%(message)s"))
+
+        handler.emit(self._record("Message before close"))
+        handler.close()
+
+        assert log_path.read_text() == "Message before close\n"
+        assert handler.stream is None
+
+    def test_flush_interval_flushes_in_background(self, tmp_path):
+        """Test that a flush interval writes records out without an explicit flush."""
+        log_path = tmp_path / 'interval.log'
+        handler = BufferedFileHandler(log_path, flush_interval=0.01)
+        handler.setFormatter(logging.Formatter("%(message)s"))
+
+        handler.emit(self._record("Timed message"))
+        try:
+            deadline = time.monotonic() + 5
+            while "Timed message" not in log_path.read_text() and time.monotonic() < deadline:
+                time.sleep(0.01)
+            assert log_path.read_text() == "Timed message\n"
+        finally:
+            handler.close()
+        assert handler._flush_timer is None
+
+
+class TestRingHandler:
+    """Test the bounded in-memory RingHandler."""
+
+    def test_keeps_most_recent_records_and_dumps_on_close(self, tmp_path):
+        """Test that only the newest records are kept and written in one go on close."""
+        dump_path = tmp_path / "ring.log"
+        handler = RingHandler(capacity=2, dump_path=dump_path)
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        for message in ("first", "second", "third"):
+            handler.handle(_make_record("ring", logging.INFO, message))
+
+        assert [r.getMessage() for r in handler.buffer] == ["second", "third"]
+        assert not dump_path.exists()
+
+        handler.close()
+        assert dump_path.read_text(encoding="utf-8").splitlines()[1:] == ["second", "third"]
+        assert len(handler.buffer) == 0
+
+    def test_close_without_dump_path_discards_records(self):
+        """Test that a ring without a dump path just drops its records."""
+        handler = RingHandler(capacity=2)
+        handler.handle(_make_record("ring", logging.INFO, "dropped"))
+        handler.close()
+        assert len(handler.buffer) == 1
+
+
+class TestSizeCappedFileHandler:
+    """Test SizeCappedFileHandler implementation."""
+
+    def _record(self, msg):
+        return logging.LogRecord(
+            name="test", level=logging.INFO, pathname="", lineno=0,
+            msg=msg, args=(), exc_info=None
+        )
+
+    def test_rolls_over_at_max_bytes(self, tmp_path):
+        """Test that the log rolls over once the file reaches maxBytes."""
+        log_path = tmp_path / 'capped.log'
+        handler = SizeCappedFileHandler(log_path, maxBytes=20, backupCount=1)
+        handler.setFormatter(logging.Formatter("%(message)s"))
+
+        handler.emit(self._record("first message here!"))
+        handler.emit(self._record("second message"))
+        handler.close()
+
+        assert (tmp_path / 'capped.log.1').read_text() == "first message here!\n"
+        assert log_path.read_text() == "second message\n"
+
+    def test_formats_each_record_once(self, tmp_path):
+        """Test that checking for rollover does not format the record."""
+        handler = SizeCappedFileHandler(tmp_path / 'once.log', maxBytes=1024, backupCount=1)
+        formatter = logging.Formatter("%(message)s")
+        handler.setFormatter(formatter)
+
+        with patch.object(formatter, 'format', wraps=formatter.format) as mock_format:
+            handler.emit(self._record("Formatted once"))
+        handler.close()
+
+        mock_format.assert_called_once()
+
+    def test_file_provider_uses_handler_with_max_bytes(self, tmp_path):
+        """Test that FileLoggingProvider rotates the application log when max_bytes is set."""
+        provider = FileLoggingProvider(base_path=str(tmp_path), max_bytes=1024)
+        provider.configure_logging(log_level="DEBUG", log_filename="rotating.log")
+
+        try:
+            assert any(isinstance(h, SizeCappedFileHandler)
+                       for h in provider.root_logger.handlers)
+        finally:
+            provider.shutdown()
+
+
 class TestConsoleLoggingProvider:
     """Test ConsoleLoggingProvider implementation."""
     
@@ -328,18 +757,21 @@ class TestConsoleLoggingProvider:
         assert provider.current_log_file is None
     
     def test_console_logging_captures_output(self, capfd):
-        """Test that console logging actually outputs to console."""
+        """Test that console logging outputs records at the console level to the console."""
         provider = ConsoleLoggingProvider(console_level="INFO")
-        provider.configure_logging(log_level="INFO")
+        provider.configure_logging(log_level="DEBUG")
         
         logger = provider.get_logger("console_test")
         test_message = "Test console output message"
         logger.info(test_message)
+        logger.debug("Below console level")
+        provider.shutdown()
         
         # Capture console output
         captured = capfd.readouterr()
         # Note: May appear in stdout or stderr depending on handler configuration
         assert test_message in captured.out or test_message in captured.err
+        assert "Below console level" not in captured.out + captured.err
     
     def test_console_bootstrap_and_transition(self):
         """Test bootstrap logging and transition for console provider."""
@@ -351,19 +783,28 @@ class TestConsoleLoggingProvider:
         transition_file = provider.transition_to_application_logging("", "app.log")
         assert transition_file == "app.log"  # Console provider returns app_log_path
 
+    def test_console_handler_writes_to_stderr(self):
+        """Test that console records go straight to sys.stderr."""
+        fake_stderr = StringIO()
+        with patch.object(sys, "stderr", fake_stderr):
+            provider = ConsoleLoggingProvider(console_level="INFO")
+            provider.configure_logging(log_level="INFO")
+
+            assert provider.root_logger.handlers[0].stream is fake_stderr
+            provider.get_logger("console_test").info("stderr line")
+            assert "stderr line" in fake_stderr.getvalue()
+            provider.shutdown()
+
 
 class TestPathsFileHandler:
     """Test PathsFileHandler implementation."""
     
     @pytest.fixture
-    def temp_log_file(self):
+    def temp_log_file(self, tmp_path):
         """Create temporary log file for testing."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.log', delete=False) as f:
-            temp_path = Path(f.name)
-        yield temp_path
-        # Cleanup
-        if temp_path.exists():
-            temp_path.unlink()
+        temp_path = tmp_path / 'test.log'
+        temp_path.touch()
+        return temp_path
     
     def test_paths_file_handler_init(self, temp_log_file):
         """Test PathsFileHandler initialization."""
@@ -373,12 +814,10 @@ class TestPathsFileHandler:
         assert handler.mode == "w"
         handler.close()
     
-    def test_paths_file_handler_emit_creates_file(self, temp_log_file):
+    def test_paths_file_handler_emit_creates_file(self, tmp_path):
         """Test that PathsFileHandler creates and writes to files."""
-        # Remove the file if it exists
-        if temp_log_file.exists():
-            temp_log_file.unlink()
-        
+        temp_log_file = tmp_path / 'created.log'
+
         handler = PathsFileHandler(temp_log_file, mode="w")
         handler.setFormatter(logging.Formatter("%(message)s"))
         
@@ -402,6 +841,69 @@ class TestPathsFileHandler:
         content = temp_log_file.read_text()
         assert "Test message for PathsFileHandler" in content
     
+    def test_paths_file_handler_buffers_until_flush(self, temp_log_file):
+        """Test that records are held in memory until flush or a full buffer."""
+        handler = PathsFileHandler(temp_log_file, buffer_size=64)
+        handler.setFormatter(logging.Formatter("%(message)s"))
+
+        handler.handle(_make_record("test", logging.INFO, "first"))
+        assert temp_log_file.read_text() == ""
+
+        handler.flush()
+        assert temp_log_file.read_text() == "first\n"
+
+        handler.handle(_make_record("test", logging.INFO, "x" * 70))
+        assert temp_log_file.read_text() == "first\n" + "x" * 70 + "\n"
+        handler.close()
+
+    def test_paths_file_handler_creates_file_on_init(self, tmp_path):
+        """Test that the log file exists before anything is written to it."""
+        log_file = tmp_path / 'eager.log'
+
+        handler = PathsFileHandler(log_file)
+
+        assert log_file.exists()
+        handler.close()
+
+    def test_paths_file_handler_writes_notice_and_above_immediately(self, temp_log_file):
+        """Test that NOTICE and higher records are written without waiting for the buffer."""
+        handler = PathsFileHandler(temp_log_file)
+        handler.setFormatter(logging.Formatter("%(message)s"))
+
+        handler.handle(_make_record("test", logging.INFO, "buffered"))
+        handler.handle(_make_record("test", logging.ERROR, "failed"))
+
+        assert temp_log_file.read_text() == "buffered\nfailed\n"
+        handler.close()
+
+    def test_paths_file_handler_periodic_flush(self, temp_log_file):
+        """Test that flush_interval writes buffered records from a background timer."""
+        handler = PathsFileHandler(temp_log_file, flush_interval=0.01)
+        handler.setFormatter(logging.Formatter("%(message)s"))
+
+        handler.handle(_make_record("test", logging.INFO, "timed"))
+        deadline = time.monotonic() + 5
+        while temp_log_file.read_text() != "timed\n" and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert temp_log_file.read_text() == "timed\n"
+        handler.close()
+        assert handler._flush_timer is None
+
+    def test_paths_file_handler_write_mode_truncates(self, temp_log_file):
+        """Test that mode 'w' replaces existing content while 'a' appends to it."""
+        temp_log_file.write_text("old content\n")
+
+        handler = PathsFileHandler(temp_log_file, mode="a")
+        handler.handle(_make_record("test", logging.INFO, "appended"))
+        handler.close()
+        assert temp_log_file.read_text() == "old content\nappended\n"
+
+        handler = PathsFileHandler(temp_log_file, mode="w")
+        handler.handle(_make_record("test", logging.INFO, "replaced"))
+        handler.close()
+        assert temp_log_file.read_text() == "replaced\n"
+
     def test_paths_file_handler_error_handling(self, temp_log_dir):
         """Test PathsFileHandler handles file system errors gracefully."""
         # Try to write to a directory that doesn't exist
@@ -426,12 +928,11 @@ class TestPathsFileHandler:
             handler.close()
         except Exception as e:
             pytest.fail(f"PathsFileHandler should handle file system errors gracefully: {e}")
-    
+
     @pytest.fixture
-    def temp_log_dir(self):
+    def temp_log_dir(self, tmp_path_factory):
         """Create temporary directory for logging tests."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            yield temp_dir
+        return str(tmp_path_factory.mktemp("logs"))
 
 
 class TestLoggingProviderFactory:
@@ -497,13 +998,14 @@ class TestLoggingIntegration:
     """Integration tests for logging system."""
     
     @pytest.fixture
-    def temp_log_dir(self):
+    def temp_log_dir(self, tmp_path_factory):
         """Create temporary directory for integration tests."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            yield temp_dir
+        return str(tmp_path_factory.mktemp("logs"))
     
-    def test_full_logging_workflow(self, temp_log_dir):
+    def test_full_logging_workflow(self, temp_log_dir, monkeypatch):
         """Test complete logging workflow from bootstrap to shutdown."""
+        # The transition writes its application log relative to the cwd
+        monkeypatch.chdir(temp_log_dir)
         provider = UnifiedLoggingProvider(base_path=temp_log_dir)
         
         # 1. Initialize bootstrap logging
@@ -537,8 +1039,10 @@ class TestLoggingIntegration:
         assert os.path.exists(app_file)
         assert os.path.exists(op_file)
     
-    def test_logging_context_isolation(self, temp_log_dir):
+    def test_logging_context_isolation(self, temp_log_dir, monkeypatch):
         """Test that ImportLoggingContext properly isolates logging."""
+        # Without the paths system, import logs fall back to ./storage_server/logs
+        monkeypatch.chdir(temp_log_dir)
         provider = UnifiedLoggingProvider(base_path=temp_log_dir)
         
         # Set up main application logging
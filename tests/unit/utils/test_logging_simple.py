@@ -1,9 +1,7 @@
 import pytest
-import tempfile
 import logging
 import os
-from pathlib import Path
-from unittest.mock import patch, Mock
+import threading
 
 
 @pytest.fixture(autouse=True)
@@ -24,7 +22,6 @@ from cdflow_cli.utils.logging import (
     PathsFileHandler,
     get_logging_provider,
     NOTICE_LEVEL,
-    notice
 )
 
 
@@ -41,19 +38,14 @@ class TestBasicLoggingFunctionality:
         logger = logging.getLogger("test_notice")
         assert hasattr(logger, 'notice')
     
-    def test_paths_file_handler_basic(self):
+    def test_paths_file_handler_basic(self, tmp_path):
         """Test basic PathsFileHandler functionality."""
-        with tempfile.NamedTemporaryFile(suffix='.log', delete=False) as f:
-            temp_path = Path(f.name)
-        
-        try:
-            handler = PathsFileHandler(temp_path, mode="w")
-            assert handler.log_path == temp_path
-            assert handler.mode == "w"
-            handler.close()
-        finally:
-            if temp_path.exists():
-                temp_path.unlink()
+        temp_path = tmp_path / 'basic.log'
+
+        handler = PathsFileHandler(temp_path, mode="w")
+        assert handler.log_path == temp_path
+        assert handler.mode == "w"
+        handler.close()
     
     def test_get_logging_provider_factory(self):
         """Test the factory function with minimal config."""
@@ -67,10 +59,9 @@ class TestBasicLoggingFunctionality:
         assert isinstance(provider, UnifiedLoggingProvider)
     
     @pytest.fixture
-    def temp_log_dir(self):
+    def temp_log_dir(self, tmp_path_factory):
         """Create temporary directory for logging tests."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            yield temp_dir
+        return str(tmp_path_factory.mktemp("logs"))
     
     def test_unified_logging_provider_basic_init(self, temp_log_dir):
         """Test UnifiedLoggingProvider basic initialization."""
@@ -92,16 +83,6 @@ class TestBasicLoggingFunctionality:
         assert isinstance(logger, logging.Logger)
         assert logger.name == "test_logger"
     
-    def test_unified_provider_bootstrap_logging(self, temp_log_dir):
-        """Test bootstrap logging initialization."""
-        provider = UnifiedLoggingProvider(base_path=temp_log_dir)
-        
-        bootstrap_file = provider.initialize_bootstrap_logging()
-        assert isinstance(bootstrap_file, str)
-        assert "BOOTSTRAP" in bootstrap_file
-        # File should be created
-        assert os.path.exists(bootstrap_file)
-    
     def test_unified_provider_operation_log(self, temp_log_dir):
         """Test operation log creation."""
         provider = UnifiedLoggingProvider(base_path=temp_log_dir)
@@ -136,68 +117,76 @@ class TestBasicLoggingFunctionality:
         bootstrap_result = provider.initialize_bootstrap_logging()
         assert bootstrap_result == ""  # Console doesn't create files
     
-    def test_paths_file_handler_emit(self):
+    def test_paths_file_handler_emit(self, tmp_path):
         """Test PathsFileHandler emit functionality."""
-        with tempfile.NamedTemporaryFile(suffix='.log', delete=False) as f:
-            temp_path = Path(f.name)
+        temp_path = tmp_path / 'emit.log'
+
+        handler = PathsFileHandler(temp_path, mode="w")
+        handler.setFormatter(logging.Formatter("%(message)s"))
         
-        try:
-            handler = PathsFileHandler(temp_path, mode="w")
-            handler.setFormatter(logging.Formatter("%(message)s"))
-            
-            # Create a test record
-            record = logging.LogRecord(
-                name="test",
-                level=logging.INFO,
-                pathname="",
-                lineno=0,
-                msg="Test message",
-                args=(),
-                exc_info=None
-            )
-            
-            # Should not raise exception
-            handler.emit(record)
-            handler.close()
-            
-            # Verify file contains message
-            if temp_path.exists():
-                content = temp_path.read_text()
-                assert "Test message" in content
-                
-        finally:
-            if temp_path.exists():
-                temp_path.unlink()
+        # Create a test record from just the fields the handler uses
+        record = logging.makeLogRecord({
+            "name": "test",
+            "levelno": logging.INFO,
+            "levelname": "INFO",
+            "msg": "Test message",
+            "args": (),
+        })
+        
+        # Should not raise exception; the file exists but the record stays
+        # in the handler's in-memory buffer until it fills or is flushed
+        handler.emit(record)
+        assert bytes(handler._buffer) == b"Test message\n"
+        assert temp_path.read_text() == ""
+        handler.close()
+        assert temp_path.read_text() == "Test message\n"
 
 
 class TestLoggingProviderIntegration:
     """Test integration scenarios for logging providers."""
     
     @pytest.fixture
-    def temp_log_dir(self):
+    def temp_log_dir(self, tmp_path_factory):
         """Create temporary directory for integration tests."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            yield temp_dir
-    
-    def test_complete_logging_workflow(self, temp_log_dir):
-        """Test a complete logging workflow."""
-        # Create provider
-        provider = UnifiedLoggingProvider(base_path=temp_log_dir)
-        
-        # Initialize bootstrap
+        return str(tmp_path_factory.mktemp("logs"))
+
+    @pytest.fixture(scope="class")
+    def lifecycle(self, tmp_path_factory):
+        """Run one bootstrap -> log -> operation log -> shutdown cycle and record the outcome."""
+        provider = UnifiedLoggingProvider(base_path=str(tmp_path_factory.mktemp("lifecycle")))
+
         bootstrap_file = provider.initialize_bootstrap_logging()
-        assert os.path.exists(bootstrap_file)
-        
-        # Get logger and log message
-        logger = provider.get_logger("workflow_test")
-        logger.info("Test workflow message")
-        
-        # Create operation log
-        op_file = provider.create_operation_log("test_op")
-        assert isinstance(op_file, str)
-        
-        # Shutdown should not raise
-        provider.shutdown()
+        outcome = {
+            "bootstrap_file": bootstrap_file,
+            "bootstrap_created": os.path.exists(bootstrap_file),
+        }
+
+        for name in ("lifecycle_test_1", "lifecycle_test_2"):
+            provider.get_logger(name).info(f"Test message from {name}")
+
+        outcome["op_file"] = provider.create_operation_log("lifecycle_test")
+        try:
+            provider.shutdown()
+            outcome["shutdown_error"] = None
+        except Exception as e:
+            outcome["shutdown_error"] = e
+        return outcome
+
+    @pytest.mark.parametrize("step", ["bootstrap", "operation_log", "shutdown"])
+    def test_unified_provider_lifecycle(self, lifecycle, step):
+        """Test bootstrap, operation logging and cleanup of a single provider lifecycle."""
+        if step == "bootstrap":
+            assert isinstance(lifecycle["bootstrap_file"], str)
+            assert "BOOTSTRAP" in lifecycle["bootstrap_file"]
+            assert lifecycle["bootstrap_created"]
+        elif step == "operation_log":
+            assert isinstance(lifecycle["op_file"], str)
+            assert "lifecycle_test" in lifecycle["op_file"]
+        else:
+            assert lifecycle["shutdown_error"] is None
+            # Files should still exist after shutdown (they're just closed)
+            assert os.path.exists(lifecycle["bootstrap_file"])
+            assert os.path.exists(lifecycle["op_file"])
     
     def test_error_resilience(self, temp_log_dir):
         """Test that logging system handles errors gracefully."""
@@ -223,25 +212,19 @@ class TestLoggingSecurityAndReliability:
     """Test security and reliability aspects of logging system."""
     
     @pytest.fixture
-    def temp_log_dir(self):
+    def temp_log_dir(self, tmp_path_factory):
         """Create temporary directory for security tests."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            yield temp_dir
+        return str(tmp_path_factory.mktemp("logs"))
     
-    def test_log_directory_creation_security(self):
+    def test_log_directory_creation_security(self, tmp_path):
         """Test that log directory creation is secure."""
-        # Test with safe path
-        safe_path = "./test_logs_safe"
+        # Test with safe path, private to this test so parallel workers never share it
+        safe_path = str(tmp_path / "test_logs_safe")
         provider = UnifiedLoggingProvider(base_path=safe_path)
         
         # Should create directory safely
         bootstrap_file = provider.initialize_bootstrap_logging()
         assert isinstance(bootstrap_file, str)
-        
-        # Clean up
-        import shutil
-        if os.path.exists(safe_path):
-            shutil.rmtree(safe_path)
     
     def test_logging_with_special_characters(self, temp_log_dir):
         """Test logging with special characters and unicode."""
@@ -257,26 +240,25 @@ class TestLoggingSecurityAndReliability:
         ]
         
         # Should handle all message types without errors
-        for msg in test_messages:
-            try:
+        try:
+            for msg in test_messages:
                 logger.info(msg)
-            except Exception as e:
-                pytest.fail(f"Should handle unicode/special chars: {e}")
+        except Exception as e:
+            pytest.fail(f"Should handle unicode/special chars: {e}")
     
     def test_concurrent_logging_basic(self, temp_log_dir):
         """Test basic thread safety of logging system."""
-        import threading
-        import time
-        
         provider = UnifiedLoggingProvider(base_path=temp_log_dir)
         logger = provider.get_logger("concurrent_test")
         errors = []
+        # Release all workers together so their handler calls actually overlap
+        start = threading.Barrier(3)
         
         def log_worker(worker_id):
             try:
+                start.wait()
                 for i in range(5):
                     logger.info(f"Worker {worker_id} message {i}")
-                    time.sleep(0.001)
             except Exception as e:
                 errors.append(str(e))
         
@@ -289,28 +271,3 @@ class TestLoggingSecurityAndReliability:
         
         # Should have no errors
         assert len(errors) == 0, f"Concurrent logging errors: {errors}"
-    
-    def test_logging_resource_cleanup(self, temp_log_dir):
-        """Test that logging resources are cleaned up properly."""
-        provider = UnifiedLoggingProvider(base_path=temp_log_dir)
-        
-        # Create some loggers and files
-        logger1 = provider.get_logger("cleanup_test_1")
-        logger2 = provider.get_logger("cleanup_test_2")
-        
-        bootstrap_file = provider.initialize_bootstrap_logging()
-        op_file = provider.create_operation_log("cleanup_test")
-        
-        # Log some messages
-        logger1.info("Test message 1")
-        logger2.info("Test message 2")
-        
-        # Shutdown should clean up resources
-        try:
-            provider.shutdown()
-        except Exception as e:
-            pytest.fail(f"Shutdown should not raise exceptions: {e}")
-        
-        # Files should still exist after shutdown (they're just closed)
-        assert os.path.exists(bootstrap_file)
-        assert os.path.exists(op_file)
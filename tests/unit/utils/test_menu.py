@@ -8,10 +8,11 @@ Tests cover menu display, keyboard navigation, file selection,
 and user input validation scenarios.
 """
 
+import builtins
 import os
-import tempfile
 from pathlib import Path
-from unittest.mock import Mock, patch, MagicMock
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
 import pytest
 
 from cdflow_cli.utils.menu import TerminalMenu, FileSelectionMenu
@@ -30,6 +31,8 @@ class _NullContext:
 class FakeKey:
     """Lightweight keystroke double that behaves like blessed.keyboard.Keystroke."""
 
+    __slots__ = ("code", "_text")
+
     def __init__(self, code=None, text=""):
         self.code = code
         self._text = text
@@ -45,22 +48,97 @@ class FakeKey:
         return f"FakeKey(code={self.code!r}, text={self._text!r})"
 
 
-def _make_terminal_double():
-    """Create a blessed.Terminal double with callable attributes."""
-    terminal = MagicMock()
-    terminal.home = ""
-    terminal.clear = ""
-    terminal.bold_underline.side_effect = lambda x: f"BOLD_UNDERLINE({x})"
-    terminal.reverse.side_effect = lambda x: f"REVERSE({x})"
-    terminal.move_xy.side_effect = lambda x, y: f"MOVE({x},{y})"
-    terminal.cbreak.return_value = _NullContext()
-    terminal.hidden_cursor.return_value = _NullContext()
-    terminal.KEY_UP = "KEY_UP"
-    terminal.KEY_DOWN = "KEY_DOWN"
-    terminal.KEY_ENTER = "KEY_ENTER"
-    terminal.KEY_ESCAPE = "KEY_ESCAPE"
-    terminal.inkey = MagicMock()
-    return terminal
+# Keystrokes are never mutated, so tests share these instances
+K_UP = FakeKey(code="KEY_UP")
+K_DOWN = FakeKey(code="KEY_DOWN")
+K_ENTER = FakeKey(code="KEY_ENTER")
+K_ESC = FakeKey(code="KEY_ESCAPE")
+K_Q = FakeKey(text="q")
+
+
+class _Inkey:
+    """Keystroke source for the terminal double, configured like a mock.
+
+    Keys come from ``side_effect`` when it is set, otherwise ``return_value``
+    is returned on every call.
+    """
+
+    def __init__(self):
+        self.return_value = None
+        self._keys = None
+
+    @property
+    def side_effect(self):
+        return self._keys
+
+    @side_effect.setter
+    def side_effect(self, keys):
+        self._keys = iter(keys)
+
+    def __call__(self, *args, **kwargs):
+        if self._keys is not None:
+            return next(self._keys)
+        return self.return_value
+
+
+class _TerminalDouble:
+    """Plain blessed.Terminal double; cheaper than a MagicMock in menu loops."""
+
+    home = ""
+    clear = ""
+    KEY_UP = "KEY_UP"
+    KEY_DOWN = "KEY_DOWN"
+    KEY_ENTER = "KEY_ENTER"
+    KEY_ESCAPE = "KEY_ESCAPE"
+
+    def __init__(self):
+        self.inkey = _Inkey()
+
+    def bold_underline(self, text):
+        return f"BOLD_UNDERLINE({text})"
+
+    def reverse(self, text):
+        return f"REVERSE({text})"
+
+    def move_xy(self, x, y):
+        return f"MOVE({x},{y})"
+
+    def cbreak(self):
+        return _NullContext()
+
+    def hidden_cursor(self):
+        return _NullContext()
+
+
+class _PrintSpy:
+    """Stand-in for print that only counts calls and keeps the last one."""
+
+    def __init__(self):
+        self.call_count = 0
+        self.last = None
+
+    def __call__(self, *args, **kwargs):
+        self.call_count += 1
+        self.last = (args, kwargs)
+
+    @property
+    def called(self):
+        return self.call_count > 0
+
+
+@pytest.fixture
+def print_spy(monkeypatch):
+    """Replace print with a _PrintSpy for the duration of a test."""
+    spy = _PrintSpy()
+    monkeypatch.setattr(builtins, "print", spy)
+    return spy
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _patch_blessed():
+    """Patch blessed.Terminal once per module so menus are built against test doubles."""
+    with patch('cdflow_cli.utils.menu.blessed.Terminal') as terminal_cls:
+        yield terminal_cls
 
 
 class TestTerminalMenu:
@@ -69,151 +147,95 @@ class TestTerminalMenu:
     @pytest.fixture
     def mock_terminal(self):
         """Mock blessed Terminal."""
-        return _make_terminal_double()
+        return _TerminalDouble()
 
     @pytest.fixture
-    def menu(self, mock_terminal):
+    def menu(self, mock_terminal, _patch_blessed):
         """Create TerminalMenu instance for testing."""
-        with patch('cdflow_cli.utils.menu.blessed.Terminal', autospec=True) as terminal_cls:
-            terminal_cls.return_value = mock_terminal
-            return TerminalMenu("Test Menu")
+        _patch_blessed.return_value = mock_terminal
+        return TerminalMenu("Test Menu")
 
-    def test_menu_initialization(self, menu):
+    @pytest.fixture(scope="class")
+    def menu_ro(self, _patch_blessed):
+        """TerminalMenu shared by the whole class, for tests that never mutate it."""
+        _patch_blessed.return_value = _TerminalDouble()
+        return TerminalMenu("Test Menu")
+
+    def test_menu_initialization(self, menu_ro):
         """Test TerminalMenu initializes correctly."""
-        assert menu.title == "Test Menu"
-        assert menu.term is not None
-        assert menu.display_formatter is not None
+        assert menu_ro.title == "Test Menu"
+        assert menu_ro.term is not None
+        assert menu_ro.display_formatter is not None
 
-    def test_menu_initialization_with_formatter(self, mock_terminal):
+    def test_menu_initialization_with_formatter(self, mock_terminal, _patch_blessed):
         """Test TerminalMenu initialization with custom formatter."""
         def custom_formatter(item):
             return f"CUSTOM: {item}"
 
-        with patch('cdflow_cli.utils.menu.blessed.Terminal', autospec=True) as terminal_cls:
-            terminal_cls.return_value = mock_terminal
-            menu = TerminalMenu("Test", custom_formatter)
-            assert menu.display_formatter == custom_formatter
+        _patch_blessed.return_value = mock_terminal
+        menu = TerminalMenu("Test", custom_formatter)
+        assert menu.display_formatter == custom_formatter
 
-    def test_default_formatter_string(self, menu):
+    def test_default_formatter_string(self, menu_ro):
         """Test default formatter with string item."""
-        result = menu._default_formatter("simple_string")
+        result = menu_ro._default_formatter("simple_string")
         assert result == "simple_string"
 
-    def test_default_formatter_path(self, menu):
+    def test_default_formatter_path(self, menu_ro):
         """Test default formatter with path-like string."""
-        result = menu._default_formatter("/path/to/file.txt")
+        result = menu_ro._default_formatter("/path/to/file.txt")
         assert result == "file.txt"
 
-    def test_default_formatter_non_string(self, menu):
+    def test_default_formatter_non_string(self, menu_ro):
         """Test default formatter with non-string item."""
-        result = menu._default_formatter(123)
+        result = menu_ro._default_formatter(123)
         assert result == "123"
 
-    def test_display_menu(self, menu):
+    def test_display_menu(self, menu_ro, print_spy):
         """Test menu display functionality."""
         items = ["Option 1", "Option 2", "Option 3"]
         
-        with patch('builtins.print') as mock_print:
-            menu.display_menu(items, 1)
-            
-            # Verify print calls
-            assert mock_print.call_count >= len(items) + 1  # Items + title
-
-    def test_show_menu_empty_items(self, menu):
-        """Test showing menu with empty items list."""
-        with patch('builtins.print') as mock_print:
-            result = menu.show_menu([])
-            assert result is None
-            mock_print.assert_called_with("No items available to select from.")
-
-    def test_show_menu_enter_selection(self, menu, mock_terminal):
-        """Test menu selection with Enter key."""
-        items = ["Option 1", "Option 2", "Option 3"]
-        
-        # Mock key presses: down, down, enter
-        mock_terminal.inkey.return_value = FakeKey(code="KEY_ENTER")
-        
-        with patch('builtins.print'), \
-             patch.object(menu, 'display_menu'):
-            result = menu.show_menu(items)
-            assert result == "Option 1"  # First item (index 0)
-
-    def test_show_menu_escape_cancel(self, menu, mock_terminal):
-        """Test menu cancellation with Escape key."""
-        items = ["Option 1", "Option 2"]
-        
-        mock_terminal.inkey.return_value = FakeKey(code="KEY_ESCAPE")
-        
-        with patch('builtins.print'), \
-             patch.object(menu, 'display_menu'):
-            result = menu.show_menu(items)
-            assert result is None
-
-    def test_show_menu_q_cancel(self, menu, mock_terminal):
-        """Test menu cancellation with 'q' key."""
-        items = ["Option 1", "Option 2"]
-        
-        mock_terminal.inkey.return_value = FakeKey(text="q")
+        menu_ro.display_menu(items, 1)
         
-        with patch('builtins.print'), \
-             patch.object(menu, 'display_menu'):
-            result = menu.show_menu(items)
-            assert result is None
+        # Verify print calls
+        assert print_spy.call_count >= len(items) + 1  # Items + title
 
-    def test_show_menu_navigation(self, menu, mock_terminal):
-        """Test menu navigation with arrow keys."""
-        items = ["Option 1", "Option 2", "Option 3"]
-        
-        # Simulate: down, down, up, enter
-        key_sequence = []
-        
-        # Down key
-        key_sequence.extend(
-            [
-                FakeKey(code="KEY_DOWN"),
-                FakeKey(code="KEY_DOWN"),
-                FakeKey(code="KEY_UP"),
-                FakeKey(code="KEY_ENTER"),
-            ]
-        )
-        
-        mock_terminal.inkey.side_effect = key_sequence
+    def test_show_menu_empty_items(self, menu, print_spy):
+        """Test showing menu with empty items list."""
+        result = menu.show_menu([])
+        assert result is None
+        assert print_spy.last == (("No items available to select from.",), {})
+
+    @pytest.mark.parametrize("items,keys,expected", [
+        pytest.param(["Option 1", "Option 2", "Option 3"], (K_ENTER,), "Option 1", id="enter"),
+        pytest.param(["Option 1", "Option 2"], (K_ESC,), None, id="escape"),
+        pytest.param(["Option 1", "Option 2"], (K_Q,), None, id="q"),
+        # Down, down, up lands on the second item
+        pytest.param(
+            ["Option 1", "Option 2", "Option 3"],
+            (K_DOWN, K_DOWN, K_UP, K_ENTER),
+            "Option 2",
+            id="navigation",
+        ),
+        # Up from the first item and down past the last item stay in bounds
+        pytest.param(
+            ["Option 1", "Option 2"],
+            (K_UP, K_DOWN, K_DOWN, K_ENTER),
+            "Option 2",
+            id="boundary",
+        ),
+    ])
+    def test_show_menu_keys(self, menu, mock_terminal, print_spy, items, keys, expected):
+        """Test menu selection, cancellation and navigation with key presses."""
+        mock_terminal.inkey.side_effect = keys
         
-        with patch('builtins.print'), \
-             patch.object(menu, 'display_menu') as mock_display:
+        with patch.object(menu, 'display_menu') as mock_display:
             result = menu.show_menu(items)
             
-            # Should select second item (index 1) after navigation
-            assert result == "Option 2"
+            assert result == expected
             
-            # Verify display was called multiple times for navigation
-            assert mock_display.call_count == len(key_sequence)
-
-    def test_show_menu_boundary_navigation(self, menu, mock_terminal):
-        """Test menu navigation at boundaries."""
-        items = ["Option 1", "Option 2"]
-        
-        # Try to go up from first item, then down, then enter
-        key_sequence = []
-        
-        # Up key (should stay at 0)
-        key_sequence.extend(
-            [
-                FakeKey(code="KEY_UP"),
-                FakeKey(code="KEY_DOWN"),
-                FakeKey(code="KEY_DOWN"),
-                FakeKey(code="KEY_ENTER"),
-            ]
-        )
-        
-        mock_terminal.inkey.side_effect = key_sequence
-        
-        with patch('builtins.print'), \
-             patch.object(menu, 'display_menu'):
-            result = menu.show_menu(items)
-            
-            # Should select last item
-            assert result == "Option 2"
+            # Menu is redrawn before every key press
+            assert mock_display.call_count == len(keys)
 
 
 class TestFileSelectionMenu:
@@ -222,48 +244,46 @@ class TestFileSelectionMenu:
     @pytest.fixture
     def mock_terminal(self):
         """Mock blessed Terminal for file menu."""
-        return _make_terminal_double()
-
-    @pytest.fixture
-    def temp_dir_with_files(self):
-        """Create temporary directory with test files."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            
-            # Create test files with different patterns
-            (temp_path / "data_success.csv").write_text("success data")
-            (temp_path / "data_failed.csv").write_text("failed data")
-            (temp_path / "report.txt").write_text("report content")
-            (temp_path / "config.yaml").write_text("config content")
-            
-            # Set different modification times
-            import time
-            import os
-            now = time.time()
-            os.utime(temp_path / "data_success.csv", (now - 100, now - 100))  # Older
-            os.utime(temp_path / "data_failed.csv", (now - 50, now - 50))     # Newer
-            
-            yield temp_path
-
-    @pytest.fixture
-    def file_menu(self, mock_terminal):
-        """Create FileSelectionMenu instance for testing."""
-        with patch('cdflow_cli.utils.menu.blessed.Terminal', autospec=True) as terminal_cls:
-            terminal_cls.return_value = mock_terminal
-            return FileSelectionMenu("Select a file:", "*_success.csv")
+        return _TerminalDouble()
+
+    @pytest.fixture(scope="class")
+    def temp_dir_with_files(self, tmp_path_factory):
+        """Create temporary directory with test files, shared by the whole class."""
+        temp_path = tmp_path_factory.mktemp("menu_files")
+
+        # Create test files with different patterns
+        (temp_path / "data_success.csv").write_text("success data")
+        (temp_path / "data_failed.csv").write_text("failed data")
+        (temp_path / "report.txt").write_text("report content")
+        (temp_path / "config.yaml").write_text("config content")
+
+        return temp_path
+
+    @pytest.fixture(scope="class")
+    def file_menu(self, _patch_blessed):
+        """Create FileSelectionMenu instance shared by the whole class."""
+        _patch_blessed.return_value = _TerminalDouble()
+        return FileSelectionMenu("Select a file:", "*_success.csv")
+
+    @pytest.fixture(autouse=True)
+    def _isolate_file_menu(self, file_menu, mock_terminal):
+        """Give the shared menu this test's terminal and restore its pattern afterwards."""
+        file_pattern = file_menu.file_pattern
+        file_menu.term = mock_terminal
+        yield
+        file_menu.file_pattern = file_pattern
 
     def test_file_menu_initialization(self, file_menu):
         """Test FileSelectionMenu initializes correctly."""
         assert file_menu.title == "Select a file:"
         assert file_menu.file_pattern == "*_success.csv"
 
-    def test_file_menu_default_initialization(self, mock_terminal):
+    def test_file_menu_default_initialization(self, mock_terminal, _patch_blessed):
         """Test FileSelectionMenu with default parameters."""
-        with patch('cdflow_cli.utils.menu.blessed.Terminal', autospec=True) as terminal_cls:
-            terminal_cls.return_value = mock_terminal
-            menu = FileSelectionMenu()
-            assert "Select a file:" in menu.title
-            assert menu.file_pattern == "*"
+        _patch_blessed.return_value = mock_terminal
+        menu = FileSelectionMenu()
+        assert "Select a file:" in menu.title
+        assert menu.file_pattern == "*"
 
     def test_format_file_path(self, file_menu):
         """Test file path formatting for display."""
@@ -276,27 +296,36 @@ class TestFileSelectionMenu:
             result = file_menu.select_file_from_directory(str(temp_dir_with_files))
             assert result == str(temp_dir_with_files / "data_success.csv")
 
-    def test_select_file_from_directory_nonexistent(self, file_menu):
+    def test_select_file_from_directory_nonexistent(self, file_menu, print_spy):
         """Test file selection from non-existent directory."""
-        with patch('builtins.print') as mock_print:
-            result = file_menu.select_file_from_directory("/nonexistent/path")
-            assert result is None
-            mock_print.assert_called()
+        result = file_menu.select_file_from_directory("/nonexistent/path")
+        assert result is None
+        assert print_spy.called
 
-    def test_select_file_from_directory_no_matches(self, file_menu, temp_dir_with_files):
+    def test_select_file_from_directory_no_matches(self, file_menu, temp_dir_with_files, print_spy):
         """Test file selection when no files match pattern."""
         # Use pattern that won't match any files
         file_menu.file_pattern = "*.nonexistent"
         
-        with patch('builtins.print') as mock_print:
-            result = file_menu.select_file_from_directory(str(temp_dir_with_files))
-            assert result is None
-            mock_print.assert_called()
+        result = file_menu.select_file_from_directory(str(temp_dir_with_files))
+        assert result is None
+        assert print_spy.called
 
-    def test_select_file_sorting_by_mtime(self, file_menu, temp_dir_with_files):
+    def test_select_file_sorting_by_mtime(self, file_menu, temp_dir_with_files, monkeypatch):
         """Test that files are sorted by modification time (newest first)."""
         # Change pattern to match both files
         file_menu.file_pattern = "*_*.csv"
+
+        # Report fixed modification times for the CSVs rather than touching the files
+        mtimes = {"data_success.csv": 1, "data_failed.csv": 2}  # Failed file is newer
+        real_stat = Path.stat
+
+        def fake_stat(self, **kwargs):
+            if self.name in mtimes:
+                return SimpleNamespace(st_mtime=mtimes[self.name])
+            return real_stat(self, **kwargs)
+
+        monkeypatch.setattr("pathlib.Path.stat", fake_stat)
         
         with patch.object(file_menu, 'show_menu') as mock_show:
             file_menu.select_file_from_directory(str(temp_dir_with_files))
@@ -310,20 +339,24 @@ class TestFileSelectionMenu:
             assert "data_failed.csv" in files_passed[0]  # Newer file first
             assert "data_success.csv" in files_passed[1]  # Older file second
 
-    def test_select_file_glob_pattern_matching(self, file_menu, temp_dir_with_files):
+    @pytest.mark.parametrize("pattern,expected", [
+        ("*_success.csv", ["data_success.csv"]),  # Default pattern: only success file
+        ("*.csv", ["data_failed.csv", "data_success.csv"]),  # Both CSV files
+        ("*_success.*", ["data_success.csv"]),  # Only success file
+        ("*.txt", ["report.txt"]),  # Only txt file
+        ("*.nonexistent", []),  # No matches
+    ])
+    def test_select_file_glob_pattern_matching(self, temp_dir_with_files, pattern, expected):
         """Test glob pattern matching works correctly."""
-        # Pattern should match only success file
-        result_files = list(temp_dir_with_files.glob(file_menu.file_pattern))
-        assert len(result_files) == 1
-        assert "data_success.csv" in str(result_files[0])
+        result_files = sorted(f.name for f in temp_dir_with_files.glob(pattern))
+        assert result_files == expected
 
-    def test_select_file_from_directory_error_handling(self, file_menu):
+    def test_select_file_from_directory_error_handling(self, file_menu, print_spy):
         """Test error handling during directory scanning."""
-        with patch('pathlib.Path.glob', side_effect=Exception("Scanning error")), \
-             patch('builtins.print') as mock_print:
+        with patch('pathlib.Path.glob', side_effect=Exception("Scanning error")):
             result = file_menu.select_file_from_directory("/some/path")
             assert result is None
-            mock_print.assert_called()
+            assert print_spy.called
 
     def test_file_menu_inheritance(self, file_menu):
         """Test that FileSelectionMenu properly inherits from TerminalMenu."""
@@ -345,54 +378,30 @@ class TestFileSelectionMenu:
         # Complex path
         assert file_menu._format_file_path("/very/long/path/to/file.csv") == "file.csv"
 
-    def test_integration_file_selection_workflow(self, file_menu, temp_dir_with_files, mock_terminal):
+    def test_integration_file_selection_workflow(
+        self, file_menu, temp_dir_with_files, mock_terminal, print_spy
+    ):
         """Test complete file selection workflow."""
         # Mock user selecting first file
-        mock_terminal.inkey.return_value = FakeKey(code="KEY_ENTER")
+        mock_terminal.inkey.return_value = K_ENTER
         
-        with patch('builtins.print'), \
-             patch.object(file_menu, 'display_menu'):
+        with patch.object(file_menu, 'display_menu'):
             result = file_menu.select_file_from_directory(str(temp_dir_with_files))
             
             # Should return the path to the success file
             assert result is not None
             assert "data_success.csv" in result
 
-    def test_empty_directory_handling(self, file_menu):
+    def test_empty_directory_handling(self, file_menu, print_spy, tmp_path):
         """Test handling of empty directory."""
-        with tempfile.TemporaryDirectory() as empty_dir:
-            with patch('builtins.print') as mock_print:
-                result = file_menu.select_file_from_directory(empty_dir)
-                assert result is None
-                mock_print.assert_called()
+        result = file_menu.select_file_from_directory(str(tmp_path))
+        assert result is None
+        assert print_spy.called
 
-    def test_permission_error_handling(self, file_menu, temp_dir_with_files):
+    def test_permission_error_handling(self, file_menu, temp_dir_with_files, print_spy):
         """Test handling of permission errors during file listing."""
-        # Make directory unreadable
-        temp_dir_with_files.chmod(0o000)
-        
-        try:
-            with patch('builtins.print') as mock_print:
-                result = file_menu.select_file_from_directory(str(temp_dir_with_files))
-                assert result is None
-                mock_print.assert_called()
-        finally:
-            # Restore permissions for cleanup
-            temp_dir_with_files.chmod(0o755)
-
-    def test_file_pattern_variations(self, mock_terminal, temp_dir_with_files):
-        """Test different file pattern variations."""
-        patterns_and_expected = [
-            ("*.csv", 2),  # Both CSV files
-            ("*_success.*", 1),  # Only success file
-            ("*.txt", 1),  # Only txt file
-            ("*.nonexistent", 0),  # No matches
-        ]
-        
-        for pattern, expected_count in patterns_and_expected:
-            with patch('cdflow_cli.utils.menu.blessed.Terminal', autospec=True) as terminal_cls:
-                terminal_cls.return_value = mock_terminal
-                menu = FileSelectionMenu("Test", pattern)
-                
-                files = list(temp_dir_with_files.glob(pattern))
-                assert len(files) == expected_count
+        # Raise from the scan directly; chmod does not block reads when running as root
+        with patch('pathlib.Path.glob', side_effect=PermissionError("denied")):
+            result = file_menu.select_file_from_directory(str(temp_dir_with_files))
+            assert result is None
+            assert "denied" in print_spy.last[0][0]
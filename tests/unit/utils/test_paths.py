@@ -1,38 +1,68 @@
 import pytest
-import tempfile
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import Mock, patch
 from cdflow_cli.utils.paths import StoragePaths
 
 
+_DEFAULT_CFG = {
+    'paths': {
+        'jobs': 'jobs',
+        'logs': 'logs',
+        'output': 'output'
+    },
+    'base_path': '/tmp/test_storage'
+}
+
+
+@pytest.fixture(scope="session")
+def thread_pool():
+    """Worker pool shared by the concurrency tests."""
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        yield executor
+
+
+@contextmanager
+def assert_raises_with(exc_type, prefix):
+    """Like pytest.raises(..., match=...) for a literal message prefix, without a regex."""
+    exc_info = SimpleNamespace(value=None)
+    try:
+        yield exc_info
+    except exc_type as err:
+        assert str(err).startswith(prefix), f"{str(err)!r} does not start with {prefix!r}"
+        exc_info.value = err
+    else:
+        pytest.fail(f"DID NOT RAISE {exc_type.__name__}")
+
+
+def _fresh_provider(storage_config):
+    """Create a mock config provider returning the given storage config."""
+    mock_provider = Mock()
+    mock_provider.get_storage_config.return_value = storage_config
+    return mock_provider
+
+
 class TestStoragePaths:
     """Test StoragePaths functionality for file path management."""
     
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def mock_config_provider(self):
-        """Create a mock config provider."""
-        mock_provider = Mock()
-        mock_provider.get_storage_config.return_value = {
-            'paths': {
-                'jobs': 'jobs',
-                'logs': 'logs',
-                'output': 'output'
-            },
-            'base_path': '/tmp/test_storage'
-        }
-        return mock_provider
+        """Create a mock config provider shared by the class; tests must not reconfigure it."""
+        return _fresh_provider(_DEFAULT_CFG)
     
     @pytest.fixture
-    def temp_storage_dir(self):
-        """Create temporary storage directory."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            yield Path(temp_dir)
+    def temp_storage_dir(self, tmp_path):
+        """Create temporary storage directory (a per-test dir under pytest's session root)."""
+        return tmp_path
     
-    def test_storage_paths_init_with_simple_paths(self, mock_config_provider, temp_storage_dir):
+    def test_storage_paths_init_with_simple_paths(self, temp_storage_dir):
         """Test StoragePaths initialization with simple paths configuration."""
-        # Update mock to use temporary directory
-        mock_config_provider.get_storage_config.return_value = {
+        # Provider pointing at the temporary directory
+        mock_config_provider = _fresh_provider({
             'paths': {
                 'jobs': 'jobs',
                 'logs': 'logs',
@@ -40,7 +70,7 @@ class TestStoragePaths:
                 'cli_source': 'cli_source'
             },
             'base_path': str(temp_storage_dir)
-        }
+        })
         
         storage_paths = StoragePaths(mock_config_provider)
         
@@ -51,10 +81,9 @@ class TestStoragePaths:
     
     def test_storage_paths_init_with_default_paths(self):
         """Test StoragePaths initialization with default paths fallback."""
-        mock_provider = Mock()
-        mock_provider.get_storage_config.return_value = {}  # No paths config
+        storage_config = {}  # No paths config
         
-        storage_paths = StoragePaths(mock_provider)
+        storage_paths = StoragePaths(_fresh_provider(storage_config))
         
         # Should initialize with defaults
         assert hasattr(storage_paths, '_paths')
@@ -62,8 +91,7 @@ class TestStoragePaths:
     
     def test_storage_paths_directory_creation(self, temp_storage_dir):
         """Test that required directories are created."""
-        mock_provider = Mock()
-        mock_provider.get_storage_config.return_value = {
+        storage_config = {
             'paths': {
                 'jobs': 'jobs',
                 'logs': 'logs'
@@ -71,7 +99,7 @@ class TestStoragePaths:
             'base_path': str(temp_storage_dir)
         }
         
-        storage_paths = StoragePaths(mock_provider)
+        storage_paths = StoragePaths(_fresh_provider(storage_config))
         
         # Directories should be created
         expected_dirs = [
@@ -106,10 +134,19 @@ class TestStoragePaths:
         assert any("config:" in msg for msg in debug_calls)
         assert any("initialized:" in msg for msg in debug_calls)
     
+    @patch('cdflow_cli.utils.paths.logger')
+    def test_storage_paths_skips_debug_formatting_when_disabled(self, mock_logger, mock_config_provider):
+        """Test that per-path debug messages are not built when debug logging is off."""
+        mock_logger.isEnabledFor.return_value = False
+        
+        StoragePaths(mock_config_provider)
+        
+        debug_calls = [call.args[0] for call in mock_logger.debug.call_args_list]
+        assert not any("config:" in msg or "mapping" in msg or "Ensured" in msg for msg in debug_calls)
+    
     def test_storage_paths_with_base_path_resolution(self, temp_storage_dir):
         """Test path resolution with base_path."""
-        mock_provider = Mock()
-        mock_provider.get_storage_config.return_value = {
+        storage_config = {
             'paths': {
                 'custom_dir': 'custom',
                 'nested_dir': 'nested/deep'
@@ -117,7 +154,7 @@ class TestStoragePaths:
             'base_path': str(temp_storage_dir)
         }
         
-        storage_paths = StoragePaths(mock_provider)
+        storage_paths = StoragePaths(_fresh_provider(storage_config))
         
         # Should create directories relative to base_path
         expected_dirs = [
@@ -131,25 +168,23 @@ class TestStoragePaths:
     
     def test_storage_paths_without_base_path(self):
         """Test StoragePaths when no base_path is provided."""
-        mock_provider = Mock()
-        mock_provider.get_storage_config.return_value = {
+        storage_config = {
             'paths': {
                 'jobs': 'test_jobs'
             }
             # No base_path
         }
         
-        storage_paths = StoragePaths(mock_provider)
+        storage_paths = StoragePaths(_fresh_provider(storage_config))
         
         # Should handle missing base_path gracefully
         assert hasattr(storage_paths, '_paths')
     
     def test_storage_paths_empty_config(self):
         """Test StoragePaths with completely empty configuration."""
-        mock_provider = Mock()
-        mock_provider.get_storage_config.return_value = {}
+        storage_config = {}
         
-        storage_paths = StoragePaths(mock_provider)
+        storage_paths = StoragePaths(_fresh_provider(storage_config))
         
         # Should initialize with empty paths dict
         assert hasattr(storage_paths, '_paths')
@@ -181,7 +216,8 @@ class TestStoragePaths:
         # Should have paths configured (directories created by _create_directories)
         assert hasattr(storage_paths, '_paths')
         # Verify at least some directories were created
-        created_dirs = [p for p in temp_storage_dir.iterdir() if p.is_dir()]
+        with os.scandir(temp_storage_dir) as entries:
+            created_dirs = [entry.name for entry in entries if entry.is_dir(follow_symlinks=False)]
         assert len(created_dirs) >= 3  # At least some directories should exist
     
     def test_storage_paths_permission_handling(self, temp_storage_dir):
@@ -285,41 +321,90 @@ class TestStoragePaths:
         assert hasattr(storage_paths, '_paths')
         # Directory creation depends on implementation
     
-    def test_storage_paths_concurrent_access_safety(self, temp_storage_dir):
-        """Test thread safety of StoragePaths initialization."""
-        import threading
-        import time
+    def test_storage_paths_shared_ancestors_created_once(self, temp_storage_dir):
+        """Test that a base directory shared by every path is only created once."""
+        base = temp_storage_dir / 'nested' / 'base'
+        storage_config = {
+            'paths': {'jobs': 'jobs', 'logs': 'logs', 'output': 'output'},
+            'base_path': str(base)
+        }
         
-        mock_provider = Mock()
-        mock_provider.get_storage_config.return_value = {
-            'paths': {'concurrent': 'concurrent_dir'},
+        with patch('cdflow_cli.utils.paths.os.mkdir', wraps=os.mkdir) as mock_mkdir:
+            storage_paths = StoragePaths(_fresh_provider(storage_config))
+        
+        created = [call.args[0] for call in mock_mkdir.call_args_list]
+        # Parents are made while creating 'jobs'; later paths never revisit them
+        jobs_created = created.index(str(base / 'jobs'), 1)
+        assert str(base) not in created[jobs_created:]
+        assert str(base.parent) not in created[jobs_created:]
+        for file_type, path in storage_paths.get_all_paths().items():
+            assert path.is_dir(), file_type
+    
+    def test_storage_paths_shallow_directories_created_first(self, temp_storage_dir):
+        """Test that a configured parent is created before its nested siblings."""
+        storage_config = {
+            'paths': {'jobs': 'shared/deep/leaf', 'logs': 'shared'},
             'base_path': str(temp_storage_dir)
         }
         
-        results = []
-        errors = []
+        with patch('cdflow_cli.utils.paths.os.mkdir', wraps=os.mkdir) as mock_mkdir:
+            storage_paths = StoragePaths(_fresh_provider(storage_config))
         
-        def create_storage_paths():
-            try:
-                storage_paths = StoragePaths(mock_provider)
-                results.append(storage_paths)
-                time.sleep(0.01)  # Small delay to encourage race conditions
-            except Exception as e:
-                errors.append(str(e))
+        created = [call.args[0] for call in mock_mkdir.call_args_list]
+        assert created[0] == str(temp_storage_dir / 'shared')
+        assert created.count(str(temp_storage_dir / 'shared')) == 1
+        assert storage_paths.jobs.is_dir()
+    
+    def test_storage_paths_repeat_config_recreates_removed_directory(self, temp_storage_dir):
+        """Test that a repeated configuration recreates a directory removed in between."""
+        config = {'paths': {'jobs': 'repeat_jobs'}, 'base_path': str(temp_storage_dir)}
+        StoragePaths(_fresh_provider(config))
+        (temp_storage_dir / 'repeat_jobs').rmdir()
         
-        # Create multiple threads
-        threads = [threading.Thread(target=create_storage_paths) for _ in range(5)]
+        storage_paths = StoragePaths(_fresh_provider(config))
         
-        # Start all threads
-        for thread in threads:
-            thread.start()
+        assert storage_paths.jobs.is_dir()
+    
+    def test_storage_paths_relative_base_follows_cwd(self, tmp_path, monkeypatch):
+        """Test that a relative base_path is created under each working directory."""
+        config = {'paths': {'jobs': 'jobs'}, 'base_path': './storage_rel'}
+        for cwd in (tmp_path / 'first', tmp_path / 'second'):
+            cwd.mkdir()
+            monkeypatch.chdir(cwd)
+            StoragePaths(_fresh_provider(config))
+            
+            assert (cwd / 'storage_rel' / 'jobs').is_dir()
+    
+    def test_make_dirs_rejects_existing_file(self, temp_storage_dir):
+        """Test that a file in the way of a directory is still reported."""
+        from cdflow_cli.utils.paths import _make_dirs
+        
+        blocking_file = temp_storage_dir / 'blocked'
+        blocking_file.write_text("not a directory")
+        
+        with pytest.raises(FileExistsError):
+            _make_dirs(str(blocking_file), set())
+    
+    def test_storage_paths_concurrent_access_safety(self, temp_storage_dir, thread_pool):
+        """Test thread safety of StoragePaths initialization."""
+        storage_config = {
+            'paths': {'concurrent': 'concurrent_dir'},
+            'base_path': str(temp_storage_dir)
+        }
+        
+        # Release all workers together so the initializations actually overlap
+        start = threading.Barrier(5, timeout=5)
         
-        # Wait for completion
-        for thread in threads:
-            thread.join()
+        def create_storage_paths():
+            start.wait()
+            return StoragePaths(_fresh_provider(storage_config))
+        
+        futures = [thread_pool.submit(create_storage_paths) for _ in range(5)]
         
         # Should not have errors
+        errors = [str(future.exception()) for future in futures if future.exception() is not None]
         assert len(errors) == 0, f"Concurrent access errors: {errors}"
+        results = [future.result() for future in futures]
         assert len(results) == 5, "All threads should complete successfully"
         
         # Verify all results are valid StoragePaths instances
@@ -331,10 +416,9 @@ class TestStoragePathsErrorRecovery:
     """Test error recovery and resilience in StoragePaths."""
     
     @pytest.fixture
-    def temp_storage_dir(self):
-        """Create temporary storage directory."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            yield Path(temp_dir)
+    def temp_storage_dir(self, tmp_path):
+        """Create temporary storage directory (a per-test dir under pytest's session root)."""
+        return tmp_path
     
     def test_config_provider_exception_recovery(self, caplog):
         """Test recovery when config provider raises exceptions."""
@@ -353,8 +437,7 @@ class TestStoragePathsErrorRecovery:
         blocking_file = temp_storage_dir / 'blocked_dir'
         blocking_file.write_text("This file blocks directory creation")
         
-        mock_provider = Mock()
-        mock_provider.get_storage_config.return_value = {
+        storage_config = {
             'paths': {
                 'good_dir': 'good_directory',
                 'blocked_dir': 'blocked_dir'  # This will conflict with existing file
@@ -363,7 +446,7 @@ class TestStoragePathsErrorRecovery:
         }
         
         # Should handle partial failure gracefully
-        storage_paths = StoragePaths(mock_provider)
+        storage_paths = StoragePaths(_fresh_provider(storage_config))
         
         # Should have initialized despite partial failure
         assert hasattr(storage_paths, '_paths')
@@ -425,15 +508,13 @@ class TestStoragePathsIntegration:
     """Integration tests for StoragePaths with realistic scenarios."""
     
     @pytest.fixture
-    def temp_storage_dir(self):
-        """Create temporary storage directory."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            yield Path(temp_dir)
+    def temp_storage_dir(self, tmp_path):
+        """Create temporary storage directory (a per-test dir under pytest's session root)."""
+        return tmp_path
     
     def test_realistic_dflow_paths_config(self, temp_storage_dir):
         """Test with realistic DFlow CLI paths configuration."""
-        mock_provider = Mock()
-        mock_provider.get_storage_config.return_value = {
+        storage_config = {
             'paths': {
                 'jobs': 'jobs',
                 'logs': 'logs',
@@ -446,7 +527,7 @@ class TestStoragePathsIntegration:
             'base_path': str(temp_storage_dir)
         }
         
-        storage_paths = StoragePaths(mock_provider)
+        storage_paths = StoragePaths(_fresh_provider(storage_config))
         
         # Should initialize successfully
         assert hasattr(storage_paths, '_paths')
@@ -459,8 +540,7 @@ class TestStoragePathsIntegration:
         for dir_name in existing_dirs:
             (temp_storage_dir / dir_name).mkdir()
         
-        mock_provider = Mock()
-        mock_provider.get_storage_config.return_value = {
+        storage_config = {
             'paths': {
                 'logs': 'existing_logs',  # Already exists
                 'jobs': 'existing_jobs',  # Already exists
@@ -469,7 +549,7 @@ class TestStoragePathsIntegration:
             'base_path': str(temp_storage_dir)
         }
         
-        storage_paths = StoragePaths(mock_provider)
+        storage_paths = StoragePaths(_fresh_provider(storage_config))
         
         # Should initialize successfully
         assert hasattr(storage_paths, '_paths')
@@ -514,13 +594,12 @@ class TestStoragePathsIntegration:
             'HOME': str(temp_storage_dir),
             'TEMP': str(temp_storage_dir)
         }):
-            mock_provider = Mock()
-            mock_provider.get_storage_config.return_value = {
+            storage_config = {
                 'paths': {'temp': 'temp_dir'},
                 'base_path': str(temp_storage_dir)
             }
             
-            storage_paths = StoragePaths(mock_provider)
+            storage_paths = StoragePaths(_fresh_provider(storage_config))
             
             # Should initialize successfully regardless of environment
             assert hasattr(storage_paths, '_paths')
@@ -530,16 +609,14 @@ class TestStoragePathsPropertyAccessors:
     """Test StoragePaths property accessor methods."""
     
     @pytest.fixture
-    def temp_storage_dir(self):
-        """Create temporary storage directory."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            yield Path(temp_dir)
+    def temp_storage_dir(self, tmp_path):
+        """Create temporary storage directory (a per-test dir under pytest's session root)."""
+        return tmp_path
     
     @pytest.fixture
     def configured_storage_paths(self, temp_storage_dir):
         """Create configured StoragePaths instance."""
-        mock_provider = Mock()
-        mock_provider.get_storage_config.return_value = {
+        storage_config = {
             'paths': {
                 'jobs': 'test_jobs',
                 'logs': 'test_logs', 
@@ -550,7 +627,7 @@ class TestStoragePathsPropertyAccessors:
             },
             'base_path': str(temp_storage_dir)
         }
-        return StoragePaths(mock_provider)
+        return StoragePaths(_fresh_provider(storage_config))
     
     def test_jobs_property(self, configured_storage_paths, temp_storage_dir):
         """Test jobs property accessor."""
@@ -588,6 +665,28 @@ class TestStoragePathsPropertyAccessors:
         assert isinstance(app_processing_path, Path)
         assert app_processing_path == temp_storage_dir / 'test_app_processing'
     
+    def test_path_objects_built_once(self, configured_storage_paths):
+        """Test that accessors share one cached Path per file type."""
+        assert isinstance(configured_storage_paths._paths['jobs'], str)
+        
+        jobs_path = configured_storage_paths.jobs
+        assert configured_storage_paths.get_path('jobs') is jobs_path
+        assert configured_storage_paths.get_all_paths()['jobs'] is jobs_path
+    
+    def test_storage_paths_has_no_instance_dict(self, configured_storage_paths):
+        """Test that StoragePaths uses slots instead of a per-instance dict."""
+        assert not hasattr(configured_storage_paths, '__dict__')
+        with pytest.raises(AttributeError):
+            configured_storage_paths.unexpected = True
+    
+    def test_path_strings_shared_between_instances(self, configured_storage_paths):
+        """Test that instances built from the same config share path strings."""
+        other = StoragePaths(_fresh_provider({
+            'paths': {file_type: path for file_type, path in configured_storage_paths._paths.items()}
+        }))
+        
+        for file_type, path in configured_storage_paths._paths.items():
+            assert other._paths[file_type] is path
     
     def test_get_path_method(self, configured_storage_paths, temp_storage_dir):
         """Test get_path method for dynamic access."""
@@ -600,8 +699,11 @@ class TestStoragePathsPropertyAccessors:
     
     def test_get_path_invalid_type(self, configured_storage_paths):
         """Test get_path method with invalid file type."""
-        with pytest.raises(ValueError, match="Unknown file type"):
+        with assert_raises_with(ValueError, "Unknown file type") as exc_info:
             configured_storage_paths.get_path('nonexistent_type')
+
+        assert "'jobs'" in str(exc_info.value)
+        assert exc_info.value.__suppress_context__
     
     def test_get_all_paths_method(self, configured_storage_paths, temp_storage_dir):
         """Test get_all_paths method."""
@@ -616,6 +718,7 @@ class TestStoragePathsPropertyAccessors:
         # Should be a copy, not the original
         all_paths['new_key'] = 'test'
         assert 'new_key' not in configured_storage_paths._paths
+        assert 'new_key' not in configured_storage_paths.get_all_paths()
     
     def test_str_representation(self, configured_storage_paths):
         """Test __str__ method."""
@@ -624,26 +727,27 @@ class TestStoragePathsPropertyAccessors:
         assert 'StoragePaths(' in str_repr
         assert 'jobs=' in str_repr
         assert 'logs=' in str_repr
+        
+        # Built once and reused
+        assert str(configured_storage_paths) is str_repr
 
 
 class TestStoragePathsUtilityFunctions:
     """Test utility functions in paths module."""
     
     @pytest.fixture
-    def temp_storage_dir(self):
-        """Create temporary storage directory."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            yield Path(temp_dir)
+    def temp_storage_dir(self, tmp_path):
+        """Create temporary storage directory (a per-test dir under pytest's session root)."""
+        return tmp_path
     
     def test_initialize_paths_function(self, temp_storage_dir):
         """Test initialize_paths global function."""
         from cdflow_cli.utils.paths import initialize_paths, get_paths, is_initialized
         
-        mock_provider = Mock()
-        mock_provider.get_storage_config.return_value = {
+        mock_provider = _fresh_provider({
             'paths': {'jobs': 'test_jobs'},
             'base_path': str(temp_storage_dir)
-        }
+        })
         
         # Initialize paths
         result = initialize_paths(mock_provider)
@@ -664,7 +768,7 @@ class TestStoragePathsUtilityFunctions:
         import cdflow_cli.utils.paths as paths_module
         paths_module._PATHS = None
         
-        with pytest.raises(RuntimeError, match="Storage paths not initialized"):
+        with assert_raises_with(RuntimeError, "Storage paths not initialized"):
             get_paths()
     
     def test_is_initialized_function(self, temp_storage_dir):
@@ -677,11 +781,10 @@ class TestStoragePathsUtilityFunctions:
         assert is_initialized() is False
         
         # Initialize
-        mock_provider = Mock()
-        mock_provider.get_storage_config.return_value = {
+        mock_provider = _fresh_provider({
             'paths': {'jobs': 'test_jobs'},
             'base_path': str(temp_storage_dir)
-        }
+        })
         initialize_paths(mock_provider)
         
         assert is_initialized() is True
@@ -728,6 +831,25 @@ class TestStoragePathsUtilityFunctions:
         content = safe_read_text(nonexistent)
         assert content == ''
     
+    def test_safe_read_text_translates_newlines(self, temp_storage_dir):
+        """Test safe_read_text returns universal newlines like Path.read_text."""
+        from cdflow_cli.utils.paths import safe_read_text
+
+        test_file = temp_storage_dir / 'crlf.txt'
+        test_file.write_bytes(b'a,b\r\n1,2\r3\n')
+
+        assert safe_read_text(test_file) == test_file.read_text(encoding='utf-8')
+
+    def test_safe_write_text_keeps_file_on_encoding_error(self, temp_storage_dir):
+        """Test safe_write_text leaves an existing file alone if content can't be encoded."""
+        from cdflow_cli.utils.paths import safe_write_text
+
+        test_file = temp_storage_dir / 'keep.txt'
+        test_file.write_text('original', encoding='utf-8')
+
+        assert safe_write_text(test_file, 'caf\u00e9', encoding='ascii') is False
+        assert test_file.read_text(encoding='utf-8') == 'original'
+
     def test_safe_write_text_utility(self, temp_storage_dir):
         """Test safe_write_text utility function."""
         from cdflow_cli.utils.paths import safe_write_text
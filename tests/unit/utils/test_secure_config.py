@@ -1,5 +1,8 @@
 import pytest
+import logging
 import os
+import psutil
+import runpy
 import sys
 from unittest.mock import patch, Mock
 from cdflow_cli.utils.secure_config import (
@@ -24,6 +27,11 @@ class TestSecureConfigValidator:
         assert "example-" in patterns
         assert "placeholder-" in patterns
         assert "change-this" in patterns
+        
+        placeholder_re = SecureConfigValidator._PLACEHOLDER_RE
+        assert placeholder_re.search("Your-Nation-Slug")
+        assert placeholder_re.search("secret-CHANGE-THIS")
+        assert not placeholder_re.search("valid_client_id_12345")
     
     def test_validate_environment_with_valid_credentials(self):
         """Test environment validation with valid OAuth credentials."""
@@ -59,17 +67,36 @@ class TestSecureConfigValidator:
             assert "NB_CLIENT_ID" in caplog.text
             assert "NB_CLIENT_SECRET" in caplog.text
     
-    def test_validate_environment_placeholder_detection(self, caplog):
-        """Test that placeholder values are detected and rejected."""
-        with patch.dict('os.environ', {
-            'NB_SLUG': 'your-nation-slug',  # Contains placeholder pattern
-            'NB_CLIENT_ID': 'example-client-id',  # Contains placeholder pattern
-            'NB_CLIENT_SECRET': 'change-this-secret-value'  # Contains placeholder pattern
-        }, clear=True):
+    @pytest.mark.parametrize("env,expected,expected_log", [
+        pytest.param({
+            'NB_SLUG': 'your-nation-slug',
+            'NB_CLIENT_ID': 'example-client-id',
+            'NB_CLIENT_SECRET': 'change-this-secret-value'
+        }, False, "placeholder values", id="placeholder_detection"),
+        pytest.param({
+            'NB_SLUG': 'YOUR-NATION-SLUG',
+            'NB_CLIENT_ID': 'Example-Client-ID',
+            'NB_CLIENT_SECRET': 'CHANGE-THIS-SECRET'
+        }, False, "placeholder values", id="placeholder_case_insensitive"),
+        pytest.param({
+            'NB_SLUG': '',
+            'NB_CLIENT_ID': 'valid_id',
+            'NB_CLIENT_SECRET': 'valid_secret_12345678'
+        }, False, "Missing required environment variables", id="empty_string_is_missing"),
+        pytest.param({
+            'NB_SLUG': '   ',
+            'NB_CLIENT_ID': 'valid_id',
+            'NB_CLIENT_SECRET': 'valid_secret_12345678'
+        }, True, None, id="whitespace_not_stripped"),
+    ])
+    def test_validate_environment_values(self, env, expected, expected_log, caplog):
+        """Test validation of placeholder and edge case values."""
+        with patch.dict('os.environ', env, clear=True):
             result = SecureConfigValidator.validate_environment()
-            
-            assert result is False
-            assert "placeholder values" in caplog.text
+        
+        assert result is expected
+        if expected_log:
+            assert expected_log in caplog.text
     
     def test_validate_environment_short_secret_warning(self, caplog):
         """Test warning for short client secrets."""
@@ -119,40 +146,6 @@ class TestSecureConfigValidator:
         with patch.dict('os.environ', {}, clear=True):
             with pytest.raises(ValueError, match="OAuth configuration validation failed"):
                 SecureConfigValidator.get_oauth_config()
-    
-    def test_placeholder_pattern_case_insensitive(self, caplog):
-        """Test that placeholder detection is case-insensitive."""
-        with patch.dict('os.environ', {
-            'NB_SLUG': 'YOUR-NATION-SLUG',  # Uppercase placeholder pattern
-            'NB_CLIENT_ID': 'Example-Client-ID',  # Mixed case placeholder
-            'NB_CLIENT_SECRET': 'CHANGE-THIS-SECRET'  # Uppercase placeholder
-        }, clear=True):
-            result = SecureConfigValidator.validate_environment()
-            
-            assert result is False
-            assert "placeholder values" in caplog.text
-    
-    def test_validate_environment_edge_cases(self):
-        """Test validation with edge case values."""
-        # Test with empty strings
-        with patch.dict('os.environ', {
-            'NB_SLUG': '',
-            'NB_CLIENT_ID': 'valid_id',
-            'NB_CLIENT_SECRET': 'valid_secret_12345678'
-        }, clear=True):
-            result = SecureConfigValidator.validate_environment()
-            assert result is False  # Empty string should be treated as missing
-        
-        # Test with whitespace-only values
-        with patch.dict('os.environ', {
-            'NB_SLUG': '   ',
-            'NB_CLIENT_ID': 'valid_id',
-            'NB_CLIENT_SECRET': 'valid_secret_12345678'
-        }, clear=True):
-            # Note: Current implementation doesn't strip whitespace,
-            # so this might pass - depends on implementation details
-            result = SecureConfigValidator.validate_environment()
-            # Test passes or fails depending on whitespace handling
 
 
 class TestSecretManager:
@@ -193,13 +186,18 @@ class TestSecretManager:
 class TestSecureStartupCheck:
     """Test secure startup validation functionality."""
     
-    @patch('psutil.Process')
-    def test_secure_startup_check_success(self, mock_process):
+    @pytest.fixture(scope="class", autouse=True)
+    def mock_proc(self):
+        """Patch psutil.Process once for the class; tests set the command line they need."""
+        # spec_set makes any call outside psutil.Process's API fail loudly
+        process = Mock(spec_set=psutil.Process)
+        with patch('psutil.Process', return_value=process):
+            yield process
+    
+    def test_secure_startup_check_success(self, mock_proc):
         """Test successful security startup check."""
         # Mock process command line
-        mock_proc = Mock()
         mock_proc.cmdline.return_value = ['python', 'app.py', '--config', 'config.yaml']
-        mock_process.return_value = mock_proc
         
         with patch.dict('os.environ', {
             'NB_SLUG': 'startup-test-nation',
@@ -212,15 +210,12 @@ class TestSecureStartupCheck:
             except SystemExit:
                 pytest.fail("secure_startup_check should not call sys.exit() with valid config")
     
-    @patch('psutil.Process')
-    def test_secure_startup_check_command_line_exposure(self, mock_process, caplog):
+    def test_secure_startup_check_command_line_exposure(self, mock_proc, caplog):
         """Test detection of secrets in command line."""
         # Mock process with sensitive information in command line
-        mock_proc = Mock()
         mock_proc.cmdline.return_value = [
             'python', 'app.py', '--client_secret', 'exposed_secret'
         ]
-        mock_process.return_value = mock_proc
         
         with patch.dict('os.environ', {
             'NB_SLUG': 'startup-test-nation',
@@ -232,14 +227,11 @@ class TestSecureStartupCheck:
             assert "Potential secret exposure in command line" in caplog.text
             assert "client_secret" in caplog.text
     
-    @patch('psutil.Process')
     @patch('sys.exit')
-    def test_secure_startup_check_validation_failure(self, mock_exit, mock_process):
+    def test_secure_startup_check_validation_failure(self, mock_exit, mock_proc):
         """Test startup check exits on validation failure."""
         # Mock process
-        mock_proc = Mock()
         mock_proc.cmdline.return_value = ['python', 'app.py']
-        mock_process.return_value = mock_proc
         
         # Invalid environment (missing credentials)
         with patch.dict('os.environ', {}, clear=True):
@@ -248,17 +240,14 @@ class TestSecureStartupCheck:
             # Should call sys.exit(1) on validation failure
             mock_exit.assert_called_once_with(1)
     
-    @patch('psutil.Process')
-    def test_secure_startup_check_multiple_sensitive_patterns(self, mock_process, caplog):
+    def test_secure_startup_check_multiple_sensitive_patterns(self, mock_proc, caplog):
         """Test detection of multiple sensitive patterns in command line."""
         # Mock process with multiple sensitive patterns
-        mock_proc = Mock()
         mock_proc.cmdline.return_value = [
             'python', 'app.py', 
             '--password', 'secret_pass',
             '--token', 'auth_token_123'
         ]
-        mock_process.return_value = mock_proc
         
         with patch.dict('os.environ', {
             'NB_SLUG': 'startup-test-nation',
@@ -272,15 +261,12 @@ class TestSecureStartupCheck:
             assert "password" in log_text
             assert "token" in log_text
     
-    @patch('psutil.Process')
-    def test_secure_startup_check_case_insensitive_pattern_detection(self, mock_process, caplog):
+    def test_secure_startup_check_case_insensitive_pattern_detection(self, mock_proc, caplog):
         """Test that sensitive pattern detection is case-insensitive."""
         # Mock process with uppercase sensitive pattern
-        mock_proc = Mock()
         mock_proc.cmdline.return_value = [
             'python', 'app.py', '--CLIENT_SECRET', 'exposed'
         ]
-        mock_process.return_value = mock_proc
         
         with patch.dict('os.environ', {
             'NB_SLUG': 'startup-test-nation',
@@ -318,46 +304,43 @@ class TestSecureConfigIntegration:
             manager_config = manager.get_oauth_config()
             assert manager_config == config
     
-    def test_security_hardening_scenarios(self):
-        """Test various security hardening scenarios."""
-        # Test with potentially malicious values
-        malicious_configs = [
-            {
-                'NB_SLUG': '../../../etc/passwd',
-                'NB_CLIENT_ID': 'valid_client_id_12345',
-                'NB_CLIENT_SECRET': 'valid_secret_sufficient_length'
-            },
-            {
-                'NB_SLUG': 'normal-slug',
-                'NB_CLIENT_ID': '; rm -rf /',
-                'NB_CLIENT_SECRET': 'valid_secret_sufficient_length'
-            },
-            {
-                'NB_SLUG': 'normal-slug',
-                'NB_CLIENT_ID': 'valid_client_id_12345',
-                'NB_CLIENT_SECRET': '<script>alert("xss")</script>'
-            }
-        ]
-        
-        for malicious_config in malicious_configs:
-            with patch.dict('os.environ', malicious_config, clear=True):
-                # Should not crash, should return configuration
-                # Security is handled by consuming code, not validator
-                try:
-                    result = SecureConfigValidator.validate_environment()
-                    # Should complete without exceptions
-                    assert isinstance(result, bool)
+    @pytest.mark.parametrize("malicious_config", [
+        pytest.param({
+            'NB_SLUG': '../../../etc/passwd',
+            'NB_CLIENT_ID': 'valid_client_id_12345',
+            'NB_CLIENT_SECRET': 'valid_secret_sufficient_length'
+        }, id="path_traversal_slug"),
+        pytest.param({
+            'NB_SLUG': 'normal-slug',
+            'NB_CLIENT_ID': '; rm -rf /',
+            'NB_CLIENT_SECRET': 'valid_secret_sufficient_length'
+        }, id="shell_injection_client_id"),
+        pytest.param({
+            'NB_SLUG': 'normal-slug',
+            'NB_CLIENT_ID': 'valid_client_id_12345',
+            'NB_CLIENT_SECRET': '<script>alert("xss")</script>'
+        }, id="script_client_secret"),
+    ])
+    def test_security_hardening_scenarios(self, malicious_config):
+        """Test various security hardening scenarios with potentially malicious values."""
+        with patch.dict('os.environ', malicious_config, clear=True):
+            # Should not crash, should return configuration
+            # Security is handled by consuming code, not validator
+            try:
+                result = SecureConfigValidator.validate_environment()
+                # Should complete without exceptions
+                assert isinstance(result, bool)
+                
+                if result:
+                    config = SecureConfigValidator.get_oauth_config()
+                    assert isinstance(config, dict)
+                    assert 'slug' in config
+                    assert 'client_id' in config
+                    assert 'client_secret' in config
                     
-                    if result:
-                        config = SecureConfigValidator.get_oauth_config()
-                        assert isinstance(config, dict)
-                        assert 'slug' in config
-                        assert 'client_id' in config
-                        assert 'client_secret' in config
-                        
-                except Exception as e:
-                    # If it fails, should fail gracefully
-                    assert isinstance(e, (ValueError, RuntimeError))
+            except Exception as e:
+                # If it fails, should fail gracefully
+                assert isinstance(e, (ValueError, RuntimeError))
     
     def test_error_resilience(self):
         """Test that secure config handles various error conditions gracefully."""
@@ -384,11 +367,19 @@ class TestSecureConfigIntegration:
 class TestSecureConfigMainBlock:
     """Test the __main__ block functionality."""
     
-    def test_main_block_execution(self, capfd):
+    MODULE = 'cdflow_cli.utils.secure_config'
+    
+    @pytest.fixture
+    def run_main(self, monkeypatch):
+        """Run the module's __main__ block in this interpreter."""
+        # Run from source rather than the imported module, and keep the
+        # script's basicConfig from adding handlers to the root logger
+        monkeypatch.delitem(sys.modules, self.MODULE, raising=False)
+        monkeypatch.setattr(logging, 'basicConfig', lambda **kwargs: None)
+        return lambda: runpy.run_module(self.MODULE, run_name='__main__')
+    
+    def test_main_block_execution(self, run_main, capsys):
         """Test the main block when run as script."""
-        import subprocess
-        import sys
-        
         # Run the module as a script with valid environment
         env = {
             'NB_SLUG': 'test-main-nation',
@@ -397,26 +388,20 @@ class TestSecureConfigMainBlock:
             'NB_REDIRECT_URI': 'http://localhost:8000/callback'
         }
         
-        result = subprocess.run([
-            sys.executable, '-m', 'cdflow_cli.utils.secure_config'
-        ], env={**os.environ, **env}, capture_output=True, text=True)
+        with patch.dict(os.environ, env, clear=False):
+            run_main()
         
         # Should complete successfully
-        assert result.returncode == 0
-        assert "OAuth configuration valid" in result.stdout
-        assert "test-main-nation" in result.stdout
+        out = capsys.readouterr().out
+        assert "OAuth configuration valid" in out
+        assert "test-main-nation" in out
     
-    def test_main_block_with_invalid_config(self):
+    def test_main_block_with_invalid_config(self, run_main, caplog):
         """Test main block with invalid configuration."""
-        import subprocess
-        import sys
-        
         # Run with no environment variables
-        result = subprocess.run([
-            sys.executable, '-m', 'cdflow_cli.utils.secure_config'
-        ], env={}, capture_output=True, text=True)
+        with patch.dict(os.environ, {}, clear=True), pytest.raises(SystemExit) as exc:
+            run_main()
         
         # Should exit with error
-        assert result.returncode == 1
-        # Error message goes to stderr, not stdout
-        assert "OAuth configuration error" in result.stderr or "Security validation failed" in result.stderr
\ No newline at end of file
+        assert exc.value.code == 1
+        assert "Security validation failed" in caplog.text